@@ -0,0 +1,235 @@
+"""
+Benchmarks de la simulation des épreuves
+Mesure le coût par joueur de GameService.simulate_event selon la taille de la partie
+et le nombre de groupes (le coût par joueur doit rester plat),
+ainsi que l'attribution groupée des kills les requêtes sur le roster, les tables de bonus
+la génération groupée des joueurs et la construction sans validation des modèles générés
+"""
+import sys
+import os
+import time
+import random
+import statistics
+
+# Ajouter le répertoire parent au path pour pouvoir importer les modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models.game_models import Player, PlayerGroup, PlayerPortrait, PlayerUniform, EventType, TrustedModel
+from services.game_service import GameService
+from services.events_service import EventsService
+from services.kill_allocator import KillAllocator
+from services.player_roster import PlayerRoster, ROLE_CODES
+
+
+def build_players(count: int):
+    """Construit des joueurs sans passer par la génération de portraits (hors du périmètre mesuré)"""
+    roles = list(GameService.ROLE_PROBABILITIES.keys())
+    weights = list(GameService.ROLE_PROBABILITIES.values())
+    portrait = PlayerPortrait(
+        face_shape="Ovale", skin_color="#FDF2E9", hairstyle="Bob",
+        hair_color="#2C1B18", eye_color="#000000", eye_shape="Amande"
+    )
+    uniform = PlayerUniform(style="Classic", color="Rouge", pattern="Uni")
+    players = []
+    for i in range(1, count + 1):
+        role = random.choices(roles, weights)[0]
+        players.append(Player(
+            number=str(i).zfill(3),
+            name=f"Joueur {i}",
+            nationality="Français",
+            gender=random.choice(['M', 'F']),
+            role=role,
+            stats=GameService._generate_stats_by_role(role),
+            portrait=portrait,
+            uniform=uniform
+        ))
+    return players
+
+
+def assign_groups(players, group_count: int):
+    """Répartit les joueurs dans group_count groupes (tous les joueurs sont groupés)"""
+    groups = {}
+    if group_count <= 0:
+        return groups
+    for i, player in enumerate(players):
+        group_id = f"bench_group_{i % group_count}"
+        player.group_id = group_id
+        if group_id not in groups:
+            groups[group_id] = PlayerGroup(id=group_id, name=group_id, member_ids=[])
+        groups[group_id].member_ids.append(player.id)
+    return groups
+
+
+def time_event(players, event, groups, engine: str, repeats: int) -> float:
+    """Retourne la médiane (en secondes) de simulate_event sur des copies fraîches du roster"""
+    timings = []
+    for _ in range(repeats):
+        roster = [p.model_copy(deep=True) for p in players]
+        start = time.perf_counter()
+        GameService.simulate_event(roster, event, groups, engine=engine)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def benchmark_group_census(player_count: int = 1000, repeats: int = 5):
+    """Coût par joueur en fonction du nombre de groupes (recensement des groupes en O(n))"""
+    event = next(e for e in EventsService.GAME_EVENTS if e.type == EventType.AGILITÉ and not e.is_final)
+    print(f"\n📊 Recensement des groupes - {player_count} joueurs, épreuve '{event.name}'")
+    print(f"{'groupes':>8} | {'classic µs/joueur':>18} | {'vectorized µs/joueur':>21}")
+    print("-" * 54)
+
+    for group_count in [0, 5, 10, 20, 50, 100, 200]:
+        players = build_players(player_count)
+        groups = assign_groups(players, group_count)
+        per_player = {
+            engine: time_event(players, event, groups, engine, repeats) / player_count * 1e6
+            for engine in GameService.SIMULATION_ENGINES
+        }
+        print(f"{group_count:>8} | {per_player['classic']:>18.2f} | {per_player['vectorized']:>21.2f}")
+
+
+def benchmark_kill_allocation(repeats: int = 5):
+    """Coût de l'attribution des kills pour des éliminations massives (doit rester quasi linéaire)"""
+    print("\n📊 Attribution des kills - survivants / éliminés")
+    print(f"{'joueurs':>8} | {'survivants':>10} | {'éliminés':>9} | {'ms':>8} | {'µs/élimination':>15}")
+    print("-" * 62)
+
+    for player_count in [1000, 2000, 5000, 10000]:
+        survivor_count = player_count * 3 // 10
+        eliminated_count = player_count - survivor_count
+        survivor_groups = [i % 20 if i % 3 else None for i in range(survivor_count)]
+        victim_groups = [i % 20 if i % 3 else None for i in range(eliminated_count)]
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            allocator = KillAllocator(survivor_groups, max_kills_per_event=2)
+            allocator.allocate(victim_groups)
+            timings.append(time.perf_counter() - start)
+        elapsed = statistics.median(timings)
+        print(f"{player_count:>8} | {survivor_count:>10} | {eliminated_count:>9} | "
+              f"{elapsed * 1e3:>8.2f} | {elapsed / eliminated_count * 1e6:>15.2f}")
+
+
+def benchmark_roster_queries(player_count: int = 1000, repeats: int = 50):
+    """Requêtes vivants/classement : parcours des objets Player contre colonnes du roster"""
+    players = build_players(player_count)
+    for player in players[::3]:
+        player.alive = False
+    roster = PlayerRoster(players)
+
+    def median_us(query):
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            query()
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings) * 1e6
+
+    print(f"\n📊 Requêtes sur le roster - {player_count} joueurs")
+    print(f"{'requête':>12} | {'objets Player µs':>17} | {'roster µs':>10}")
+    print("-" * 46)
+    queries = {
+        "vivants": (
+            lambda: len([p for p in players if p.alive]),
+            roster.alive_count
+        ),
+        "classement": (
+            lambda: sorted(players, key=lambda p: (p.total_score, p.survived_events, -p.betrayals), reverse=True),
+            roster.ranking_order
+        ),
+    }
+    for name, (object_query, roster_query) in queries.items():
+        print(f"{name:>12} | {median_us(object_query):>17.1f} | {median_us(roster_query):>10.1f}")
+
+
+def benchmark_bonus_tables(player_count: int = 1000, repeats: int = 20):
+    """Score de base (stat + rôle - difficulté) de toutes les épreuves via les tables précompilées"""
+    players = build_players(player_count)
+    roster = PlayerRoster(players)
+    events = EventsService.GAME_EVENTS
+
+    def per_player_us(compute):
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for event in events:
+                compute(EventsService.get_bonus_table(event))
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings) / (len(events) * player_count) * 1e6
+
+    def row_lookups(table):
+        return [table.rows[ROLE_CODES[p.role]][getattr(p.stats, table.stat_attr)] for p in players]
+
+    def numpy_gather(table):
+        return table.matrix[roster.role_codes, roster.stats[:, table.stat_column]]
+
+    print(f"\n📊 Tables de bonus - {len(events)} épreuves x {player_count} joueurs")
+    print(f"{'lecture listes µs/joueur':>26} | {'gather NumPy µs/joueur':>24}")
+    print("-" * 54)
+    print(f"{per_player_us(row_lookups):>26.3f} | {per_player_us(numpy_gather):>24.3f}")
+
+
+def benchmark_player_factory(player_count: int = 1000, repeats: int = 5):
+    """Génération joueur par joueur vs generate_players_bulk (calques de portrait résolus plus tard, hors mesure)"""
+    def median_ms(generate):
+        timings = []
+        for seed in range(repeats):
+            rng = random.Random(seed)
+            start = time.perf_counter()
+            generate(rng)
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings) * 1000
+
+    per_player = median_ms(lambda rng: [GameService.generate_random_player(i, rng) for i in range(1, player_count + 1)])
+    bulk = median_ms(lambda rng: GameService.generate_players_bulk(player_count, rng=rng))
+
+    print(f"\n📊 Génération de {player_count} joueurs")
+    print(f"{'joueur par joueur ms':>22} | {'groupée ms':>12}")
+    print("-" * 38)
+    print(f"{per_player:>22.1f} | {bulk:>12.1f}")
+
+
+def benchmark_trusted_construction(count: int = 1000, repeats: int = 5):
+    """Génération de joueurs et de célébrités avec validation pydantic complète vs construction de confiance"""
+    trusted = TrustedModel.__dict__['trusted']
+    try:
+        def median_ms(generate):
+            timings = []
+            for seed in range(repeats):
+                random.seed(seed)
+                start = time.perf_counter()
+                generate(random.Random(seed))
+                timings.append(time.perf_counter() - start)
+            return statistics.median(timings) * 1000
+
+        factories = {
+            "joueurs": lambda rng: GameService.generate_players_bulk(count, rng=rng),
+            "célébrités": lambda rng: GameService.generate_celebrities(count),
+        }
+        # "Avant" : même code, chaque modèle repasse par le constructeur validant et ses fabriques par défaut
+        TrustedModel.trusted = classmethod(lambda cls, **values: cls(**{
+            name: value for name, value in values.items() if name not in ('id', 'created_at')
+        }))
+        validated = {label: median_ms(generate) for label, generate in factories.items()}
+        TrustedModel.trusted = trusted
+        fast = {label: median_ms(generate) for label, generate in factories.items()}
+    finally:
+        TrustedModel.trusted = trusted
+
+    print(f"\n📊 Construction de {count} modèles générés")
+    print(f"{'modèles':>12} | {'validés ms':>11} | {'confiance ms':>13}")
+    print("-" * 42)
+    for label in factories:
+        print(f"{label:>12} | {validated[label]:>11.1f} | {fast[label]:>13.1f}")
+
+
+if __name__ == "__main__":
+    print("⏱️  Benchmarks de simulation")
+    print("=" * 60)
+    random.seed(42)
+    benchmark_group_census()
+    benchmark_kill_allocation()
+    benchmark_roster_queries()
+    benchmark_bonus_tables()
+    benchmark_player_factory()
+    benchmark_trusted_construction()
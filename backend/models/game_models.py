@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Union
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
+from pydantic_core import PydanticUndefined
+from typing import List, Optional, Dict, Any, Union, Literal
 from datetime import datetime
 from enum import Enum
+import os
 import uuid
+import random
 
 class PlayerRole(str, Enum):
     NORMAL = "normal"
@@ -27,12 +30,63 @@ class EventCategory(str, Enum):
     EXTREME = "extreme"
     FINALE = "finale"
 
-class PlayerStats(BaseModel):
+# Valeurs par défaut de chaque modèle de confiance : (gabarit ordonné des champs, fabriques par champ)
+_TRUSTED_DEFAULTS: Dict[type, tuple] = {}
+_object_setattr = object.__setattr__
+
+def _trusted_defaults(model_cls: type) -> tuple:
+    template, factories = {}, {}
+    for name, field in model_cls.model_fields.items():
+        template[name] = None if field.default is PydanticUndefined else field.default
+        if field.default_factory is not None:
+            factories[name] = field.default_factory
+        elif isinstance(field.default, (list, dict, set)):
+            # Les défauts mutables sont copiés pour chaque instance, comme le fait pydantic
+            factories[name] = field.default.copy
+    _TRUSTED_DEFAULTS[model_cls] = (template, factories)
+    return template, factories
+
+def uuid4_batch(count: int) -> List[str]:
+    """Génère `count` identifiants UUID4 (chaînes) à partir d'un seul tirage d'octets aléatoires"""
+    h = os.urandom(16 * count).hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-4{h[i + 13:i + 16]}-{'89ab'[int(h[i + 16], 16) & 3]}{h[i + 17:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+class TrustedModel(BaseModel):
+    """Modèle pouvant être construit sans validation à partir de données générées par le serveur"""
+
+    @classmethod
+    def trusted(cls, **values):
+        """
+        Construit le modèle sans validation pydantic ni conversion de types
+        Réservé aux données produites par les services eux-mêmes : les données client doivent
+        toujours passer par le constructeur normal. Les champs absents prennent leur valeur par défaut,
+        les fabriques (uuid4, datetime.utcnow) ne sont appelées que pour les champs non fournis.
+        """
+        try:
+            template, factories = _TRUSTED_DEFAULTS[cls]
+        except KeyError:
+            template, factories = _trusted_defaults(cls)
+        data = {**template, **values}
+        for name, factory in factories.items():
+            if name not in values:
+                data[name] = factory()
+        # Même état interne que BaseModel.model_construct, sans sa boucle champ par champ
+        model = object.__new__(cls)
+        _object_setattr(model, '__dict__', data)
+        _object_setattr(model, '__pydantic_fields_set__', set(values))
+        _object_setattr(model, '__pydantic_extra__', None)
+        _object_setattr(model, '__pydantic_private__', None)
+        return model
+
+class PlayerStats(TrustedModel):
     intelligence: int = Field(..., ge=0, le=10)
     force: int = Field(..., ge=0, le=10)
     agilité: int = Field(..., ge=0, le=10)
 
-class PlayerPortrait(BaseModel):
+class PlayerPortrait(TrustedModel):
     face_shape: str
     skin_color: str
     hairstyle: str
@@ -45,13 +99,22 @@ class PlayerPortrait(BaseModel):
     layer_hair: Optional[str] = None  # Chemin vers le calque des cheveux
     layer_mouth: Optional[str] = None  # Chemin vers le calque de la bouche
     layer_nose: Optional[str] = None  # Chemin vers le calque du nez
+    layer_set: Optional[str] = None  # Nom du set de calques (clé de /api/portraits/composite/{key})
+    # Résolution différée des calques : tant que layer_seed est renseigné, les chemins ci-dessus restent à calculer
+    layer_nationality: Optional[str] = None  # Clé de nationalité (GameService.NATIONALITIES)
+    layer_gender: Optional[str] = None  # 'M' or 'F'
+    layer_seed: Optional[int] = None  # Graine de la sélection des calques
+
+    @property
+    def layers_pending(self) -> bool:
+        return self.layer_seed is not None
 
-class PlayerUniform(BaseModel):
+class PlayerUniform(TrustedModel):
     style: str
     color: str
     pattern: str
 
-class Player(BaseModel):
+class Player(TrustedModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     number: str
     name: str
@@ -120,6 +183,31 @@ class EventResult(BaseModel):
     eliminated: List[Dict[str, Any]]
     total_participants: int
 
+class EventLogEntry(BaseModel):
+    """
+    Entrée compacte du journal des épreuves d'une partie (append-only)
+    Les joueurs sont référencés par leur indice dans Game.players ; les listes des survivants
+    sont alignées sur `survivors`, celles des éliminés sur `eliminated`
+    """
+    event_id: int
+    event_name: str
+    decor: str = ""
+    total_participants: int
+    # Survivants (dans l'ordre du résultat, triés par score)
+    survivors: List[int] = []
+    time_remaining: List[int] = []
+    event_kills: List[int] = []
+    scores: List[int] = []
+    betrayed: List[int] = []  # Positions (dans survivors) des joueurs ayant trahi
+    kills: List[int] = []  # Kills cumulés après l'épreuve
+    total_scores: List[int] = []  # Score total cumulé après l'épreuve
+    survived_events: List[int] = []
+    # Éliminés
+    eliminated: List[int] = []
+    elimination_times: List[int] = []
+    causes: List[int] = []  # Indices dans cause_table
+    cause_table: List[str] = []
+
 class RealtimeEventUpdate(BaseModel):
     """Mise à jour en temps réel d'un événement"""
     event_id: int
@@ -144,12 +232,36 @@ class Game(BaseModel):
     completed: bool = False
     start_time: datetime = Field(default_factory=datetime.utcnow)
     end_time: Optional[datetime] = None
-    event_results: List[EventResult] = []
+    event_log: List[EventLogEntry] = []  # Journal compact des épreuves (voir EventLogService pour les résultats complets)
     winner: Optional[Player] = None
     total_cost: int = 0
     earnings: int = 0
     vip_salon_level: int = 0  # Niveau de salon VIP utilisé pour cette partie
     vip_earnings_collected: bool = False  # Flag pour indiquer si les gains VIP ont été collectés automatiquement
+    simulation_engine: Literal["classic", "vectorized"] = "classic"  # Moteur de simulation des épreuves
+    seed: int = Field(default_factory=lambda: random.SystemRandom().getrandbits(32))  # Graine pour rejouer la partie
+    
+    # Générateur aléatoire propre à la partie (non sérialisé)
+    _rng: Optional[random.Random] = PrivateAttr(default=None)
+    # Roster en colonnes NumPy (services.player_roster.PlayerRoster, non sérialisé)
+    _roster: Any = PrivateAttr(default=None)
+    
+    @property
+    def rng(self) -> random.Random:
+        """Générateur de la partie, initialisé depuis sa graine à la première utilisation"""
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
+    
+    @computed_field
+    @property
+    def event_results(self) -> List[Dict[str, Any]]:
+        """
+        Compatibilité avec l'ancien champ : résultats reconstruits depuis event_log,
+        les joueurs n'y sont référencés que par id, numéro et nom (résultats complets : GET /{id}/event-results)
+        """
+        from services.event_log_service import EventLogService
+        return EventLogService.slim_results(self)
 
 class GameStats(BaseModel):
     total_games_played: int = 0
@@ -199,7 +311,7 @@ class GameState(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 # VIP Models
-class VipCharacter(BaseModel):
+class VipCharacter(TrustedModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
     mask: str
@@ -219,7 +331,7 @@ class VipBet(BaseModel):
     event_id: Optional[int] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-class Celebrity(BaseModel):
+class Celebrity(TrustedModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
     category: str
@@ -253,6 +365,8 @@ class GameCreateRequest(BaseModel):
     all_players: List[PlayerCreateRequest] = []  # Nouveau champ pour tous les joueurs
     preserve_event_order: bool = True  # Nouveau champ pour préserver l'ordre choisi
     vip_salon_level: Optional[int] = None  # Niveau de salon VIP spécifique pour la partie
+    simulation_engine: Literal["classic", "vectorized"] = "classic"  # 'vectorized' pour les grandes parties (NumPy)
+    seed: Optional[int] = None  # Graine pour une partie reproductible (aléatoire si absente)
 
 class GameStateUpdate(BaseModel):
     money: Optional[int] = None
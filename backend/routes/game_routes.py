@@ -1,7 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 import random
+import asyncio
+import bisect
+import json
 
 from models.game_models import (
     Game, Player, GameState, GameStats, GameCreateRequest, 
@@ -12,6 +17,16 @@ from models.game_models import (
 from services.game_service import GameService
 from services.vip_service import VipService
 from services.events_service import EventsService
+from services.odds_service import OddsService
+from services.event_log_service import EventLogService
+from services.player_roster import PlayerRoster
+from services.executor_service import ExecutorService
+from services.player_pool_service import PlayerPoolService
+from services.portrait_generator_service import portrait_service
+from services.portrait_atlas_service import portrait_atlases
+from services.portrait_store import portrait_store
+from services.portrait_variants import image_response, negotiate
+from services.realtime_feed_service import RealtimeFeedService
 
 router = APIRouter(prefix="/api/games", tags=["games"])
 
@@ -218,12 +233,74 @@ def init_default_data():
 
 init_default_data()
 
+# Préparations de portraits en cours, par partie (référence gardée jusqu'à la fin de la tâche)
+portrait_resolution_tasks: Dict[str, asyncio.Task] = {}
+
+def _prepare_game_portraits(game_id: str, players: List[Player]):
+    """Résout les calques différés, protège les sets utilisés de l'éviction puis construit l'atlas de la partie"""
+    portrait_service.resolve_players_portraits(players)
+    portrait_store.retain(game_id, (player.portrait.layer_set for player in players))
+    portrait_atlases.build(game_id, players)
+
+def _release_game_resources(game_id: str):
+    """Libère ce qui est rattaché à une partie supprimée (verrou, atlas, références de portraits, dernière simulation)"""
+    ExecutorService.release_game(game_id)
+    portrait_atlases.release(game_id)
+    portrait_store.release(game_id)
+    finished_simulations.pop(game_id, None)
+
+def _schedule_portrait_resolution(game: Game) -> asyncio.Task:
+    """
+    Prépare en arrière-plan, hors de la boucle d'événements, les calques et l'atlas de portraits d'une partie
+    Une seule préparation par partie à la fois : la résolution d'un portrait n'est pas protégée contre un appel concurrent.
+    """
+    task = asyncio.create_task(
+        ExecutorService.run_offloaded(_prepare_game_portraits, game.id, game.players)
+    )
+    portrait_resolution_tasks[game.id] = task
+
+    def _done(finished: asyncio.Task):
+        portrait_resolution_tasks.pop(game.id, None)
+        if not finished.cancelled() and finished.exception() is not None:
+            print(f"❌ PORTRAITS: échec de la préparation des portraits pour game {game.id}: {finished.exception()}")
+
+    task.add_done_callback(_done)
+    return task
+
+async def _resolve_pending_portraits(game: Game):
+    """
+    Premier accès à une partie : attend la préparation de ses portraits, déjà en cours ou lancée ici
+    si des calques sont encore différés (jamais deux résolutions des mêmes joueurs en parallèle)
+    """
+    task = portrait_resolution_tasks.get(game.id)
+    if task is None:
+        if not any(player.portrait.layers_pending for player in game.players):
+            return
+        task = _schedule_portrait_resolution(game)
+    try:
+        # shield : une requête annulée n'interrompt pas la préparation partagée
+        await asyncio.shield(task)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        # Échec déjà journalisé par la tâche ; la partie reste servie avec les portraits résolus
+        pass
+
+def _generate_automatic_players(first_number: int, count: int, used_names: set, rng: random.Random):
+    """Génère les joueurs automatiques d'une nouvelle partie en évitant les noms déjà utilisés"""
+    players = GameService.generate_players_bulk(count, first_number=first_number, used_names=used_names, rng=rng)
+    return players, rng
+
 @router.post("/create", response_model=Game)
 async def create_game(request: GameCreateRequest):
     """Crée une nouvelle partie avec les joueurs spécifiés"""
     try:
         players = []
         
+        # Générateur propre à la partie : même graine => mêmes joueurs, VIPs et épreuves
+        seed = request.seed if request.seed is not None else random.SystemRandom().getrandbits(32)
+        rng = random.Random(seed)
+        
         # Vérifier si tous les joueurs sont fournis par le frontend
         if request.all_players and len(request.all_players) > 0:
             # Utiliser TOUS les joueurs fournis par le frontend
@@ -264,43 +341,19 @@ async def create_game(request: GameCreateRequest):
             
             # Générer les joueurs automatiques restants avec des noms uniques
             remaining_count = request.player_count - len(request.manual_players)
+            if remaining_count > 0 and request.seed is None:
+                # Sans graine imposée, on puise d'abord dans la réserve de joueurs pré-générés
+                pooled_players = PlayerPoolService.take(remaining_count, len(players) + 1, used_names)
+                players.extend(pooled_players)
+                remaining_count -= len(pooled_players)
             if remaining_count > 0:
-                # Générer les joueurs automatiques en évitant les noms déjà utilisés
-                for i in range(remaining_count):
-                    player_id = len(request.manual_players) + i + 1
-                    
-                    # Sélection du rôle selon les probabilités
-                    rand = random.random()
-                    cumulative_probability = 0
-                    selected_role = GameService.ROLE_PROBABILITIES[list(GameService.ROLE_PROBABILITIES.keys())[0]]
-                    
-                    for role, probability in GameService.ROLE_PROBABILITIES.items():
-                        cumulative_probability += probability
-                        if rand <= cumulative_probability:
-                            selected_role = role
-                            break
-                    
-                    nationality_key = random.choice(list(GameService.NATIONALITIES.keys()))
-                    gender = random.choice(['M', 'F'])
-                    nationality_display = GameService.NATIONALITIES[nationality_key][gender]
-                    
-                    # Génération des stats selon le rôle
-                    stats = GameService._generate_stats_by_role(selected_role)
-                    
-                    player = Player(
-                        number=str(player_id).zfill(3),
-                        name=GameService._generate_unique_name(nationality_key, gender, used_names),
-                        nationality=nationality_display,
-                        gender=gender,
-                        role=selected_role,
-                        stats=stats,
-                        portrait=GameService._generate_portrait(nationality_key),
-                        uniform=GameService._generate_uniform(),
-                        alive=True,
-                        health=100,
-                        total_score=stats.intelligence + stats.force + stats.agilité
-                    )
-                    players.append(player)
+                # Génération hors de la boucle d'événements pour les grandes parties ;
+                # le générateur est renvoyé pour que la suite de la partie reste reproductible
+                generated_players, rng = await ExecutorService.run(
+                    remaining_count, _generate_automatic_players,
+                    len(players) + 1, remaining_count, used_names, rng, pure=True
+                )
+                players.extend(generated_players)
         
         # Sélectionner et organiser les événements selon les préférences utilisateur
         organized_events = EventsService.organize_events_for_game(
@@ -327,8 +380,11 @@ async def create_game(request: GameCreateRequest):
         game = Game(
             players=players,
             events=organized_events,
-            total_cost=total_cost
+            total_cost=total_cost,
+            simulation_engine=request.simulation_engine,
+            seed=seed
         )
+        game._rng = rng
         
         # CORRECTION PROBLÈME 1: Déduire l'argent du gamestate après création
         from routes.gamestate_routes import game_states_db
@@ -362,7 +418,7 @@ async def create_game(request: GameCreateRequest):
         # Si salon_level = 0, assigner 1 VIP selon les nouvelles spécifications françaises
         if salon_level == 0:
             # Assigner 1 VIP pour le niveau 0 selon les nouvelles spécifications
-            game_vips = VipService.get_random_vips(1)
+            game_vips = VipService.get_random_vips(1, rng=game.rng)
             
             # NOUVEAU : Calculer et appliquer le bonus de tarification VIP
             pricing_multiplier = calculate_vip_pricing_bonus(players)
@@ -384,7 +440,7 @@ async def create_game(request: GameCreateRequest):
             
             if vip_capacity > 0:
                 # Assigner des VIPs avec leurs viewing_fee (200k-3M)
-                game_vips = VipService.get_random_vips(vip_capacity)
+                game_vips = VipService.get_random_vips(vip_capacity, rng=game.rng)
                 
                 # NOUVEAU : Calculer et appliquer le bonus de tarification VIP
                 pricing_multiplier = calculate_vip_pricing_bonus(players)
@@ -407,6 +463,8 @@ async def create_game(request: GameCreateRequest):
         game.vip_salon_level = salon_level
         
         games_db[game.id] = game
+        # Les calques de portrait sont résolus après la réponse, sans toucher au disque sur ce chemin
+        _schedule_portrait_resolution(game)
         return game
         
     except Exception as e:
@@ -417,11 +475,48 @@ async def get_game(game_id: str):
     """Récupère une partie par son ID"""
     if game_id not in games_db:
         raise HTTPException(status_code=404, detail="Partie non trouvée")
-    return games_db[game_id]
+    game = games_db[game_id]
+    await _resolve_pending_portraits(game)
+    return game
+
+@router.get("/{game_id}/portrait-atlas")
+async def get_portrait_atlas(game_id: str):
+    """
+    Index de l'atlas de portraits : URL des planches et position (planche, x, y) de chaque joueur
+    Les joueurs absents de l'index n'ont pas de calques et gardent l'affichage par défaut.
+    """
+    if game_id not in games_db:
+        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    game = games_db[game_id]
+    await _resolve_pending_portraits(game)
+    atlas = portrait_atlases.get(game_id, game.players)
+    if atlas is None:
+        atlas = await ExecutorService.run_offloaded(portrait_atlases.build, game_id, game.players)
+    return portrait_atlases.index(atlas, f"/api/games/{game_id}/portrait-atlas/{{version}}/{{sheet}}")
+
+@router.get("/{game_id}/portrait-atlas/{version}/{sheet}")
+async def get_portrait_atlas_sheet(game_id: str, version: str, sheet: int, request: Request):
+    """
+    Planche de l'atlas, en WebP/AVIF si l'en-tête Accept le permet, sinon en PNG
+    L'URL contient l'empreinte du contenu des planches, la réponse est donc immuable
+    """
+    if game_id not in games_db:
+        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    atlas = portrait_atlases.get(game_id, games_db[game_id].players)
+    if atlas is None or atlas.version != version or not 0 <= sheet < len(atlas.sheets):
+        raise HTTPException(status_code=404, detail="Planche introuvable (atlas périmé, recharger l'index)")
+    
+    fmt = negotiate(request.headers.get("accept"), atlas.sheets[sheet])
+    return image_response(request, atlas.sheets[sheet][fmt], atlas.etags[sheet][fmt], fmt)
 
 @router.post("/{game_id}/simulate-event")
 async def simulate_event(game_id: str):
     """Simule l'événement actuel d'une partie"""
+    async with ExecutorService.game_lock(game_id):
+        return await _simulate_current_event(game_id)
+
+async def _simulate_current_event(game_id: str):
+    """Simulation de l'événement actuel (appelée sous le verrou de la partie)"""
     if game_id not in games_db:
         raise HTTPException(status_code=404, detail="Partie non trouvée")
     
@@ -434,9 +529,10 @@ async def simulate_event(game_id: str):
         raise HTTPException(status_code=400, detail="Plus d'événements disponibles")
     
     current_event = game.events[game.current_event_index]
+    roster = PlayerRoster.for_game(game)
     
     # Vérifier si on a déjà 1 survivant avant simulation
-    alive_players_before = [p for p in game.players if p.alive]
+    alive_players_before = roster.alive_players()
     if len(alive_players_before) <= 1:
         game.completed = True
         game.end_time = datetime.utcnow()
@@ -445,108 +541,15 @@ async def simulate_event(game_id: str):
         if alive_players_before:
             game.winner = max(alive_players_before, key=lambda p: p.total_score)
         
-        # Calculer les gains - CORRECTION : UTILISER LES VRAIS MONTANTS VIP
-        from routes.vip_routes import active_vips_by_game
-        from routes.gamestate_routes import game_states_db
-        
-        # Récupérer le niveau de salon VIP utilisé pour cette partie
-        salon_level = game.vip_salon_level if hasattr(game, 'vip_salon_level') else 1
-        
-        # Utiliser la clé de stockage exacte des VIPs pour cette partie
-        vip_key = f"{game_id}_salon_{salon_level}"
-        game_vips = active_vips_by_game.get(vip_key, [])
-        
-        # Si pas trouvé avec la clé de salon, chercher dans tous les niveaux possibles
-        if not game_vips:
-            for level in range(1, 10):
-                test_key = f"{game_id}_salon_{level}"
-                if test_key in active_vips_by_game:
-                    game_vips = active_vips_by_game[test_key]
-                    break
-        
-        # Fallback vers l'ancienne clé pour compatibilité
-        if not game_vips:
-            game_vips = active_vips_by_game.get(game_id, [])
-        
-        if game_vips:
-            # Sommer les viewing_fee réels des VIPs (entre 200k et 3M chacun)
-            game.earnings = sum(vip.viewing_fee for vip in game_vips)
-        else:
-            # Pas de VIPs assignés, aucun gain
-            game.earnings = 0
-        
-        # 🎯 NOUVELLE FONCTIONNALITÉ : Collection automatique des gains VIP dès la fin de partie
-        if game.earnings > 0 and not game.vip_earnings_collected:
-            # Définir l'utilisateur par défaut
-            user_id = "default_user"
-            
-            # Ajouter automatiquement les gains VIP au portefeuille du joueur
-            if user_id not in game_states_db:
-                from models.game_models import GameState
-                game_state = GameState(user_id=user_id)
-                game_states_db[user_id] = game_state
-            else:
-                game_state = game_states_db[user_id]
-            
-            # Ajouter les gains au portefeuille du joueur
-            earnings_to_collect = game.earnings
-            game_state.money += earnings_to_collect
-            game_state.game_stats.total_earnings += earnings_to_collect
-            game_state.updated_at = datetime.utcnow()
-            game_states_db[user_id] = game_state
-            
-            # Marquer que les gains ont été collectés automatiquement
-            game.vip_earnings_collected = True
-            
-            print(f"🎭 Gains VIP collectés automatiquement: {earnings_to_collect}$ pour l'utilisateur {user_id}")
-            print(f"💰 Nouveau solde: {game_state.money}$")
+        # Gains VIP des VIPs assignés, collectés automatiquement dès la fin de partie
+        game_vips = _get_game_vips(game_id, game)
+        game.earnings = sum(vip.viewing_fee for vip in game_vips) if game_vips else 0
+        _collect_vip_earnings(game)
         
         games_db[game_id] = game
         
-        # NOUVELLE FONCTIONNALITÉ : Sauvegarder automatiquement les statistiques
-        try:
-            from services.statistics_service import StatisticsService
-            from routes.gamestate_routes import game_states_db
-            
-            # Définir l'utilisateur par défaut
-            user_id = "default_user"
-            
-            print(f"🔍 DEBUG: Attempting to save completed game {game_id} for user {user_id}")
-            
-            # Récupérer le classement final pour les statistiques
-            try:
-                final_ranking_response = await get_final_ranking(game_id)
-                final_ranking = final_ranking_response.get('ranking', [])
-                print(f"🔍 DEBUG: Final ranking retrieved with {len(final_ranking)} entries")
-            except Exception as ranking_error:
-                print(f"🔍 DEBUG: Failed to get final ranking: {ranking_error}")
-                final_ranking = []
-            
-            # Sauvegarder la partie terminée dans les statistiques
-            print(f"🔍 DEBUG: Calling StatisticsService.save_completed_game...")
-            completed_game = StatisticsService.save_completed_game(user_id, game, final_ranking)
-            print(f"🔍 DEBUG: Game saved successfully: {completed_game.id}")
-            
-            # Mettre à jour les stats de base dans gamestate
-            if user_id in game_states_db:
-                game_state = game_states_db[user_id]
-                game_state.game_stats.total_games_played += 1
-                # Compter le nombre total de joueurs morts (éliminations)
-                total_eliminations = len(game.players) - len([p for p in game.players if p.alive])
-                game_state.game_stats.total_kills += total_eliminations
-                if hasattr(game, 'earnings'):
-                    game_state.game_stats.total_earnings += game.earnings
-                game_state.updated_at = datetime.utcnow()
-                game_states_db[user_id] = game_state
-                print(f"🔍 DEBUG: GameState updated for user {user_id}")
-            else:
-                print(f"🔍 DEBUG: User {user_id} not found in game_states_db")
-                
-        except Exception as e:
-            print(f"❌ Erreur lors de la sauvegarde des statistiques: {e}")
-            import traceback
-            print(f"❌ Traceback: {traceback.format_exc()}")
-            # Continue même en cas d'erreur de sauvegarde
+        # Sauvegarder automatiquement les statistiques
+        await _save_completed_game_statistics(game_id, game)
         
         # Retourner un résultat vide car aucun événement n'a été simulé
         return {
@@ -585,94 +588,15 @@ async def simulate_event(game_id: str):
                 game.end_time = datetime.utcnow()
                 game.winner = max(alive_players_before, key=lambda p: p.total_score) if alive_players_before else None
                 
-                # Calculer les gains réels des VIPs avec la logique correcte de récupération
-                from routes.vip_routes import active_vips_by_game
-                
-                # Récupérer le niveau de salon VIP utilisé pour cette partie
-                salon_level = game.vip_salon_level if hasattr(game, 'vip_salon_level') else 1
-                
-                # Utiliser la clé de stockage exacte des VIPs pour cette partie
-                vip_key = f"{game_id}_salon_{salon_level}"
-                game_vips = active_vips_by_game.get(vip_key, [])
-                
-                # Si pas trouvé avec la clé de salon, chercher dans tous les niveaux possibles
-                if not game_vips:
-                    for level in range(1, 10):  # Tester tous les niveaux possibles
-                        test_key = f"{game_id}_salon_{level}"
-                        if test_key in active_vips_by_game:
-                            game_vips = active_vips_by_game[test_key]
-                            break
-                
-                # Fallback vers l'ancienne clé pour compatibilité
-                if not game_vips:
-                    game_vips = active_vips_by_game.get(game_id, [])
-                
-                if game_vips:
-                    game.earnings = sum(vip.viewing_fee for vip in game_vips)
-                else:
-                    game.earnings = 0
+                # Gains VIP des VIPs assignés, collectés automatiquement dès la fin de partie
+                game_vips = _get_game_vips(game_id, game)
+                game.earnings = sum(vip.viewing_fee for vip in game_vips) if game_vips else 0
+                _collect_vip_earnings(game)
                 
-                # 🎯 NOUVELLE FONCTIONNALITÉ : Collection automatique des gains VIP dès la fin de partie
-                if game.earnings > 0 and not game.vip_earnings_collected:
-                    from routes.gamestate_routes import game_states_db
-                    # Définir l'utilisateur par défaut
-                    user_id = "default_user"
-                    
-                    # Ajouter automatiquement les gains VIP au portefeuille du joueur
-                    if user_id not in game_states_db:
-                        from models.game_models import GameState
-                        game_state = GameState(user_id=user_id)
-                        game_states_db[user_id] = game_state
-                    else:
-                        game_state = game_states_db[user_id]
-                    
-                    # Ajouter les gains au portefeuille du joueur
-                    earnings_to_collect = game.earnings
-                    game_state.money += earnings_to_collect
-                    game_state.game_stats.total_earnings += earnings_to_collect
-                    game_state.updated_at = datetime.utcnow()
-                    game_states_db[user_id] = game_state
-                    
-                    # Marquer que les gains ont été collectés automatiquement
-                    game.vip_earnings_collected = True
-                    
-                    print(f"🎭 Gains VIP collectés automatiquement: {earnings_to_collect}$ pour l'utilisateur {user_id}")
-                    print(f"💰 Nouveau solde: {game_state.money}$")
-                    
                 games_db[game_id] = game
                 
-                # NOUVELLE FONCTIONNALITÉ : Sauvegarder automatiquement les statistiques
-                try:
-                    from services.statistics_service import StatisticsService
-                    from routes.gamestate_routes import game_states_db
-                    
-                    # Définir l'utilisateur par défaut
-                    user_id = "default_user"
-                    
-                    # Récupérer le classement final pour les statistiques
-                    try:
-                        final_ranking_response = await get_final_ranking(game_id)
-                        final_ranking = final_ranking_response.get('ranking', [])
-                    except:
-                        final_ranking = []
-                    
-                    # Sauvegarder la partie terminée dans les statistiques
-                    StatisticsService.save_completed_game(user_id, game, final_ranking)
-                    
-                    # Mettre à jour les stats de base dans gamestate
-                    if user_id in game_states_db:
-                        game_state = game_states_db[user_id]
-                        game_state.game_stats.total_games_played += 1
-                        # Compter le nombre total de joueurs morts (éliminations)
-                        total_eliminations = len(game.players) - len([p for p in game.players if p.alive])
-                        game_state.game_stats.total_kills += total_eliminations
-                        if hasattr(game, 'earnings'):
-                            game_state.game_stats.total_earnings += game.earnings
-                        game_state.updated_at = datetime.utcnow()
-                        game_states_db[user_id] = game_state
-                except Exception as e:
-                    print(f"Erreur lors de la sauvegarde des statistiques: {e}")
-                    # Continue même en cas d'erreur de sauvegarde
+                # Sauvegarder automatiquement les statistiques
+                await _save_completed_game_statistics(game_id, game)
                 
                 return {
                     "result": EventResult(
@@ -698,39 +622,26 @@ async def simulate_event(game_id: str):
                 }
             else:
                 # Récursivement essayer le prochain événement
-                return await simulate_event(game_id)
+                return await _simulate_current_event(game_id)
     
     # Simuler l'événement avec support des groupes
     game_groups = {gid: g for gid, g in groups_db.items() if gid.startswith(f"{game_id}_")}
-    result = GameService.simulate_event(game.players, current_event, game_groups)
-    game.event_results.append(result)
-    
-    # Mettre à jour les joueurs dans la partie
-    for i, player in enumerate(game.players):
-        # Chercher le joueur dans les résultats pour mettre à jour ses stats
-        for survivor_data in result.survivors:
-            if survivor_data["number"] == player.number:
-                # Mettre à jour depuis les résultats
-                game.players[i].kills = survivor_data.get("kills", player.kills)
-                game.players[i].total_score = survivor_data.get("total_score", player.total_score)
-                game.players[i].survived_events = survivor_data.get("survived_events", player.survived_events)
-                break
-        
-        for eliminated_data in result.eliminated:
-            if eliminated_data["number"] == player.number:
-                game.players[i].alive = False
-                
-                # Vérifier si le joueur éliminé était une célébrité ou un ancien gagnant
-                if hasattr(player, 'celebrityId') and player.celebrityId:
-                    # Enregistrer la mort de la célébrité
-                    await record_celebrity_death_in_game(player.celebrityId, str(game.id))
-                break
+    result = await ExecutorService.run(
+        len(alive_players_before), GameService.simulate_event,
+        game.players, current_event, game_groups, engine=game.simulation_engine, rng=game.rng, roster=roster
+    )
+    
+    # Les joueurs de la partie sont mis à jour en place par le moteur : seules les célébrités restent à traiter
+    for eliminated_data in result.eliminated:
+        celebrity_id = getattr(eliminated_data["player"], 'celebrityId', None)
+        if celebrity_id:
+            await record_celebrity_death_in_game(celebrity_id, str(game.id))
     
     # Passer à l'événement suivant
     game.current_event_index += 1
     
     # Vérifier si la partie est terminée après simulation
-    alive_players_after = [p for p in game.players if p.alive]
+    alive_players_after = roster.alive_players()
     
     # CORRECTION CRITIQUE: Si l'événement a éliminé tous les joueurs, ressusciter le meilleur
     if len(alive_players_after) == 0 and len(result.eliminated) > 0:
@@ -738,14 +649,11 @@ async def simulate_event(game_id: str):
         best_eliminated = max(result.eliminated, key=lambda x: x.get("player").total_score)
         best_eliminated_player = best_eliminated["player"]
         
-        # Trouver le joueur dans la liste et le ressusciter
-        for i, player in enumerate(game.players):
-            if player.number == best_eliminated_player.number:
-                game.players[i].alive = True
-                break
+        # Ressusciter le joueur (colonnes du roster et objet Player)
+        roster.set_alive(roster.index[best_eliminated_player.id], True)
         
         # Mettre à jour la liste des survivants
-        alive_players_after = [p for p in game.players if p.alive]
+        alive_players_after = roster.alive_players()
         
         # Retirer ce joueur de la liste des éliminés et l'ajouter aux survivants
         result.eliminated = [e for e in result.eliminated if e["number"] != best_eliminated_player.number]
@@ -762,6 +670,9 @@ async def simulate_event(game_id: str):
             "survived_events": best_eliminated_player.survived_events
         })
     
+    # Journal compact de l'épreuve (après une éventuelle résurrection)
+    EventLogService.record(game, result)
+    
     # Condition d'arrêt : 1 survivant OU tous les événements terminés
     if len(alive_players_after) <= 1 or game.current_event_index >= len(game.events):
         game.completed = True
@@ -771,140 +682,276 @@ async def simulate_event(game_id: str):
         if alive_players_after:
             game.winner = max(alive_players_after, key=lambda p: p.total_score)
         
-        # 🎯 CORRECTION COMPLÈTE : CALCUL ET COLLECTION AUTOMATIQUE DES GAINS VIP
-        from routes.vip_routes import active_vips_by_game
-        from routes.gamestate_routes import game_states_db
-        
-        # Récupérer le niveau de salon VIP utilisé pour cette partie
-        salon_level = game.vip_salon_level if hasattr(game, 'vip_salon_level') else 1
-        
-        # Utiliser la clé de stockage exacte des VIPs pour cette partie
-        vip_key = f"{game_id}_salon_{salon_level}"
-        game_vips = active_vips_by_game.get(vip_key, [])
-        
-        # Si pas trouvé avec la clé de salon, chercher dans tous les niveaux possibles
-        if not game_vips:
-            for level in range(1, 10):
-                test_key = f"{game_id}_salon_{level}"
-                if test_key in active_vips_by_game:
-                    game_vips = active_vips_by_game[test_key]
-                    salon_level = level  # Utiliser le niveau trouvé
-                    break
-        
-        # Fallback vers l'ancienne clé pour compatibilité (salon niveau 1)
-        if not game_vips:
-            game_vips = active_vips_by_game.get(game_id, [])
-            salon_level = 1
-        
-        if game_vips:
-            # Calculer les gains réels en additionnant tous les viewing_fee des VIPs
-            total_vip_earnings = sum(vip.viewing_fee for vip in game_vips)
-            game.earnings = total_vip_earnings
-            
-            print(f"💰 CALCUL GAINS VIP - Salon niveau {salon_level}: {len(game_vips)} VIPs")
-            print(f"💰 Détail viewing_fees: {[vip.viewing_fee for vip in game_vips]}")
-            print(f"💰 Total gains VIP: {total_vip_earnings}$")
-        else:
-            # Pas de VIPs assignés, aucun gain
-            game.earnings = 0
-            print(f"⚠️ ATTENTION: Aucun VIP trouvé pour la partie {game_id} avec salon niveau {salon_level}")
-        
-        # 🎯 GAINS VIP DISPONIBLES MAIS PAS COLLECTÉS AUTOMATIQUEMENT
-        # Les gains VIP ne sont collectés QU'APRÈS la toute dernière simulation avec gagnant
-        # La collection se fait manuellement via /collect-vip-earnings
+        # Gains VIP réels des VIPs assignés ; la collection se fait manuellement via /collect-vip-earnings
+        game_vips = _get_game_vips(game_id, game)
+        game.earnings = sum(vip.viewing_fee for vip in game_vips) if game_vips else 0
         if game.earnings > 0:
-            print(f"💰 GAINS VIP DISPONIBLES: {game.earnings:,}$ (Salon niveau {salon_level}) - Collection manuelle requise")
+            print(f"💰 GAINS VIP DISPONIBLES: {game.earnings:,}$ ({len(game_vips)} VIPs) - Collection manuelle requise")
         else:
-            print("📋 Aucun gain VIP disponible pour cette partie")
+            print(f"⚠️ ATTENTION: Aucun VIP trouvé pour la partie {game_id}")
         
-        # 🎯 NOUVELLE FONCTIONNALITÉ : Sauvegarder automatiquement les statistiques
-        try:
-            from services.statistics_service import StatisticsService
-            
-            # Définir l'utilisateur par défaut
-            user_id = "default_user"
-            
-            print(f"🔍 DEBUG: Attempting to save completed game {game_id} for user {user_id}")
-            
-            # Récupérer le classement final pour les statistiques
-            try:
-                final_ranking_response = await get_final_ranking(game_id)
-                final_ranking = final_ranking_response.get('ranking', [])
-                print(f"🔍 DEBUG: Final ranking retrieved with {len(final_ranking)} entries")
-            except Exception as ranking_error:
-                print(f"🔍 DEBUG: Failed to get final ranking: {ranking_error}")
-                final_ranking = []
-            
-            # Sauvegarder la partie terminée dans les statistiques
-            print(f"🔍 DEBUG: Calling StatisticsService.save_completed_game...")
-            completed_game = StatisticsService.save_completed_game(user_id, game, final_ranking)
-            print(f"🔍 DEBUG: Game saved successfully: {completed_game.id}")
-            
-            # Mettre à jour les stats de base dans gamestate
-            if user_id in game_states_db:
-                game_state = game_states_db[user_id]
-                game_state.game_stats.total_games_played += 1
-                # Compter le nombre total de joueurs morts (éliminations)
-                total_eliminations = len(game.players) - len([p for p in game.players if p.alive])
-                game_state.game_stats.total_kills += total_eliminations
-                if hasattr(game, 'earnings'):
-                    game_state.game_stats.total_earnings += game.earnings
-                game_state.updated_at = datetime.utcnow()
-                game_states_db[user_id] = game_state
-                print(f"🔍 DEBUG: GameState updated for user {user_id}")
-            else:
-                print(f"🔍 DEBUG: User {user_id} not found in game_states_db")
-                
-        except Exception as e:
-            print(f"❌ Erreur lors de la sauvegarde des statistiques: {e}")
-            import traceback
-            print(f"❌ Traceback: {traceback.format_exc()}")
-            # Continue même en cas d'erreur de sauvegarde
+        # Sauvegarder automatiquement les statistiques
+        await _save_completed_game_statistics(game_id, game)
     else:
-        # NOUVEAU: Calculer les gains partiels même si le jeu n'est pas terminé
-        # en utilisant les VRAIS montants VIP (200k-3M chacun)
-        from routes.vip_routes import active_vips_by_game
+        # Gains partiels : VIPs assignés à la partie, même si elle n'est pas terminée
+        game_vips = _get_game_vips(game_id, game)
+        game.earnings = sum(vip.viewing_fee for vip in game_vips) if game_vips else 0
+    
+    games_db[game_id] = game
+    
+    # La réponse ne contient plus d'indication de collection automatique
+    response_data = {"result": result, "game": game}
+    
+    return response_data
+
+def _get_game_vips(game_id: str, game: Game) -> list:
+    """Retrouve les VIPs assignés à une partie (clé de salon, puis tous les niveaux, puis ancienne clé)"""
+    from routes.vip_routes import active_vips_by_game
+    
+    salon_level = game.vip_salon_level if hasattr(game, 'vip_salon_level') else 1
+    game_vips = active_vips_by_game.get(f"{game_id}_salon_{salon_level}", [])
+    
+    if not game_vips:
+        for level in range(1, 10):
+            test_key = f"{game_id}_salon_{level}"
+            if test_key in active_vips_by_game:
+                game_vips = active_vips_by_game[test_key]
+                break
+    
+    # Fallback vers l'ancienne clé pour compatibilité
+    if not game_vips:
+        game_vips = active_vips_by_game.get(game_id, [])
+    
+    return game_vips
+
+def _collect_vip_earnings(game: Game, user_id: str = "default_user") -> bool:
+    """
+    Ajoute les gains VIP d'une partie terminée au portefeuille de l'utilisateur, une seule fois
+    (vip_earnings_collected) ; renvoie True si des gains ont été crédités
+    """
+    if game.earnings <= 0 or game.vip_earnings_collected:
+        return False
+    
+    from routes.gamestate_routes import game_states_db
+    
+    if user_id not in game_states_db:
+        game_states_db[user_id] = GameState(user_id=user_id)
+    game_state = game_states_db[user_id]
+    
+    earnings_to_collect = game.earnings
+    game_state.money += earnings_to_collect
+    game_state.game_stats.total_earnings += earnings_to_collect
+    game_state.updated_at = datetime.utcnow()
+    game_states_db[user_id] = game_state
+    
+    # Marquer que les gains ont été collectés automatiquement
+    game.vip_earnings_collected = True
+    
+    print(f"🎭 Gains VIP collectés automatiquement: {earnings_to_collect:,}$ pour l'utilisateur {user_id}")
+    print(f"💰 Nouveau solde: {game_state.money:,}$")
+    return True
+
+async def _save_completed_game_statistics(game_id: str, game: Game, user_id: str = "default_user"):
+    """Sauvegarde une partie terminée dans les statistiques et met à jour le GameState de l'utilisateur"""
+    try:
+        from services.statistics_service import StatisticsService
         from routes.gamestate_routes import game_states_db
         
-        # Récupérer le niveau de salon VIP utilisé pour cette partie
-        salon_level = game.vip_salon_level if hasattr(game, 'vip_salon_level') else 1
+        try:
+            final_ranking_response = await get_final_ranking(game_id)
+            final_ranking = final_ranking_response.get('ranking', [])
+        except Exception:
+            final_ranking = []
         
-        # Utiliser la clé de stockage exacte des VIPs pour cette partie
-        vip_key = f"{game_id}_salon_{salon_level}"
-        game_vips = active_vips_by_game.get(vip_key, [])
+        StatisticsService.save_completed_game(user_id, game, final_ranking)
         
-        # Si pas trouvé avec la clé de salon, chercher dans tous les niveaux possibles
-        if not game_vips:
-            for level in range(1, 10):
-                test_key = f"{game_id}_salon_{level}"
-                if test_key in active_vips_by_game:
-                    game_vips = active_vips_by_game[test_key]
-                    break
+        if user_id in game_states_db:
+            game_state = game_states_db[user_id]
+            game_state.game_stats.total_games_played += 1
+            # Compter le nombre total de joueurs morts (éliminations)
+            total_eliminations = len(game.players) - PlayerRoster.for_game(game).alive_count()
+            game_state.game_stats.total_kills += total_eliminations
+            game_state.game_stats.total_earnings += game.earnings
+            game_state.updated_at = datetime.utcnow()
+            game_states_db[user_id] = game_state
+    except Exception as e:
+        print(f"❌ Erreur lors de la sauvegarde des statistiques: {e}")
+        # Continue même en cas d'erreur de sauvegarde
+
+@router.post("/{game_id}/simulate-all")
+async def simulate_all_events(game_id: str):
+    """
+    Simule toutes les épreuves restantes d'une partie en un seul appel
+    Applique le report des finales et la résurrection comme simulate-event,
+    calcule et collecte les gains VIP et sauvegarde les statistiques une seule fois à la fin
+    """
+    async with ExecutorService.game_lock(game_id):
+        return await _simulate_all_events(game_id)
+
+async def _simulate_all_events(game_id: str):
+    """Boucle de simulation de toutes les épreuves (appelée sous le verrou de la partie)"""
+    if game_id not in games_db:
+        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    
+    game = games_db[game_id]
+    
+    if game.completed:
+        raise HTTPException(status_code=400, detail="La partie est terminée")
+    
+    if game_id in active_simulations:
+        raise HTTPException(status_code=400, detail="Une simulation en temps réel est en cours pour cette partie")
+    
+    # Les groupes ne changent pas pendant la boucle : un seul parcours de groups_db
+    game_groups = {gid: g for gid, g in groups_db.items() if gid.startswith(f"{game_id}_")}
+    roster = PlayerRoster.for_game(game)
+    alive_players = roster.alive_players()
+    events_summary = []
+    
+    while game.current_event_index < len(game.events) and len(alive_players) > 1:
+        current_event = game.events[game.current_event_index]
+        
+        # Les finales ne se déclenchent que s'il y a 2-4 joueurs, sinon on passe à l'épreuve suivante
+        if current_event.is_final and len(alive_players) > current_event.min_players_for_final:
+            events_summary.append({
+                "event_id": current_event.id,
+                "event_name": current_event.name,
+                "skipped": True,
+                "participants": len(alive_players),
+                "survivors": len(alive_players),
+                "eliminated": 0,
+                "resurrected": None
+            })
+            game.current_event_index += 1
+            continue
         
-        # Fallback vers l'ancienne clé pour compatibilité
-        if not game_vips:
-            game_vips = active_vips_by_game.get(game_id, [])
+        result = await ExecutorService.run(
+            len(alive_players), GameService.simulate_event,
+            game.players, current_event, game_groups, engine=game.simulation_engine, rng=game.rng, roster=roster
+        )
+        game.current_event_index += 1
         
-        if game_vips:
-            # Sommer les viewing_fee réels des VIPs assignés à cette partie
-            game.earnings = sum(vip.viewing_fee for vip in game_vips)
-        else:
-            # Pas de VIPs assignés, aucun gain
-            game.earnings = 0
+        # simulate_event met à jour les joueurs de la partie en place : seules les célébrités restent à traiter
+        for eliminated_data in result.eliminated:
+            celebrity_id = getattr(eliminated_data["player"], 'celebrityId', None)
+            if celebrity_id:
+                await record_celebrity_death_in_game(celebrity_id, str(game.id))
+        
+        alive_players = roster.alive_players()
+        resurrected = None
+        
+        # Si l'épreuve a éliminé tous les joueurs, ressusciter le meilleur éliminé
+        if not alive_players and result.eliminated:
+            best_eliminated = max(result.eliminated, key=lambda x: x["player"].total_score)
+            best_eliminated_player = best_eliminated["player"]
+            roster.set_alive(roster.index[best_eliminated_player.id], True)
+            alive_players = [best_eliminated_player]
+            resurrected = best_eliminated_player.number
+            
+            result.eliminated = [e for e in result.eliminated if e["number"] != best_eliminated_player.number]
+            result.survivors.append({
+                "player": best_eliminated_player,
+                "number": best_eliminated_player.number,
+                "name": best_eliminated_player.name,
+                "time_remaining": 1,  # Survie de justesse
+                "event_kills": 0,
+                "betrayed": False,
+                "score": 1,
+                "kills": best_eliminated_player.kills,
+                "total_score": best_eliminated_player.total_score,
+                "survived_events": best_eliminated_player.survived_events
+            })
+        
+        EventLogService.record(game, result)
+        events_summary.append({
+            "event_id": current_event.id,
+            "event_name": current_event.name,
+            "skipped": False,
+            "participants": result.total_participants,
+            "survivors": len(result.survivors),
+            "eliminated": len(result.eliminated),
+            "resurrected": resurrected
+        })
+    
+    # Fin de partie : 1 survivant ou plus d'épreuves disponibles
+    game.completed = True
+    game.end_time = datetime.utcnow()
+    if alive_players:
+        game.winner = max(alive_players, key=lambda p: p.total_score)
+    
+    # Gains VIP calculés et collectés une seule fois, à la fin
+    game_vips = _get_game_vips(game_id, game)
+    game.earnings = sum(vip.viewing_fee for vip in game_vips) if game_vips else 0
+    _collect_vip_earnings(game)
     
     games_db[game_id] = game
+    await _save_completed_game_statistics(game_id, game)
     
-    # La réponse ne contient plus d'indication de collection automatique
-    response_data = {"result": result, "game": game}
+    print(f"🎮 Simulation complète de la partie {game_id}: {len(events_summary)} épreuves, {len(alive_players)} survivant(s)")
     
-    return response_data
+    return {
+        "game_id": game_id,
+        "completed": game.completed,
+        "events": events_summary,
+        "winner": {
+            "id": game.winner.id,
+            "number": game.winner.number,
+            "name": game.winner.name,
+            "total_score": game.winner.total_score,
+            "kills": game.winner.kills
+        } if game.winner else None,
+        "remaining_players": len(alive_players),
+        "earnings": game.earnings,
+        "vip_earnings_collected": game.vip_earnings_collected
+    }
+
+@router.get("/{game_id}/event-results")
+async def get_event_results(game_id: str, event_index: Optional[int] = None):
+    """Reconstruit les résultats complets des épreuves jouées depuis le journal compact de la partie"""
+    if game_id not in games_db:
+        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    
+    game = games_db[game_id]
+    if event_index is not None and not 0 <= event_index < len(game.event_log):
+        raise HTTPException(status_code=404, detail="Épreuve non trouvée dans l'historique")
+    
+    return EventLogService.rebuild_all(game, event_index)
+
+@router.get("/{game_id}/odds")
+async def get_survival_odds(game_id: str, trials: int = OddsService.DEFAULT_TRIALS, time_budget: float = OddsService.DEFAULT_TIME_BUDGET):
+    """Estime par Monte Carlo les chances de survie des joueurs vivants sur les épreuves restantes"""
+    if game_id not in games_db:
+        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    
+    if trials < 1 or trials > OddsService.MAX_TRIALS:
+        raise HTTPException(status_code=400, detail=f"Le nombre d'essais doit être entre 1 et {OddsService.MAX_TRIALS}")
+    if time_budget <= 0 or time_budget > OddsService.MAX_TIME_BUDGET:
+        raise HTTPException(status_code=400, detail=f"Le budget de temps doit être positif et d'au plus {OddsService.MAX_TIME_BUDGET:g} secondes")
+    
+    game = games_db[game_id]
+    # Copie des colonnes sous le verrou (simulate-event les modifie dans un thread), essais hors verrou
+    async with ExecutorService.game_lock(game_id):
+        remaining_events = game.events[game.current_event_index:]
+        game_groups = {gid: g for gid, g in groups_db.items() if gid.startswith(f"{game_id}_")}
+        snapshot = OddsService.snapshot(PlayerRoster.for_game(game), remaining_events, game_groups)
+    
+    odds = await OddsService.compute_odds(snapshot, trials, time_budget)
+    odds["game_id"] = game_id
+    odds["remaining_events"] = len(remaining_events)
+    return odds
 
 # Stockage pour les simulations en temps réel
 active_simulations = {}
+# Dernière simulation terminée de chaque partie : un spectateur en retard reçoit encore le résultat final
+finished_simulations: Dict[str, dict] = {}
 
 @router.post("/{game_id}/simulate-event-realtime")
 async def simulate_event_realtime(game_id: str, request: RealtimeSimulationRequest):
     """Démarre une simulation d'événement en temps réel"""
+    async with ExecutorService.game_lock(game_id):
+        return await _start_realtime_simulation(game_id, request)
+
+async def _start_realtime_simulation(game_id: str, request: RealtimeSimulationRequest):
+    """Pré-calcule l'épreuve et sa timeline (appelée sous le verrou de la partie)"""
     if game_id not in games_db:
         raise HTTPException(status_code=404, detail="Partie non trouvée")
     
@@ -921,7 +968,8 @@ async def simulate_event_realtime(game_id: str, request: RealtimeSimulationReque
         raise HTTPException(status_code=400, detail="Une simulation est déjà en cours pour cette partie")
     
     current_event = game.events[game.current_event_index]
-    alive_players = [p for p in game.players if p.alive]
+    roster = PlayerRoster.for_game(game)
+    alive_players = roster.alive_players()
     
     if len(alive_players) <= 1:
         game.completed = True
@@ -929,70 +977,23 @@ async def simulate_event_realtime(game_id: str, request: RealtimeSimulationReque
         if alive_players:
             game.winner = max(alive_players, key=lambda p: p.total_score)
         
-        # Calculer les gains VIP à partir des VIPs assignés
-        from routes.vip_routes import active_vips_by_game
-        
-        # Récupérer le niveau de salon VIP utilisé pour cette partie
-        salon_level = game.vip_salon_level if hasattr(game, 'vip_salon_level') else 1
-        
-        # Utiliser la clé de stockage exacte des VIPs pour cette partie
-        vip_key = f"{game_id}_salon_{salon_level}"
-        game_vips = active_vips_by_game.get(vip_key, [])
-        
-        # Si pas trouvé avec la clé de salon, chercher dans tous les niveaux possibles
-        if not game_vips:
-            for level in range(1, 10):
-                test_key = f"{game_id}_salon_{level}"
-                if test_key in active_vips_by_game:
-                    game_vips = active_vips_by_game[test_key]
-                    break
-        
-        # Fallback vers l'ancienne clé pour compatibilité
-        if not game_vips:
-            game_vips = active_vips_by_game.get(game_id, [])
-        
-        if game_vips:
-            game.earnings = sum(vip.viewing_fee for vip in game_vips)
-        else:
-            game.earnings = 0
-        
-        # 🎯 NOUVELLE FONCTIONNALITÉ : Collection automatique des gains VIP dès la fin de partie
-        if game.earnings > 0 and not game.vip_earnings_collected:
-            from routes.gamestate_routes import game_states_db
-            # Définir l'utilisateur par défaut
-            user_id = "default_user"
-            
-            # Ajouter automatiquement les gains VIP au portefeuille du joueur
-            if user_id not in game_states_db:
-                from models.game_models import GameState
-                game_state = GameState(user_id=user_id)
-                game_states_db[user_id] = game_state
-            else:
-                game_state = game_states_db[user_id]
-            
-            # Ajouter les gains au portefeuille du joueur
-            earnings_to_collect = game.earnings
-            game_state.money += earnings_to_collect
-            game_state.game_stats.total_earnings += earnings_to_collect
-            game_state.updated_at = datetime.utcnow()
-            game_states_db[user_id] = game_state
-            
-            # Marquer que les gains ont été collectés automatiquement
-            game.vip_earnings_collected = True
-            
-            print(f"🎭 Gains VIP collectés automatiquement: {earnings_to_collect}$ pour l'utilisateur {user_id}")
-            print(f"💰 Nouveau solde: {game_state.money}$")
+        # Gains VIP des VIPs assignés, collectés automatiquement dès la fin de partie
+        game_vips = _get_game_vips(game_id, game)
+        game.earnings = sum(vip.viewing_fee for vip in game_vips) if game_vips else 0
+        _collect_vip_earnings(game)
         
         games_db[game_id] = game
         raise HTTPException(status_code=400, detail="Partie terminée - pas assez de joueurs")
     
     # Calculer la durée réelle de l'événement
-    import random
-    event_duration = random.randint(current_event.survival_time_min, current_event.survival_time_max)
+    event_duration = game.rng.randint(current_event.survival_time_min, current_event.survival_time_max)
     
     # Pré-calculer tous les résultats de la simulation
     game_groups = {gid: g for gid, g in groups_db.items() if gid.startswith(f"{game_id}_")}
-    final_result = GameService.simulate_event(game.players, current_event, game_groups)
+    final_result = await ExecutorService.run(
+        len(alive_players), GameService.simulate_event,
+        game.players, current_event, game_groups, engine=game.simulation_engine, rng=game.rng, roster=roster
+    )
     
     # Créer la timeline des morts
     deaths_timeline = []
@@ -1000,7 +1001,7 @@ async def simulate_event_realtime(game_id: str, request: RealtimeSimulationReque
     
     for i, eliminated_player in enumerate(final_result.eliminated):
         # Répartir les morts sur la durée de l'événement (éviter la fin pour le suspense)
-        death_time = random.uniform(10, event_duration * 0.85)  # Entre 10 sec et 85% de la durée
+        death_time = game.rng.uniform(10, event_duration * 0.85)  # Entre 10 sec et 85% de la durée
         
         death_info = {
             "time": death_time,
@@ -1017,6 +1018,7 @@ async def simulate_event_realtime(game_id: str, request: RealtimeSimulationReque
     deaths_timeline.sort(key=lambda x: x["time"])
     
     # Sauvegarder la simulation active
+    finished_simulations.pop(game_id, None)
     active_simulations[game_id] = {
         "event": current_event,
         "start_time": datetime.utcnow(),
@@ -1035,23 +1037,116 @@ async def simulate_event_realtime(game_id: str, request: RealtimeSimulationReque
         "total_participants": len(alive_players)
     }
 
+def _simulation_elapsed(simulation: dict) -> float:
+    """Temps de simulation écoulé (figé pendant une pause)"""
+    if simulation.get("is_paused", False):
+        return simulation["elapsed_sim_time_at_pause"]
+    elapsed_real_time = (datetime.utcnow() - simulation["start_time"]).total_seconds()
+    return elapsed_real_time * simulation["speed_multiplier"]
+
+def _death_update(death: dict) -> dict:
+    """Mort de la timeline telle qu'envoyée aux spectateurs"""
+    return {
+        "message": death["message"],
+        "player_name": death["player"]["name"],
+        "player_number": death["player"]["number"]
+    }
+
+async def _finalize_realtime_simulation(game_id: str, simulation: dict):
+    """
+    Applique les résultats d'une simulation en temps réel arrivée à son terme, puis la retire des simulations actives
+    Appelée par le polling et par l'horloge de diffusion : la première qui arrive finalise, l'autre reçoit le résultat.
+    """
+    if simulation.get("finalizing", False):
+        return simulation.get("final_result")
+    simulation["finalizing"] = True
+    
+    try:
+        # 🎯 CORRECTION BUG ÉPREUVE INFINIE : Toujours nettoyer la simulation même en cas d'erreur
+        print(f"🔄 FINALISATION ÉPREUVE: Game {game_id} - Progress 100%, finalisation en cours...")
+        
+        # Appliquer les résultats finaux au jeu
+        game = games_db[game_id]
+        
+        # Mettre à jour les joueurs dans la partie
+        for i, player in enumerate(game.players):
+            # Chercher le joueur dans les résultats pour mettre à jour ses stats
+            for survivor_data in simulation["final_result"].survivors:
+                if survivor_data["number"] == player.number:
+                    game.players[i].kills = survivor_data.get("kills", player.kills)
+                    game.players[i].total_score = survivor_data.get("total_score", player.total_score)
+                    game.players[i].survived_events = survivor_data.get("survived_events", player.survived_events)
+                    break
+            
+            for eliminated_data in simulation["final_result"].eliminated:
+                if eliminated_data["number"] == player.number:
+                    game.players[i].alive = False
+                    
+                    # Vérifier si le joueur éliminé était une célébrité ou un ancien gagnant
+                    if hasattr(player, 'celebrityId') and player.celebrityId:
+                        # Enregistrer la mort de la célébrité
+                        await record_celebrity_death_in_game(player.celebrityId, str(game.id))
+                    break
+        
+        EventLogService.record(game, simulation["final_result"])
+        game.current_event_index += 1
+        
+        # Vérifier si la partie est terminée
+        alive_players_after = PlayerRoster.for_game(game).alive_players()
+        if len(alive_players_after) <= 1 or game.current_event_index >= len(game.events):
+            game.completed = True
+            game.end_time = datetime.utcnow()
+            if alive_players_after:
+                game.winner = max(alive_players_after, key=lambda p: p.total_score)
+            
+            # Gains VIP des VIPs assignés, collectés automatiquement une seule fois (protection d'erreur)
+            try:
+                game_vips = _get_game_vips(game_id, game)
+                game.earnings = sum(vip.viewing_fee for vip in game_vips) if game_vips else 0
+                print(f"💰 CALCUL GAINS VIP (Temps réel): {len(game_vips)} VIPs, {game.earnings:,}$")
+                _collect_vip_earnings(game)
+            except Exception as vip_error:
+                print(f"⚠️ Erreur dans la collection VIP (partie continue): {vip_error}")
+                game.earnings = 0
+            
+            # Sauvegarder automatiquement les statistiques (une erreur n'interrompt pas la partie)
+            await _save_completed_game_statistics(game_id, game)
+        
+        games_db[game_id] = game
+        final_result = simulation["final_result"]
+        
+        print(f"✅ FINALISATION ÉPREUVE RÉUSSIE: Game {game_id} - Simulation nettoyée")
+        
+    except Exception as completion_error:
+        # En cas d'erreur critique, on log mais on continue le nettoyage
+        print(f"❌ ERREUR CRITIQUE LORS DE LA FINALISATION: Game {game_id} - {completion_error}")
+        print("🔄 Nettoyage forcé de la simulation pour éviter un blocage infini...")
+        final_result = simulation.get("final_result", None)
+    
+    finally:
+        # 🎯 CORRECTION CRITIQUE : NETTOYAGE GARANTI DE LA SIMULATION
+        # Cette ligne DOIT toujours s'exécuter pour éviter les épreuves infinies
+        simulation["finalized"] = True
+        finished_simulations[game_id] = simulation
+        if active_simulations.get(game_id) is simulation:
+            del active_simulations[game_id]
+            print(f"🧹 NETTOYAGE FINAL: Simulation {game_id} supprimée des simulations actives")
+        RealtimeFeedService.wake(game_id)
+    
+    return final_result
+
 @router.get("/{game_id}/realtime-updates")
 async def get_realtime_updates(game_id: str):
-    """Récupère les mises à jour en temps réel d'une simulation"""
-    if game_id not in active_simulations:
+    """
+    Récupère les mises à jour en temps réel d'une simulation (polling)
+    Les clients qui le peuvent utilisent plutôt un flux poussé : WebSocket /{game_id}/realtime-ws
+    ou Server-Sent Events /{game_id}/realtime-stream
+    """
+    simulation = active_simulations.get(game_id) or finished_simulations.get(game_id)
+    if simulation is None:
         raise HTTPException(status_code=404, detail="Aucune simulation en cours")
     
-    simulation = active_simulations[game_id]
-    current_time = datetime.utcnow()
-    
-    # Gérer l'état de pause
-    if simulation.get("is_paused", False):
-        # Si en pause, utiliser le temps écoulé sauvegardé
-        elapsed_sim_time = simulation["elapsed_sim_time_at_pause"]
-    else:
-        # Calcul normal du temps écoulé
-        elapsed_real_time = (current_time - simulation["start_time"]).total_seconds()
-        elapsed_sim_time = elapsed_real_time * simulation["speed_multiplier"]
+    elapsed_sim_time = _simulation_elapsed(simulation)
     
     # Calculer la progression
     progress = min(100.0, (elapsed_sim_time / simulation["duration"]) * 100)
@@ -1065,11 +1160,7 @@ async def get_realtime_updates(game_id: str):
         for i in range(deaths_sent, len(deaths_timeline)):
             death = deaths_timeline[i]
             if death["time"] <= elapsed_sim_time:
-                new_deaths.append({
-                    "message": death["message"],
-                    "player_name": death["player"]["name"],
-                    "player_number": death["player"]["number"]
-                })
+                new_deaths.append(_death_update(death))
                 simulation["deaths_sent"] = i + 1
             else:
                 break
@@ -1079,160 +1170,7 @@ async def get_realtime_updates(game_id: str):
     final_result = None
     
     if is_complete:
-        try:
-            # 🎯 CORRECTION BUG ÉPREUVE INFINIE : Toujours nettoyer la simulation même en cas d'erreur
-            print(f"🔄 FINALISATION ÉPREUVE: Game {game_id} - Progress 100%, finalisation en cours...")
-            
-            # Appliquer les résultats finaux au jeu
-            game = games_db[game_id]
-            
-            # Mettre à jour les joueurs dans la partie
-            for i, player in enumerate(game.players):
-                # Chercher le joueur dans les résultats pour mettre à jour ses stats
-                for survivor_data in simulation["final_result"].survivors:
-                    if survivor_data["number"] == player.number:
-                        game.players[i].kills = survivor_data.get("kills", player.kills)
-                        game.players[i].total_score = survivor_data.get("total_score", player.total_score)
-                        game.players[i].survived_events = survivor_data.get("survived_events", player.survived_events)
-                        break
-                
-                for eliminated_data in simulation["final_result"].eliminated:
-                    if eliminated_data["number"] == player.number:
-                        game.players[i].alive = False
-                        
-                        # Vérifier si le joueur éliminé était une célébrité ou un ancien gagnant
-                        if hasattr(player, 'celebrityId') and player.celebrityId:
-                            # Enregistrer la mort de la célébrité
-                            await record_celebrity_death_in_game(player.celebrityId, str(game.id))
-                        break
-            
-            game.event_results.append(simulation["final_result"])
-            game.current_event_index += 1
-            
-            # Vérifier si la partie est terminée
-            alive_players_after = [p for p in game.players if p.alive]
-            if len(alive_players_after) <= 1 or game.current_event_index >= len(game.events):
-                game.completed = True
-                game.end_time = datetime.utcnow()
-                if alive_players_after:
-                    game.winner = max(alive_players_after, key=lambda p: p.total_score)
-                
-                # 🎯 COLLECTION AUTOMATIQUE DES GAINS VIP (avec protection d'erreur)
-                try:
-                    from routes.vip_routes import active_vips_by_game
-                    
-                    # Récupérer le niveau de salon VIP utilisé pour cette partie
-                    salon_level = game.vip_salon_level if hasattr(game, 'vip_salon_level') else 1
-                    
-                    # Utiliser la clé de stockage exacte des VIPs pour cette partie
-                    vip_key = f"{game_id}_salon_{salon_level}"
-                    game_vips = active_vips_by_game.get(vip_key, [])
-                    
-                    # Si pas trouvé avec la clé de salon, chercher dans tous les niveaux possibles
-                    if not game_vips:
-                        for level in range(1, 10):
-                            test_key = f"{game_id}_salon_{level}"
-                            if test_key in active_vips_by_game:
-                                game_vips = active_vips_by_game[test_key]
-                                salon_level = level  # Utiliser le niveau trouvé
-                                break
-                    
-                    # Fallback vers l'ancienne clé pour compatibilité (salon niveau 1)
-                    if not game_vips:
-                        game_vips = active_vips_by_game.get(game_id, [])
-                        salon_level = 1
-                    
-                    if game_vips:
-                        # Calculer les gains réels en additionnant tous les viewing_fee des VIPs
-                        total_vip_earnings = sum(vip.viewing_fee for vip in game_vips)
-                        game.earnings = total_vip_earnings
-                        
-                        print(f"💰 CALCUL GAINS VIP (Temps réel) - Salon niveau {salon_level}: {len(game_vips)} VIPs")
-                        print(f"💰 Total gains VIP: {total_vip_earnings:,}$")
-                    else:
-                        game.earnings = 0
-                        print(f"⚠️ ATTENTION: Aucun VIP trouvé pour la partie {game_id} avec salon niveau {salon_level}")
-                    
-                    # Collection automatique des gains VIP
-                    if game.earnings > 0 and not getattr(game, 'vip_earnings_collected', False):
-                        from routes.gamestate_routes import game_states_db
-                        user_id = "default_user"
-                        
-                        # Ajouter automatiquement les gains VIP au portefeuille du joueur
-                        if user_id not in game_states_db:
-                            from models.game_models import GameState
-                            game_state = GameState(user_id=user_id)
-                            game_states_db[user_id] = game_state
-                        else:
-                            game_state = game_states_db[user_id]
-                        
-                        # Collection automatique des gains
-                        earnings_to_collect = game.earnings
-                        game_state.money += earnings_to_collect
-                        game_state.game_stats.total_earnings += earnings_to_collect
-                        game_state.updated_at = datetime.utcnow()
-                        game_states_db[user_id] = game_state
-                        
-                        # Marquer que les gains ont été collectés automatiquement
-                        game.vip_earnings_collected = True
-                        
-                        print(f"🎭 ✅ GAINS VIP COLLECTÉS AUTOMATIQUEMENT (Temps réel): +{earnings_to_collect:,}$ (Salon niveau {salon_level})")
-                        print(f"💰 Nouveau solde utilisateur: {game_state.money:,}$")
-                        
-                except Exception as vip_error:
-                    print(f"⚠️ Erreur dans la collection VIP (partie continue): {vip_error}")
-                    game.earnings = 0
-                
-                # Sauvegarder automatiquement les statistiques (avec protection d'erreur)
-                try:
-                    from services.statistics_service import StatisticsService
-                    from routes.gamestate_routes import game_states_db
-                    
-                    # Définir l'utilisateur par défaut
-                    user_id = "default_user"
-                    
-                    # Récupérer le classement final pour les statistiques
-                    try:
-                        final_ranking_response = await get_final_ranking(game_id)
-                        final_ranking = final_ranking_response.get('ranking', [])
-                    except:
-                        final_ranking = []
-                    
-                    # Sauvegarder la partie terminée dans les statistiques
-                    StatisticsService.save_completed_game(user_id, game, final_ranking)
-                    
-                    # Mettre à jour les stats de base dans gamestate
-                    if user_id in game_states_db:
-                        game_state = game_states_db[user_id]
-                        game_state.game_stats.total_games_played += 1
-                        # Compter le nombre total de joueurs morts (éliminations)
-                        total_eliminations = len(game.players) - len([p for p in game.players if p.alive])
-                        game_state.game_stats.total_kills += total_eliminations
-                        if hasattr(game, 'earnings'):
-                            game_state.game_stats.total_earnings += game.earnings
-                        game_state.updated_at = datetime.utcnow()
-                        game_states_db[user_id] = game_state
-                        
-                except Exception as stats_error:
-                    print(f"⚠️ Erreur lors de la sauvegarde des statistiques (partie continue): {stats_error}")
-            
-            games_db[game_id] = game
-            final_result = simulation["final_result"]
-            
-            print(f"✅ FINALISATION ÉPREUVE RÉUSSIE: Game {game_id} - Simulation nettoyée")
-            
-        except Exception as completion_error:
-            # En cas d'erreur critique, on log mais on continue le nettoyage
-            print(f"❌ ERREUR CRITIQUE LORS DE LA FINALISATION: Game {game_id} - {completion_error}")
-            print("🔄 Nettoyage forcé de la simulation pour éviter un blocage infini...")
-            final_result = simulation.get("final_result", None)
-        
-        finally:
-            # 🎯 CORRECTION CRITIQUE : NETTOYAGE GARANTI DE LA SIMULATION
-            # Cette ligne DOIT toujours s'exécuter pour éviter les épreuves infinies
-            if game_id in active_simulations:
-                del active_simulations[game_id]
-                print(f"🧹 NETTOYAGE FINAL: Simulation {game_id} supprimée des simulations actives")
+        final_result = await _finalize_realtime_simulation(game_id, simulation)
     
     return RealtimeEventUpdate(
         event_id=simulation["event"].id,
@@ -1246,6 +1184,157 @@ async def get_realtime_updates(game_id: str):
         final_result=final_result
     )
 
+def _realtime_feed_step(game_id: str, simulation: dict):
+    """État courant d'une simulation pour l'horloge de diffusion (finalise la simulation arrivée à son terme)"""
+    async def step() -> dict:
+        timeline = simulation["deaths_timeline"]
+        state = {
+            "event_id": simulation["event"].id,
+            "event_name": simulation["event"].name,
+            "total_duration": simulation["duration"],
+            "speed_multiplier": simulation["speed_multiplier"],
+        }
+        if active_simulations.get(game_id) is not simulation:
+            if not simulation.get("finalized", False):
+                return dict(state, status="stopped")
+            return dict(
+                state, status="complete", elapsed_time=simulation["duration"], progress=100.0,
+                revealed=len(timeline), final_result=simulation["final_result"]
+            )
+        
+        elapsed_sim_time = _simulation_elapsed(simulation)
+        if not simulation.get("is_paused", False) and elapsed_sim_time >= simulation["duration"]:
+            final_result = await _finalize_realtime_simulation(game_id, simulation)
+            return dict(
+                state, status="complete", elapsed_time=simulation["duration"], progress=100.0,
+                revealed=len(timeline), final_result=final_result
+            )
+        
+        revealed = bisect.bisect_right(timeline, elapsed_sim_time, key=lambda death: death["time"])
+        state.update(
+            elapsed_time=elapsed_sim_time,
+            progress=min(100.0, (elapsed_sim_time / simulation["duration"]) * 100),
+            revealed=revealed,
+        )
+        if simulation.get("is_paused", False):
+            return dict(state, status="paused")
+        
+        # Délai réel avant la prochaine mort, ou avant la fin de l'épreuve
+        next_sim_time = timeline[revealed]["time"] if revealed < len(timeline) else simulation["duration"]
+        next_death_in = (next_sim_time - elapsed_sim_time) / simulation["speed_multiplier"]
+        return dict(state, status="running", next_death_in=next_death_in)
+    return step
+
+async def _realtime_messages(game_id: str, simulation: dict, cursor: int = 0):
+    """
+    Messages du flux poussé d'une simulation : (curseur, message), le curseur étant le nombre de morts déjà envoyées
+    Types : 'start', 'deaths' (ordre chronologique), 'progress', 'paused', 'resumed', puis 'complete' ou 'stopped'
+    """
+    yield cursor, {
+        "type": "start",
+        "event_id": simulation["event"].id,
+        "event_name": simulation["event"].name,
+        "total_duration": simulation["duration"],
+        "speed_multiplier": simulation["speed_multiplier"],
+    }
+    timeline = simulation["deaths_timeline"]
+    last_status = None
+    async for state in RealtimeFeedService.subscribe(game_id, _realtime_feed_step(game_id, simulation)):
+        status = state["status"]
+        if status == "stopped":
+            yield cursor, {"type": "stopped"}
+            return
+        
+        if status in ("paused", "running") and last_status in ("paused", "running") and status != last_status:
+            yield cursor, {"type": status if status == "paused" else "resumed", "elapsed_time": state["elapsed_time"]}
+        last_status = status
+        
+        if state["revealed"] > cursor:
+            deaths = [_death_update(death) for death in timeline[cursor:state["revealed"]]]
+            cursor = state["revealed"]
+            yield cursor, {"type": "deaths", "deaths": deaths}
+        
+        yield cursor, {
+            "type": "progress",
+            "elapsed_time": state["elapsed_time"],
+            "total_duration": state["total_duration"],
+            "progress": state["progress"],
+            "speed_multiplier": state["speed_multiplier"],
+            "is_paused": status == "paused",
+        }
+        
+        if status == "complete":
+            yield cursor, {"type": "complete", "final_result": jsonable_encoder(state["final_result"])}
+            return
+
+@router.websocket("/{game_id}/realtime-ws")
+async def realtime_updates_websocket(websocket: WebSocket, game_id: str, cursor: int = 0):
+    """
+    Flux poussé d'une simulation en temps réel : morts, progression, pause/reprise et résultat final
+    Chaque message JSON porte le curseur (nombre de morts reçues) ; `?cursor=` reprend après une reconnexion.
+    Le polling de /{game_id}/realtime-updates reste disponible en repli.
+    """
+    await websocket.accept()
+    simulation = active_simulations.get(game_id) or finished_simulations.get(game_id)
+    if simulation is None:
+        await websocket.send_json({"type": "error", "detail": "Aucune simulation en cours"})
+        await websocket.close(code=4404)
+        return
+    
+    async def push():
+        async for message_cursor, message in _realtime_messages(game_id, simulation, max(0, cursor)):
+            await websocket.send_json(dict(message, cursor=message_cursor))
+    
+    async def drain():
+        # Les messages du client sont ignorés ; la réception sert à détecter la déconnexion
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+    
+    push_task, drain_task = asyncio.create_task(push()), asyncio.create_task(drain())
+    done, pending = await asyncio.wait({push_task, drain_task}, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(push_task, drain_task, return_exceptions=True)
+    if push_task in done and push_task.exception() is None:
+        await websocket.close()
+
+@router.get("/{game_id}/realtime-stream")
+async def realtime_updates_stream(game_id: str, request: Request, last_event_id: Optional[int] = None):
+    """
+    Flux Server-Sent Events d'une simulation en temps réel, pour les clients dont le proxy bloque les WebSockets
+    Mêmes messages que /{game_id}/realtime-ws ; l'id de chaque évènement est le curseur des morts reçues,
+    un client EventSource reconnecté reprend donc là où il s'était arrêté (en-tête Last-Event-ID,
+    ou `?last_event_id=` pour une première connexion). Un commentaire de battement de cœur garde la connexion ouverte.
+    """
+    simulation = active_simulations.get(game_id) or finished_simulations.get(game_id)
+    if simulation is None:
+        raise HTTPException(status_code=404, detail="Aucune simulation en cours")
+    
+    cursor = last_event_id or 0
+    header_cursor = request.headers.get("last-event-id")
+    if header_cursor and header_cursor.isdigit():
+        cursor = int(header_cursor)
+    cursor = min(max(0, cursor), len(simulation["deaths_timeline"]))
+    
+    async def events():
+        yield "retry: 2000\n\n"
+        messages = _realtime_messages(game_id, simulation, cursor)
+        async for item in RealtimeFeedService.with_heartbeats(messages):
+            if item is None:
+                yield ": heartbeat\n\n"
+                continue
+            message_cursor, message = item
+            yield f"id: {message_cursor}\nevent: {message['type']}\ndata: {json.dumps(message)}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/{game_id}/update-simulation-speed")
 async def update_simulation_speed(game_id: str, request: RealtimeSimulationRequest):
     """Met à jour la vitesse de simulation en cours"""
@@ -1270,6 +1359,7 @@ async def update_simulation_speed(game_id: str, request: RealtimeSimulationReque
         simulation["start_time"] = new_start_time
     
     active_simulations[game_id] = simulation
+    RealtimeFeedService.wake(game_id)
     
     return {
         "message": f"Vitesse mise à jour de x{old_speed} à x{request.speed_multiplier}",
@@ -1283,6 +1373,7 @@ async def stop_simulation(game_id: str):
         raise HTTPException(status_code=404, detail="Aucune simulation en cours")
     
     del active_simulations[game_id]
+    RealtimeFeedService.wake(game_id)
     return {"message": "Simulation arrêtée"}
 
 @router.post("/{game_id}/pause-simulation")
@@ -1308,6 +1399,7 @@ async def pause_simulation(game_id: str):
     simulation["elapsed_sim_time_at_pause"] = elapsed_sim_time
     
     active_simulations[game_id] = simulation
+    RealtimeFeedService.wake(game_id)
     
     return {
         "message": "Simulation mise en pause", 
@@ -1342,6 +1434,7 @@ async def resume_simulation(game_id: str):
     simulation.pop("elapsed_sim_time_at_pause", None)
     
     active_simulations[game_id] = simulation
+    RealtimeFeedService.wake(game_id)
     
     return {
         "message": "Simulation reprise",
@@ -1386,7 +1479,7 @@ async def get_vip_earnings_status(game_id: str):
         "already_collected_automatically": False,
         "winner": game.winner.name if game.winner else None,
         "total_players": len(game.players),
-        "alive_players": len([p for p in game.players if p.alive])
+        "alive_players": PlayerRoster.for_game(game).alive_count()
     }
 
 @router.post("/{game_id}/collect-vip-earnings")
@@ -1475,6 +1568,7 @@ async def delete_game(game_id: str, user_id: str = "default_user"):
         game_states_db[user_id] = game_state
         
         del games_db[game_id]
+        _release_game_resources(game_id)
         
         return {
             "message": "Partie supprimée et argent remboursé", 
@@ -1506,7 +1600,7 @@ async def delete_game(game_id: str, user_id: str = "default_user"):
                 game_state = game_states_db[user_id]
                 game_state.game_stats.total_games_played += 1
                 # Compter le nombre total de joueurs morts (éliminations)
-                total_eliminations = len(game.players) - len([p for p in game.players if p.alive])
+                total_eliminations = len(game.players) - PlayerRoster.for_game(game).alive_count()
                 game_state.game_stats.total_kills += total_eliminations
                 if hasattr(game, 'earnings'):
                     game_state.game_stats.total_earnings += game.earnings
@@ -1514,6 +1608,7 @@ async def delete_game(game_id: str, user_id: str = "default_user"):
                 game_states_db[user_id] = game_state
             
             del games_db[game_id]
+            _release_game_resources(game_id)
             
             return {
                 "message": "Partie terminée sauvegardée dans l'historique et supprimée",
@@ -1523,6 +1618,7 @@ async def delete_game(game_id: str, user_id: str = "default_user"):
         except Exception as e:
             # En cas d'erreur de sauvegarde, supprimer quand même la partie
             del games_db[game_id]
+            _release_game_resources(game_id)
             return {
                 "message": "Partie terminée supprimée (erreur sauvegarde historique)",
                 "error": str(e)
@@ -1534,8 +1630,18 @@ async def generate_players(count: int = 100):
     if count < 1 or count > 1000:
         raise HTTPException(status_code=400, detail="Le nombre doit être entre 1 et 1000")
     
-    # Utiliser la nouvelle méthode pour éviter les noms en double
-    players = GameService.generate_multiple_players(count)
+    # Joueurs pré-générés d'abord, puis génération du complément (hors de la boucle d'événements si volumineux)
+    used_names = set()
+    players = PlayerPoolService.take(count, used_names=used_names)
+    remaining_count = count - len(players)
+    if remaining_count > 0:
+        generated = await ExecutorService.run(
+            remaining_count, GameService.generate_players_bulk,
+            remaining_count, len(players) + 1, used_names, pure=True
+        )
+        # Calques du complément résolus comme ceux de la réserve : tous les joueurs de la réponse ont la même forme
+        await ExecutorService.run(remaining_count, portrait_service.resolve_players_portraits, generated)
+        players.extend(generated)
     
     return players
 
@@ -1577,7 +1683,7 @@ async def get_final_ranking(game_id: str, user_id: str = "default_user"):
     game = games_db[game_id]
     
     # Trier les joueurs par score décroissant
-    sorted_players = sorted(game.players, key=lambda p: (p.total_score, p.survived_events, -p.betrayals), reverse=True)
+    sorted_players = [game.players[i] for i in PlayerRoster.for_game(game).ranking_order()]
     
     # Créer le classement avec positions
     ranking = []
@@ -1781,7 +1887,7 @@ async def create_game_groups(game_id: str, request: dict):
     allow_betrayals = request.get("allow_betrayals", False)
     
     # Récupérer les joueurs vivants
-    alive_players = [p for p in game.players if p.alive]
+    alive_players = PlayerRoster.for_game(game).alive_players()
     
     if len(alive_players) < num_groups * min_members:
         raise HTTPException(
@@ -1790,7 +1896,7 @@ async def create_game_groups(game_id: str, request: dict):
         )
     
     # Mélanger les joueurs
-    random.shuffle(alive_players)
+    game.rng.shuffle(alive_players)
     
     groups = []
     player_index = 0
@@ -1805,7 +1911,7 @@ async def create_game_groups(game_id: str, request: dict):
         available_for_this_group = remaining_players - min_needed + min_members
         
         members_count = min(
-            random.randint(min_members, max_members),
+            game.rng.randint(min_members, max_members),
             available_for_this_group,
             remaining_players
         )
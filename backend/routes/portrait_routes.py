@@ -1,13 +1,23 @@
 """
 Routes API pour la génération de portraits par calques
 """
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, Response
 from pydantic import BaseModel
 from typing import Optional, List
+import os
+import time
 import asyncio
 
 from services.portrait_generator_service import portrait_service
+from services.portrait_composite_service import portrait_composites, COMPOSITE_SIZES, DEFAULT_COMPOSITE_SIZE
+from services.portrait_variants import (
+    MEDIA_TYPES, cache_headers, ensure_variants, image_response, negotiate, not_modified, variant_path
+)
+from services.executor_service import ExecutorService
+from services.portrait_job_service import PortraitJobService
+from services.portrait_store import portrait_store
+from services.portrait_catalog import PORTRAIT_LAYERS, is_content_addressed, portrait_catalog
 
 router = APIRouter(prefix="/api/portraits", tags=["portraits"])
 
@@ -85,6 +95,75 @@ async def get_available_portraits(nationality: str, gender: str):
         )
 
 
+@router.get("/composite/{key}")
+async def get_portrait_composite(key: str, request: Request, size: int = DEFAULT_COMPOSITE_SIZE):
+    """
+    Portrait aplati d'un set de calques, `key` étant le nom du set (PlayerPortrait.layer_set)
+    Tailles disponibles : 64, 128 et 256 pixels ; WebP/AVIF si l'en-tête Accept le permet, sinon PNG
+    Seuls les sets adressés par leur contenu sont immuables : un set IA régénéré garde son nom,
+    son composite est donc revalidé par ETag à chaque affichage.
+    """
+    if size not in COMPOSITE_SIZES:
+        raise HTTPException(status_code=400, detail=f"Taille invalide, valeurs possibles : {list(COMPOSITE_SIZES)}")
+    
+    # Cache mémoire lu directement, sinon disque / rendu Pillow hors de la boucle d'événements
+    fmt = negotiate(request.headers.get("accept"))
+    entry = portrait_composites.cached(key, size, fmt)
+    if entry is None:
+        entry = await ExecutorService.run_offloaded(portrait_composites.get, key, size, fmt)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Set de calques introuvable")
+    
+    portrait_store.touch(key)
+    data, etag = entry
+    return image_response(request, data, etag, fmt, immutable=is_content_addressed(key))
+
+
+@router.get("/layers/{layer}/{set_name}")
+async def get_portrait_layer(layer: str, set_name: str, request: Request):
+    """
+    Calque d'un set, en WebP/AVIF si l'en-tête Accept le permet, sinon en PNG (même image que /static/portraits)
+    Les variantes manquantes (calques écrits avant leur introduction) sont créées à la première demande.
+    Comme pour les composites, seuls les sets adressés par leur contenu sont immuables.
+    """
+    if layer not in PORTRAIT_LAYERS:
+        raise HTTPException(status_code=400, detail=f"Calque invalide, valeurs possibles : {list(PORTRAIT_LAYERS)}")
+    if not portrait_catalog.contains(set_name):
+        raise HTTPException(status_code=404, detail="Set de calques introuvable")
+    
+    png_path = portrait_catalog.layer_paths(set_name)[layer]
+    fmt = negotiate(request.headers.get("accept"))
+    path = png_path if fmt == "png" else variant_path(png_path, fmt)
+    if fmt != "png" and not os.path.exists(path):
+        if not await ExecutorService.run_offloaded(ensure_variants, png_path):
+            raise HTTPException(status_code=404, detail="Calque introuvable")
+    try:
+        stat = os.stat(path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="Calque introuvable")
+    
+    portrait_store.touch(set_name)
+    etag = f"{fmt}-{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    headers = cache_headers(etag, immutable=is_content_addressed(set_name))
+    if not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=MEDIA_TYPES[fmt], headers=headers)
+
+
+@router.get("/store")
+async def get_portrait_store_stats():
+    """
+    État du stockage des calques : taille sur disque, quota, sets référencés par les parties,
+    taux de réutilisation des sets existants et évictions
+    """
+    return {
+        "success": True,
+        "store": portrait_store.stats(),
+        "catalog": portrait_catalog.stats(),
+        "composites": portrait_composites.stats(),
+    }
+
+
 @router.get("/regions")
 async def get_available_regions():
     """
@@ -104,55 +183,47 @@ async def batch_generate_portraits(
     variations_per_combination: int = 2
 ):
     """
-    Génère des portraits en lot pour plusieurs nationalités
-    Utile pour pré-générer un ensemble de portraits
+    Lance en arrière-plan la génération de portraits en lot pour plusieurs nationalités
+    Utile pour pré-générer un ensemble de portraits ; l'avancement se suit avec GET /api/portraits/jobs/{job_id}
     """
-    try:
-        if not genders:
-            genders = ['male', 'female']
-        
-        total_generated = 0
-        generation_summary = []
-        
-        for nationality in nationalities:
-            for gender in genders:
-                gender_param = 'male' if gender.upper() == 'M' or gender.lower() == 'male' else 'female'
-                
-                for i in range(variations_per_combination):
-                    try:
-                        portrait_layers = await portrait_service.generate_portrait_layers_set(
-                            nationality=nationality,
-                            gender=gender_param,
-                            age=25,  # Âge par défaut
-                            set_id=i + 1
-                        )
-                        
-                        total_generated += 1
-                        generation_summary.append({
-                            "nationality": nationality,
-                            "gender": gender_param,
-                            "variation": i + 1,
-                            "status": "success"
-                        })
-                    
-                    except Exception as e:
-                        generation_summary.append({
-                            "nationality": nationality,
-                            "gender": gender_param,
-                            "variation": i + 1,
-                            "status": "error",
-                            "error": str(e)
-                        })
-        
-        return {
-            "success": True,
-            "total_generated": total_generated,
-            "total_requested": len(nationalities) * len(genders) * variations_per_combination,
-            "summary": generation_summary
-        }
+    if not genders:
+        genders = ['male', 'female']
+    genders = ['male' if gender.upper() == 'M' or gender.lower() == 'male' else 'female' for gender in genders]
     
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Erreur lors de la génération en lot: {str(e)}"
-        )
+    job = PortraitJobService.submit(nationalities, genders, variations_per_combination)
+    return {
+        "success": True,
+        "job_id": job.id,
+        "total_requested": job.requested,
+        "total_sets": job.total,
+        "status_url": f"/api/portraits/jobs/{job.id}"
+    }
+
+
+@router.post("/pre-render")
+async def pre_render_fallback_portraits(
+    regions: Optional[List[str]] = None,
+    genders: Optional[List[str]] = None
+):
+    """
+    Pré-rend les portraits simples de secours (toutes les couleurs de peau, cheveux et yeux
+    par région et par genre) pour que la sélection n'ait plus jamais à dessiner à la volée
+    """
+    unknown = [region for region in regions or [] if region not in portrait_service.SKIN_COLOR_PALETTES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Régions inconnues : {unknown}")
+    if genders:
+        genders = ['M' if gender.upper() == 'M' or gender.lower() == 'male' else 'F' for gender in genders]
+    
+    start = time.perf_counter()
+    result = await ExecutorService.run_offloaded(portrait_service.pre_render_fallback_portraits, regions, genders)
+    return {"success": True, **result, "duration_seconds": round(time.perf_counter() - start, 2)}
+
+
+@router.get("/jobs/{job_id}")
+async def get_portrait_job(job_id: str):
+    """Avancement d'un travail de génération de portraits"""
+    job = PortraitJobService.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Travail de génération introuvable")
+    return job.to_dict()
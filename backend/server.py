@@ -19,6 +19,12 @@ from routes.vip_routes import router as vip_router
 from routes.group_routes import router as group_router
 from routes.statistics_routes import router as statistics_router
 from routes.portrait_routes import router as portrait_router
+from services.odds_service import OddsService
+from services.executor_service import ExecutorService
+from services.player_pool_service import PlayerPoolService
+from services.portrait_catalog import portrait_catalog
+from services.portrait_job_service import PortraitJobService
+from services.portrait_rasterizer import portrait_rasterizer
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -90,6 +96,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_background_services():
+    await PlayerPoolService.start()
+    await portrait_catalog.start_watching()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+    await PlayerPoolService.stop()
+    await portrait_catalog.stop_watching()
+    await PortraitJobService.shutdown()
+    OddsService.shutdown()
+    portrait_rasterizer.shutdown()
+    ExecutorService.shutdown()
@@ -0,0 +1,155 @@
+"""
+Journal compact des épreuves d'une partie
+Chaque EventResult est compressé en listes d'indices et d'entiers (EventLogEntry)
+au lieu de conserver des copies des joueurs ; les résultats complets sont
+reconstruits à la demande.
+"""
+from typing import Any, Dict, List, Optional
+
+from models.game_models import Game, EventResult, EventLogEntry
+
+
+class EventLogService:
+    """Compression et reconstruction des résultats d'épreuves"""
+
+    @staticmethod
+    def _player_indexes(game: Game) -> dict:
+        return {player.id: index for index, player in enumerate(game.players)}
+
+    @classmethod
+    def compress(cls, game: Game, result: EventResult) -> EventLogEntry:
+        """Convertit un EventResult complet en entrée compacte du journal"""
+        indexes = cls._player_indexes(game)
+        event = next((e for e in game.events if e.id == result.event_id), None)
+
+        cause_table: List[str] = []
+        cause_codes = {}
+        causes = []
+        for eliminated_data in result.eliminated:
+            cause = eliminated_data.get("cause", "")
+            if cause not in cause_codes:
+                cause_codes[cause] = len(cause_table)
+                cause_table.append(cause)
+            causes.append(cause_codes[cause])
+
+        survivors = result.survivors
+        return EventLogEntry(
+            event_id=result.event_id,
+            event_name=result.event_name,
+            decor=event.decor if event else "",
+            total_participants=result.total_participants,
+            survivors=[indexes[s["player"].id] for s in survivors],
+            time_remaining=[s.get("time_remaining", 0) for s in survivors],
+            event_kills=[s.get("event_kills", 0) for s in survivors],
+            scores=[s.get("score", 0) for s in survivors],
+            betrayed=[position for position, s in enumerate(survivors) if s.get("betrayed")],
+            kills=[s.get("kills", 0) for s in survivors],
+            total_scores=[s.get("total_score", 0) for s in survivors],
+            survived_events=[s.get("survived_events", 0) for s in survivors],
+            eliminated=[indexes[e["player"].id] for e in result.eliminated],
+            elimination_times=[e.get("elimination_time", 0) for e in result.eliminated],
+            causes=causes,
+            cause_table=cause_table
+        )
+
+    @classmethod
+    def record(cls, game: Game, result: EventResult) -> EventLogEntry:
+        """Ajoute le résultat d'une épreuve au journal de la partie"""
+        entry = cls.compress(game, result)
+        game.event_log.append(entry)
+        return entry
+
+    @classmethod
+    def rebuild(cls, game: Game, entry: EventLogEntry) -> EventResult:
+        """
+        Reconstruit l'EventResult complet d'une entrée du journal
+        Les statistiques de l'épreuve viennent du journal, "player" référence l'état actuel du joueur
+        """
+        betrayed = set(entry.betrayed)
+        survivors = []
+        for position, index in enumerate(entry.survivors):
+            player = game.players[index]
+            survivors.append({
+                "player": player,
+                "number": player.number,
+                "name": player.name,
+                "time_remaining": entry.time_remaining[position],
+                "event_kills": entry.event_kills[position],
+                "betrayed": position in betrayed,
+                "score": entry.scores[position],
+                "kills": entry.kills[position],
+                "total_score": entry.total_scores[position],
+                "survived_events": entry.survived_events[position]
+            })
+
+        eliminated = []
+        for position, index in enumerate(entry.eliminated):
+            player = game.players[index]
+            eliminated.append({
+                "player": player,
+                "number": player.number,
+                "name": player.name,
+                "elimination_time": entry.elimination_times[position],
+                "cause": entry.cause_table[entry.causes[position]],
+                "decor": entry.decor,
+                "event_name": entry.event_name
+            })
+
+        return EventResult(
+            event_id=entry.event_id,
+            event_name=entry.event_name,
+            survivors=survivors,
+            eliminated=eliminated,
+            total_participants=entry.total_participants
+        )
+
+    @classmethod
+    def slim_results(cls, game: Game) -> List[Dict[str, Any]]:
+        """
+        Résultats des épreuves sans copie des joueurs (id, numéro et nom seulement)
+        Servis dans Game.event_results pour les clients qui lisent encore l'ancien champ.
+        """
+        results = []
+        for entry in game.event_log:
+            betrayed = set(entry.betrayed)
+            survivors = []
+            for position, index in enumerate(entry.survivors):
+                player = game.players[index]
+                survivors.append({
+                    "player_id": player.id,
+                    "number": player.number,
+                    "name": player.name,
+                    "time_remaining": entry.time_remaining[position],
+                    "event_kills": entry.event_kills[position],
+                    "betrayed": position in betrayed,
+                    "score": entry.scores[position],
+                    "kills": entry.kills[position],
+                    "total_score": entry.total_scores[position],
+                    "survived_events": entry.survived_events[position]
+                })
+            eliminated = []
+            for position, index in enumerate(entry.eliminated):
+                player = game.players[index]
+                eliminated.append({
+                    "player_id": player.id,
+                    "number": player.number,
+                    "name": player.name,
+                    "elimination_time": entry.elimination_times[position],
+                    "cause": entry.cause_table[entry.causes[position]],
+                    "decor": entry.decor,
+                    "event_name": entry.event_name
+                })
+            results.append({
+                "event_id": entry.event_id,
+                "event_name": entry.event_name,
+                "survivors": survivors,
+                "eliminated": eliminated,
+                "total_participants": entry.total_participants
+            })
+        return results
+
+    @classmethod
+    def rebuild_all(cls, game: Game, event_index: Optional[int] = None) -> List[EventResult]:
+        """Reconstruit tous les résultats de la partie (ou celui d'une seule épreuve jouée)"""
+        entries = game.event_log if event_index is None else [game.event_log[event_index]]
+        return [cls.rebuild(game, entry) for entry in entries]
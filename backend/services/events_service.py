@@ -1,6 +1,31 @@
 import random
-from typing import List
-from models.game_models import GameEvent, EventType, EventCategory
+from typing import List, Dict, Tuple, NamedTuple
+
+import numpy as np
+
+from models.game_models import GameEvent, EventType, EventCategory, PlayerRole
+from services.player_roster import ROLE_CODES
+
+# Colonne / attribut de stat utilisé par type d'épreuve
+STAT_COLUMNS = {
+    EventType.INTELLIGENCE: 0,
+    EventType.FORCE: 1,
+    EventType.AGILITÉ: 2,
+}
+STAT_ATTRIBUTES = ("intelligence", "force", "agilité")
+MAX_STAT_VALUE = 10
+
+
+class EventBonusTable(NamedTuple):
+    """
+    Table précompilée d'une épreuve : bonus de stat + bonus de rôle x10 - malus de difficulté,
+    indexée par [code du rôle, valeur de la stat de l'épreuve]
+    """
+    stat_column: int
+    stat_attr: str
+    matrix: np.ndarray  # (rôles, MAX_STAT_VALUE + 1), pour les gathers NumPy
+    rows: List[List[float]]  # même contenu en listes Python, pour le moteur classique
+
 
 class EventsService:
     """Service gérant les 80+ épreuves du jeu avec décors et animations uniques"""
@@ -1308,11 +1333,57 @@ class EventsService:
         ]
     
     @classmethod
-    def get_random_death_animation(cls, event: GameEvent) -> str:
+    def get_random_death_animation(cls, event: GameEvent, rng: random.Random = None) -> str:
         """Retourne une animation de mort aléatoire pour une épreuve"""
         if not event.death_animations:
             return "Élimination standard"
-        return random.choice(event.death_animations)
+        return (rng or random).choice(event.death_animations)
+    
+    # Tables de bonus compilées, par (type d'épreuve, difficulté)
+    _BONUS_TABLES: Dict[Tuple[EventType, int], EventBonusTable] = {}
+    
+    @classmethod
+    def get_role_bonus(cls, role: PlayerRole, event_type: EventType) -> float:
+        """Retourne le bonus de rôle pour un type d'épreuve"""
+        if role == PlayerRole.INTELLIGENT and event_type == EventType.INTELLIGENCE:
+            return 0.2
+        elif role == PlayerRole.BRUTE and event_type == EventType.FORCE:
+            return 0.2
+        elif role == PlayerRole.SPORTIF and event_type == EventType.AGILITÉ:
+            return 0.2
+        elif role == PlayerRole.ZERO:
+            return 0.15  # Bonus universel
+        elif role == PlayerRole.PEUREUX:
+            return -0.1
+        else:
+            return 0.05
+    
+    @classmethod
+    def compile_bonus_table(cls, event_type: EventType, difficulty: int) -> EventBonusTable:
+        """Compile la table des bonus (stat + rôle - difficulté) d'un type d'épreuve à une difficulté donnée"""
+        stat_values = np.arange(MAX_STAT_VALUE + 1, dtype=np.float64)
+        difficulty_malus = (difficulty - 5) * 0.5
+        matrix = np.empty((len(ROLE_CODES), MAX_STAT_VALUE + 1), dtype=np.float64)
+        for role, role_code in ROLE_CODES.items():
+            matrix[role_code] = stat_values + cls.get_role_bonus(role, event_type) * 10 - difficulty_malus
+        stat_column = STAT_COLUMNS[event_type]
+        return EventBonusTable(stat_column, STAT_ATTRIBUTES[stat_column], matrix, matrix.tolist())
+    
+    @classmethod
+    def get_bonus_table(cls, event: GameEvent) -> EventBonusTable:
+        """Table de bonus d'une épreuve (précompilée pour GAME_EVENTS, compilée à la volée sinon)"""
+        key = (event.type, event.difficulty)
+        table = cls._BONUS_TABLES.get(key)
+        if table is None:
+            table = cls.compile_bonus_table(event.type, event.difficulty)
+            cls._BONUS_TABLES[key] = table
+        return table
+    
+    @classmethod
+    def compile_all_bonus_tables(cls):
+        """Compile les tables de toutes les épreuves disponibles (appelé à l'import)"""
+        for event in cls.GAME_EVENTS:
+            cls.get_bonus_table(event)
     
     @classmethod
     def get_event_statistics(cls) -> dict:
@@ -1345,4 +1416,8 @@ class EventsService:
             "by_difficulty": by_difficulty,
             "average_elimination_rate": sum(e.elimination_rate for e in cls.GAME_EVENTS) / total_events,
             "final_events_count": len(cls.get_final_events())
-        }
\ No newline at end of file
+        }
+
+
+# Tables de bonus compilées une seule fois, à l'import du module
+EventsService.compile_all_bonus_tables()
@@ -0,0 +1,103 @@
+"""
+Exécution hors de la boucle d'événements pour les traitements lourds
+Les routes confient la simulation et la génération de joueurs à un pool (threads ou processus)
+dès que la taille du travail dépasse un seuil ; en dessous, le travail reste inline.
+
+Configuration (variables d'environnement) :
+  SIMULATION_EXECUTOR           'thread' (défaut), 'process' ou 'inline'
+  SIMULATION_EXECUTOR_WORKERS   taille du pool (défaut : nombre de CPU)
+  SIMULATION_INLINE_THRESHOLD   nombre de joueurs en dessous duquel on reste inline (défaut : 200)
+"""
+import os
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+EXECUTOR_MODES = ("thread", "process", "inline")
+
+
+def process_pool_context():
+    """
+    Contexte multiprocessing des pools de processus : 'forkserver' ('spawn' à défaut), jamais 'fork'.
+    Un fork copierait un processus qui a déjà des threads (pool de threads, boucle d'événements)
+    et pourrait hériter d'un verrou tenu par l'un d'eux.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class ExecutorService:
+    """Pool partagé pour le travail CPU des routes de jeu"""
+
+    MODE = os.getenv("SIMULATION_EXECUTOR", "thread") if os.getenv("SIMULATION_EXECUTOR", "thread") in EXECUTOR_MODES else "thread"
+    MAX_WORKERS = int(os.getenv("SIMULATION_EXECUTOR_WORKERS", str(os.cpu_count() or 1)))
+    INLINE_THRESHOLD = int(os.getenv("SIMULATION_INLINE_THRESHOLD", "200"))
+
+    _thread_pool: Optional[ThreadPoolExecutor] = None
+    _process_pool: Optional[ProcessPoolExecutor] = None
+    _game_locks: Dict[str, asyncio.Lock] = {}
+
+    @classmethod
+    def _get_executor(cls, pure: bool) -> Executor:
+        """
+        Pool à utiliser : les processus ne conviennent qu'aux fonctions pures (résultat renvoyé,
+        aucun objet partagé modifié), les autres passent toujours par le pool de threads
+        """
+        if cls.MODE == "process" and pure:
+            if cls._process_pool is None:
+                cls._process_pool = ProcessPoolExecutor(max_workers=cls.MAX_WORKERS, mp_context=process_pool_context())
+            return cls._process_pool
+        if cls._thread_pool is None:
+            cls._thread_pool = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix="simulation")
+        return cls._thread_pool
+
+    @classmethod
+    async def run(cls, size: int, func: Callable, *args, pure: bool = False, **kwargs) -> Any:
+        """
+        Exécute func(*args, **kwargs) hors de la boucle d'événements si `size` atteint le seuil
+
+        Args:
+            size: taille du travail (nombre de joueurs concernés)
+            pure: True si func ne modifie aucun objet partagé (autorise le pool de processus)
+        """
+        if size < cls.INLINE_THRESHOLD:
+            return func(*args, **kwargs)
+        return await cls.run_offloaded(func, *args, pure=pure, **kwargs)
+
+    @classmethod
+    async def run_offloaded(cls, func: Callable, *args, pure: bool = False, **kwargs) -> Any:
+        """Exécute func(*args, **kwargs) dans le pool quelle que soit la taille (tâches de fond)"""
+        if cls.MODE == "inline":
+            return func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._get_executor(pure), functools.partial(func, *args, **kwargs))
+
+    @classmethod
+    def game_lock(cls, game_id: str) -> asyncio.Lock:
+        """
+        Verrou par partie : la simulation quittant la boucle d'événements, deux requêtes
+        sur la même partie ne doivent plus pouvoir s'entrelacer
+        """
+        lock = cls._game_locks.get(game_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            cls._game_locks[game_id] = lock
+        return lock
+
+    @classmethod
+    def release_game(cls, game_id: str):
+        """Oublie le verrou d'une partie supprimée"""
+        cls._game_locks.pop(game_id, None)
+
+    @classmethod
+    def shutdown(cls):
+        """Arrête les pools (appelé à l'arrêt du serveur)"""
+        if cls._thread_pool is not None:
+            cls._thread_pool.shutdown(wait=False, cancel_futures=True)
+            cls._thread_pool = None
+        if cls._process_pool is not None:
+            cls._process_pool.shutdown(wait=False, cancel_futures=True)
+            cls._process_pool = None
@@ -1,12 +1,16 @@
 import random
+import numpy as np
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from models.game_models import (
     Player, PlayerRole, PlayerStats, PlayerPortrait, PlayerUniform,
-    Game, GameEvent, EventResult, Celebrity, VipCharacter, EventType, EventCategory
+    Game, GameEvent, EventResult, Celebrity, VipCharacter, EventType, EventCategory, uuid4_batch
 )
 from services.events_service import EventsService
-from services.portrait_generator_service import portrait_service
+from services.vectorized_simulation_service import VectorizedSimulationService
+from services.kill_allocator import KillAllocator
+from services.player_roster import PlayerRoster, ROLE_CODES
+from services.name_pool import NamePool, UniqueNameAllocator
 
 class GameService:
     
@@ -71,6 +75,73 @@ class GameService:
         "#FF9456", "#E88A46", "#D18036", "#BA7626", "#A36C16"
     ]
     
+    # Plages de teintes de peau (indices dans SKIN_COLORS) par nationalité
+    SKIN_COLOR_RANGES = {
+        # Asie de l'Est
+        'Chinois': (2, 10),
+        'Coréen': (0, 8),
+        'Japonais': (0, 8),
+    
+        # Europe du Nord
+        'Britannique': (0, 5),
+        'Danois': (0, 4),
+        'Finlandais': (0, 4),
+        'Irlandais': (0, 5),
+        'Islandais': (0, 3),
+        'Norvégien': (0, 4),
+        'Suédois': (0, 4),
+    
+        # Europe de l'Ouest
+        'Allemand': (0, 5),
+        'Autrichien': (0, 5),
+        'Belge': (0, 5),
+        'Français': (0, 5),
+        'Néerlandais': (0, 5),
+        'Suisse': (0, 5),
+    
+        # Europe du Sud
+        'Espagnol': (2, 8),
+        'Grec': (3, 9),
+        'Italien': (2, 8),
+        'Portugais': (2, 8),
+    
+        # Europe de l'Est
+        'Bulgare': (1, 7),
+        'Croate': (1, 7),
+        'Estonien': (0, 4),
+        'Hongrois': (1, 7),
+        'Polonais': (0, 6),
+        'Roumain': (1, 7),
+        'Russe': (0, 6),
+        'Tchèque': (0, 6),
+    
+        # Moyen-Orient
+        'Afghan': (6, 16),
+        'Iranien': (5, 15),
+        'Turc': (4, 12),
+    
+        # Afrique du Nord
+        'Égyptien': (8, 18),
+        'Marocain': (6, 16),
+    
+        # Afrique sub-saharienne
+        'Nigérian': (15, 24),
+    
+        # Asie du Sud et du Sud-Est
+        'Indien': (8, 18),
+        'Indonésien': (6, 16),
+        'Thaïlandais': (4, 14),
+    
+        # Amériques
+        'Américain': (0, 15),
+        'Argentin': (2, 10),
+        'Australien': (0, 8),
+        'Brésilien': (4, 20),
+        'Canadien': (0, 12),
+        'Mexicain': (6, 16),
+    }
+    DEFAULT_SKIN_COLOR_RANGE = (0, 15)
+    
     HAIRSTYLES = [
         "Cheveux courts", "Cheveux longs", "Bob", "Pixie", "Afro", "Dreadlocks",
         "Tresses", "Queue de cheval", "Chignon", "Mohawk", "Undercut", "Fade",
@@ -94,6 +165,9 @@ class GameService:
         "#BA55D3", "#DA70D6", "#EE82EE", "#FF1493", "#FF69B4", "#FFB6C1"
     ]
     
+    EYE_COLORS = ['#8B4513', '#654321', '#2F4F2F', '#483D8B', '#556B2F', '#000000']
+    EYE_SHAPES = ['Amande', 'Rond', 'Allongé', 'Tombant', 'Relevé', 'Petit', 'Grand']
+    
     UNIFORM_STYLES = ["Classic", "Moderne", "Vintage", "Sport", "Élégant"]
     UNIFORM_COLORS = ["Rouge", "Bleu", "Vert", "Jaune", "Rose", "Violet", "Orange", "Noir", "Blanc"]
     UNIFORM_PATTERNS = ["Uni", "Rayures", "Carreaux", "Points", "Floral", "Géométrique"]
@@ -110,11 +184,18 @@ class GameService:
         PlayerRole.ZERO: 0.01
     }
     
+    # Tableaux précalculés pour la génération groupée (generate_players_bulk)
+    ROLE_LIST = tuple(ROLE_PROBABILITIES)
+    ROLE_CUMULATIVE = np.cumsum(list(ROLE_PROBABILITIES.values()))
+    NATIONALITY_KEYS = tuple(NATIONALITIES)
+    GENDERS = ('M', 'F')
+    
     @classmethod
-    def generate_random_player(cls, player_id: int) -> Player:
+    def generate_random_player(cls, player_id: int, rng: random.Random = None) -> Player:
         """Génère un joueur aléatoire selon les probabilités des rôles"""
+        rng = rng or random
         # Sélection du rôle selon les probabilités
-        rand = random.random()
+        rand = rng.random()
         cumulative_probability = 0
         selected_role = PlayerRole.NORMAL
         
@@ -124,41 +205,42 @@ class GameService:
                 selected_role = role
                 break
         
-        nationality_key = random.choice(list(cls.NATIONALITIES.keys()))
-        gender = random.choice(['M', 'F'])
+        nationality_key = rng.choice(list(cls.NATIONALITIES.keys()))
+        gender = rng.choice(['M', 'F'])
         nationality_display = cls.NATIONALITIES[nationality_key][gender]
         
         # Génération des stats selon le rôle
-        stats = cls._generate_stats_by_role(selected_role)
+        stats = cls._generate_stats_by_role(selected_role, rng)
         
-        return Player(
+        return Player.trusted(
             number=str(player_id).zfill(3),
-            name=cls._generate_random_name(nationality_key, gender),
+            name=cls._generate_random_name(nationality_key, gender, rng),
             nationality=nationality_display,
             gender=gender,
             role=selected_role,
             stats=stats,
-            portrait=cls._generate_portrait(nationality_key, gender),
-            uniform=cls._generate_uniform()
+            portrait=cls._generate_portrait(nationality_key, gender, rng),
+            uniform=cls._generate_uniform(rng)
         )
     
     @classmethod
-    def _generate_stats_by_role(cls, role: PlayerRole) -> PlayerStats:
+    def _generate_stats_by_role(cls, role: PlayerRole, rng: random.Random = None) -> PlayerStats:
         """Génère les statistiques selon le rôle"""
+        rng = rng or random
         if role == PlayerRole.SPORTIF:
-            agilite = random.randint(4, 8)
-            force = max(2, min(10, agilite - 2 + random.randint(0, 3)))
+            agilite = rng.randint(4, 8)
+            force = max(2, min(10, agilite - 2 + rng.randint(0, 3)))
             intelligence = max(0, 12 - agilite - force)
         elif role == PlayerRole.BRUTE:
-            force = random.randint(4, 8)
-            agilite = max(2, min(10, force - 2 + random.randint(0, 3)))
+            force = rng.randint(4, 8)
+            agilite = max(2, min(10, force - 2 + rng.randint(0, 3)))
             intelligence = max(0, 12 - force - agilite)
         elif role == PlayerRole.INTELLIGENT:
-            intelligence = random.randint(4, 8)
+            intelligence = rng.randint(4, 8)
             # Bonus +2 aléatoire
-            bonus_stat = random.choice(['intelligence', 'force', 'agilite'])
-            force = random.randint(1, 4)
-            agilite = random.randint(1, 4)
+            bonus_stat = rng.choice(['intelligence', 'force', 'agilite'])
+            force = rng.randint(1, 4)
+            agilite = rng.randint(1, 4)
             if bonus_stat == 'force':
                 force += 2
             elif bonus_stat == 'agilite':
@@ -179,427 +261,253 @@ class GameService:
                     intelligence -= excess
         elif role == PlayerRole.PEUREUX:
             # 8 points totaux
-            intelligence = random.randint(0, 4)
-            force = random.randint(0, 4)
+            intelligence = rng.randint(0, 4)
+            force = rng.randint(0, 4)
             agilite = max(0, 8 - intelligence - force)
         elif role == PlayerRole.ZERO:
-            intelligence = random.randint(4, 10)
-            force = random.randint(4, 10)
-            agilite = random.randint(4, 10)
+            intelligence = rng.randint(4, 10)
+            force = rng.randint(4, 10)
+            agilite = rng.randint(4, 10)
         else:  # NORMAL
             # Distribution équilibrée de 12 points
-            intelligence = random.randint(2, 6)
-            force = random.randint(2, 6)
+            intelligence = rng.randint(2, 6)
+            force = rng.randint(2, 6)
             agilite = max(0, min(10, 12 - intelligence - force))
         
-        return PlayerStats(
+        return PlayerStats.trusted(
             intelligence=max(0, min(10, intelligence)),
             force=max(0, min(10, force)),
             agilité=max(0, min(10, agilite))
         )
     
     @classmethod
-    def _generate_random_name(cls, nationality: str, gender: str) -> str:
+    def _generate_random_name(cls, nationality: str, gender: str, rng: random.Random = None) -> str:
         """Génère un nom complet aléatoire selon la nationalité et le genre"""
-        first_names = {
-            'Afghan': {
-                'M': ['Ahmad', 'Mohammed', 'Abdul', 'Hassan', 'Omar', 'Ali', 'Mahmud', 'Rashid'],
-                'F': ['Fatima', 'Aisha', 'Zara', 'Maryam', 'Layla', 'Nadia', 'Soraya', 'Jamila']
-            },
-            'Allemand': {
-                'M': ['Hans', 'Klaus', 'Jürgen', 'Wolfgang', 'Dieter', 'Günter', 'Helmut', 'Manfred'],
-                'F': ['Ursula', 'Ingrid', 'Gisela', 'Christa', 'Helga', 'Monika', 'Renate', 'Brigitte']
-            },
-            'Argentin': {
-                'M': ['Carlos', 'Juan', 'José', 'Luis', 'Miguel', 'Jorge', 'Roberto', 'Diego'],
-                'F': ['María', 'Ana', 'Carmen', 'Rosa', 'Isabel', 'Teresa', 'Cristina', 'Patricia']
-            },
-            'Australien': {
-                'M': ['Jack', 'William', 'James', 'Benjamin', 'Luke', 'Henry', 'Alexander', 'Mason'],
-                'F': ['Charlotte', 'Ruby', 'Lily', 'Sophie', 'Emily', 'Chloe', 'Mia', 'Grace']
-            },
-            'Autrichien': {
-                'M': ['Johann', 'Franz', 'Karl', 'Josef', 'Georg', 'Anton', 'Heinrich', 'Paul'],
-                'F': ['Maria', 'Anna', 'Elisabeth', 'Theresia', 'Johanna', 'Franziska', 'Katharina', 'Barbara']
-            },
-            'Belge': {
-                'M': ['Jean', 'Pierre', 'Marc', 'Philippe', 'Michel', 'Paul', 'Luc', 'André'],
-                'F': ['Marie', 'Anne', 'Catherine', 'Martine', 'Françoise', 'Monique', 'Christine', 'Isabelle']
-            },
-            'Brésilien': {
-                'M': ['João', 'José', 'Carlos', 'Paulo', 'Pedro', 'Francisco', 'Luiz', 'Marcos'],
-                'F': ['Maria', 'Ana', 'Francisca', 'Antônia', 'Adriana', 'Juliana', 'Márcia', 'Fernanda']
-            },
-            'Britannique': {
-                'M': ['James', 'John', 'Robert', 'Michael', 'William', 'David', 'Richard', 'Charles'],
-                'F': ['Mary', 'Patricia', 'Jennifer', 'Linda', 'Elizabeth', 'Barbara', 'Susan', 'Jessica']
-            },
-            'Bulgare': {
-                'M': ['Georgi', 'Ivan', 'Dimitar', 'Nikolai', 'Stoyan', 'Petar', 'Hristo', 'Stefan'],
-                'F': ['Maria', 'Elena', 'Valentina', 'Gergana', 'Daniela', 'Svetlana', 'Milena', 'Tsveta']
-            },
-            'Canadien': {
-                'M': ['Liam', 'Noah', 'William', 'James', 'Logan', 'Benjamin', 'Mason', 'Ethan'],
-                'F': ['Emma', 'Olivia', 'Ava', 'Isabella', 'Sophia', 'Charlotte', 'Mia', 'Amelia']
-            },
-            'Chinois': {
-                'M': ['Wei', 'Jun', 'Ming', 'Hao', 'Lei', 'Qiang', 'Yang', 'Bin'],
-                'F': ['Li', 'Wang', 'Zhang', 'Liu', 'Chen', 'Yang', 'Zhao', 'Huang']
-            },
-            'Coréen': {
-                'M': ['Min-jun', 'Seo-jun', 'Do-yoon', 'Si-woo', 'Joon-ho', 'Hyun-woo', 'Jin-woo', 'Sung-min'],
-                'F': ['Seo-yeon', 'Min-seo', 'Ji-woo', 'Ha-eun', 'Soo-jin', 'Ye-jin', 'Su-bin', 'Na-eun']
-            },
-            'Croate': {
-                'M': ['Marko', 'Ante', 'Josip', 'Ivan', 'Luka', 'Matej', 'Tomislav', 'Petar'],
-                'F': ['Ana', 'Marija', 'Petra', 'Marijana', 'Ivana', 'Katarina', 'Nikolina', 'Sara']
-            },
-            'Danois': {
-                'M': ['Lars', 'Niels', 'Jens', 'Peter', 'Henrik', 'Thomas', 'Christian', 'Martin'],
-                'F': ['Anne', 'Kirsten', 'Mette', 'Hanne', 'Lene', 'Susanne', 'Camilla', 'Maria']
-            },
-            'Égyptien': {
-                'M': ['Mohamed', 'Ahmed', 'Mahmoud', 'Omar', 'Ali', 'Hassan', 'Khaled', 'Amr'],
-                'F': ['Fatima', 'Aisha', 'Maryam', 'Zeinab', 'Nour', 'Salma', 'Yasmin', 'Nadia']
-            },
-            'Espagnol': {
-                'M': ['Antonio', 'José', 'Francisco', 'David', 'Juan', 'Javier', 'Daniel', 'Carlos'],
-                'F': ['Carmen', 'María', 'Josefa', 'Isabel', 'Ana', 'Pilar', 'Mercedes', 'Dolores']
-            },
-            'Estonien': {
-                'M': ['Jaan', 'Toomas', 'Andres', 'Mart', 'Ants', 'Peeter', 'Kalev', 'Rein'],
-                'F': ['Kadri', 'Kristiina', 'Liis', 'Mari', 'Karin', 'Helen', 'Piret', 'Anne']
-            },
-            'Finlandais': {
-                'M': ['Jukka', 'Mikael', 'Juha', 'Matti', 'Pekka', 'Antti', 'Jari', 'Heikki'],
-                'F': ['Maria', 'Helena', 'Johanna', 'Anna', 'Kaarina', 'Kristiina', 'Margareta', 'Elisabeth']
-            },
-            'Français': {
-                'M': ['Pierre', 'Jean', 'Michel', 'Alain', 'Philippe', 'Nicolas', 'Antoine', 'Julien'],
-                'F': ['Marie', 'Nathalie', 'Isabelle', 'Sylvie', 'Catherine', 'Valérie', 'Christine', 'Sophie']
-            },
-            'Grec': {
-                'M': ['Georgios', 'Ioannis', 'Konstantinos', 'Dimitrios', 'Nikolaos', 'Panagiotis', 'Vasileios', 'Christos'],
-                'F': ['Maria', 'Eleni', 'Aikaterini', 'Vasiliki', 'Sofia', 'Angeliki', 'Georgia', 'Dimitra']
-            },
-            'Hongrois': {
-                'M': ['László', 'József', 'János', 'Zoltán', 'Sándor', 'Gábor', 'Ferenc', 'Attila'],
-                'F': ['Mária', 'Erzsébet', 'Katalin', 'Ilona', 'Éva', 'Anna', 'Zsuzsanna', 'Margit']
-            },
-            'Indien': {
-                'M': ['Rahul', 'Amit', 'Raj', 'Vikash', 'Sunil', 'Ravi', 'Anil', 'Sanjay'],
-                'F': ['Priya', 'Sunita', 'Pooja', 'Kavita', 'Neetu', 'Rekha', 'Geeta', 'Seema']
-            },
-            'Indonésien': {
-                'M': ['Budi', 'Ahmad', 'Agus', 'Andi', 'Bambang', 'Dedi', 'Eko', 'Hadi'],
-                'F': ['Sari', 'Sri', 'Indira', 'Dewi', 'Rina', 'Maya', 'Lestari', 'Wati']
-            },
-            'Iranien': {
-                'M': ['Mohammad', 'Ali', 'Hassan', 'Hossein', 'Reza', 'Ahmad', 'Mehdi', 'Abbas'],
-                'F': ['Fatima', 'Zahra', 'Maryam', 'Narges', 'Somayeh', 'Fatemeh', 'Leila', 'Nasrin']
-            },
-            'Irlandais': {
-                'M': ['Sean', 'Patrick', 'Michael', 'John', 'David', 'Daniel', 'Paul', 'Mark'],
-                'F': ['Mary', 'Margaret', 'Catherine', 'Bridget', 'Anne', 'Patricia', 'Helen', 'Elizabeth']
-            },
-            'Islandais': {
-                'M': ['Jón', 'Sigurdur', 'Guðmundur', 'Gunnar', 'Ólafur', 'Einar', 'Kristján', 'Magnús'],
-                'F': ['Guðrún', 'Anna', 'Kristín', 'Margrét', 'Sigríður', 'Helga', 'Ragnhildur', 'Jóhanna']
-            },
-            'Italien': {
-                'M': ['Giuseppe', 'Antonio', 'Giovanni', 'Mario', 'Francesco', 'Luigi', 'Angelo', 'Vincenzo'],
-                'F': ['Maria', 'Anna', 'Giuseppina', 'Rosa', 'Angela', 'Giovanna', 'Teresa', 'Lucia']
-            },
-            'Japonais': {
-                'M': ['Hiroshi', 'Takeshi', 'Akira', 'Yuki', 'Daiki', 'Haruto', 'Sota', 'Ren'],
-                'F': ['Sakura', 'Yuki', 'Ai', 'Rei', 'Mana', 'Yui', 'Hina', 'Emi']
-            },
-            'Marocain': {
-                'M': ['Mohamed', 'Ahmed', 'Ali', 'Hassan', 'Omar', 'Youssef', 'Khalid', 'Abdelkader'],
-                'F': ['Fatima', 'Aisha', 'Khadija', 'Zahra', 'Amina', 'Nadia', 'Malika', 'Samira']
-            },
-            'Mexicain': {
-                'M': ['José', 'Juan', 'Antonio', 'Jesús', 'Miguel', 'Pedro', 'Alejandro', 'Manuel'],
-                'F': ['María', 'Guadalupe', 'Juana', 'Margarita', 'Francisca', 'Rosa', 'Isabel', 'Teresa']
-            },
-            'Néerlandais': {
-                'M': ['Johannes', 'Gerrit', 'Jan', 'Pieter', 'Cornelis', 'Hendrikus', 'Jacobus', 'Adrianus'],
-                'F': ['Maria', 'Anna', 'Johanna', 'Cornelia', 'Elisabeth', 'Catharina', 'Geertruida', 'Margaretha']
-            },
-            'Nigérian': {
-                'M': ['Chukwu', 'Emeka', 'Ikechukwu', 'Nnamdi', 'Obinna', 'Chijioke', 'Kelechi', 'Chidi'],
-                'F': ['Ngozi', 'Chioma', 'Ifeoma', 'Adaeze', 'Chinwe', 'Nneka', 'Chiamaka', 'Uchechi']
-            },
-            'Norvégien': {
-                'M': ['Ole', 'Lars', 'Nils', 'Erik', 'Hans', 'Knut', 'Magnus', 'Bjørn'],
-                'F': ['Anna', 'Marie', 'Ingrid', 'Karen', 'Astrid', 'Solveig', 'Kari', 'Liv']
-            },
-            'Polonais': {
-                'M': ['Jan', 'Andrzej', 'Krzysztof', 'Stanisław', 'Tomasz', 'Paweł', 'Józef', 'Marcin'],
-                'F': ['Anna', 'Maria', 'Katarzyna', 'Małgorzata', 'Agnieszka', 'Barbara', 'Ewa', 'Elżbieta']
-            },
-            'Portugais': {
-                'M': ['José', 'António', 'João', 'Manuel', 'Francisco', 'Carlos', 'Joaquim', 'Luís'],
-                'F': ['Maria', 'Ana', 'Manuela', 'Helena', 'Fernanda', 'Isabel', 'Paula', 'Conceição']
-            },
-            'Roumain': {
-                'M': ['Ion', 'Gheorghe', 'Nicolae', 'Vasile', 'Dumitru', 'Petre', 'Florin', 'Marian'],
-                'F': ['Maria', 'Ana', 'Elena', 'Ioana', 'Mihaela', 'Cristina', 'Daniela', 'Andreea']
-            },
-            'Russe': {
-                'M': ['Aleksandr', 'Sergei', 'Vladimir', 'Dmitri', 'Andrei', 'Alexei', 'Nikolai', 'Ivan'],
-                'F': ['Elena', 'Olga', 'Irina', 'Tatyana', 'Svetlana', 'Natasha', 'Marina', 'Lyudmila']
-            },
-            'Suédois': {
-                'M': ['Lars', 'Karl', 'Nils', 'Erik', 'Anders', 'Johan', 'Per', 'Olof'],
-                'F': ['Anna', 'Maria', 'Margareta', 'Elisabeth', 'Eva', 'Birgitta', 'Kristina', 'Karin']
-            },
-            'Suisse': {
-                'M': ['Hans', 'Peter', 'Franz', 'Johann', 'Jakob', 'Rudolf', 'Karl', 'Fritz'],
-                'F': ['Maria', 'Anna', 'Elisabeth', 'Rosa', 'Emma', 'Bertha', 'Martha', 'Marie']
-            },
-            'Tchèque': {
-                'M': ['Jan', 'Pavel', 'Petr', 'Tomáš', 'Jiří', 'Josef', 'Miroslav', 'Zdeněk'],
-                'F': ['Marie', 'Jiřina', 'Anna', 'Věra', 'Alena', 'Lenka', 'Hana', 'Jaroslava']
-            },
-            'Thaïlandais': {
-                'M': ['Somchai', 'Surasak', 'Sombat', 'Suwan', 'Prasert', 'Wichai', 'Pornchai', 'Thawatchai'],
-                'F': ['Siriporn', 'Sunisa', 'Pranee', 'Suwanna', 'Malee', 'Pimchai', 'Wanna', 'Sirikul']
-            },
-            'Turc': {
-                'M': ['Mehmet', 'Mustafa', 'Ahmed', 'Ali', 'Hasan', 'İbrahim', 'Osman', 'Süleyman'],
-                'F': ['Fatma', 'Ayşe', 'Emine', 'Hatice', 'Zeynep', 'Elif', 'Meryem', 'Özlem']
-            },
-            'Américain': {
-                'M': ['John', 'Michael', 'David', 'James', 'Robert', 'William', 'Christopher', 'Matthew'],
-                'F': ['Mary', 'Jennifer', 'Linda', 'Patricia', 'Susan', 'Jessica', 'Sarah', 'Karen']
-            }
-        }
-        
-        last_names = {
-            'Afghan': ['Ahmad', 'Khan', 'Shah', 'Ali', 'Rahman', 'Hassan', 'Hussain', 'Mahmud', 'Omar', 'Yusuf'],
-            'Allemand': ['Müller', 'Schmidt', 'Schneider', 'Fischer', 'Weber', 'Meyer', 'Wagner', 'Becker', 'Schulz', 'Hoffmann'],
-            'Argentin': ['González', 'Rodríguez', 'Gómez', 'Fernández', 'López', 'Díaz', 'Martínez', 'Pérez', 'García', 'Sánchez'],
-            'Australien': ['Smith', 'Jones', 'Williams', 'Brown', 'Wilson', 'Taylor', 'Johnson', 'White', 'Martin', 'Anderson'],
-            'Autrichien': ['Gruber', 'Huber', 'Bauer', 'Wagner', 'Müller', 'Pichler', 'Steiner', 'Moser', 'Mayer', 'Hofer'],
-            'Belge': ['Peeters', 'Janssens', 'Maes', 'Jacobs', 'Mertens', 'Willems', 'Claes', 'Goossens', 'Wouters', 'De Smet'],
-            'Brésilien': ['Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira', 'Alves', 'Pereira', 'Lima', 'Gomes'],
-            'Britannique': ['Smith', 'Jones', 'Taylor', 'Williams', 'Brown', 'Davies', 'Evans', 'Wilson', 'Thomas', 'Roberts'],
-            'Bulgare': ['Ivanov', 'Petrov', 'Dimitrov', 'Georgiev', 'Nikolov', 'Todorov', 'Hristov', 'Stoyanov', 'Marinov', 'Angelov'],
-            'Canadien': ['Smith', 'Brown', 'Tremblay', 'Martin', 'Roy', 'Wilson', 'MacDonald', 'Johnson', 'Thompson', 'Anderson'],
-            'Chinois': ['Wang', 'Li', 'Zhang', 'Liu', 'Chen', 'Yang', 'Zhao', 'Huang', 'Zhou', 'Wu', 'Xu', 'Sun'],
-            'Coréen': ['Kim', 'Lee', 'Park', 'Choi', 'Jung', 'Kang', 'Cho', 'Yoon', 'Jang', 'Lim', 'Han', 'Oh'],
-            'Croate': ['Horvat', 'Novak', 'Marić', 'Petrović', 'Jurić', 'Babić', 'Matić', 'Pavić', 'Tomić', 'Kovač'],
-            'Danois': ['Nielsen', 'Jensen', 'Hansen', 'Pedersen', 'Andersen', 'Christensen', 'Larsen', 'Sørensen', 'Rasmussen', 'Jørgensen'],
-            'Égyptien': ['Mohamed', 'Ahmed', 'Mahmoud', 'Hassan', 'Ali', 'Ibrahim', 'Abdel Rahman', 'Omar', 'Khalil', 'Said'],
-            'Espagnol': ['García', 'Rodríguez', 'González', 'Fernández', 'López', 'Martínez', 'Sánchez', 'Pérez', 'Gómez', 'Martín'],
-            'Estonien': ['Tamm', 'Saar', 'Sepp', 'Mägi', 'Kask', 'Kukk', 'Rebane', 'Ilves', 'Pärn', 'Känd'],
-            'Finlandais': ['Korhonen', 'Virtanen', 'Mäkinen', 'Nieminen', 'Mäkelä', 'Hämäläinen', 'Laine', 'Heikkinen', 'Koskinen', 'Järvinen'],
-            'Français': ['Martin', 'Bernard', 'Thomas', 'Petit', 'Robert', 'Richard', 'Durand', 'Dubois', 'Moreau', 'Laurent', 'Simon', 'Michel'],
-            'Grec': ['Papadopoulos', 'Georgiou', 'Dimitriou', 'Nikolaou', 'Ioannou', 'Petrou', 'Andreou', 'Christou', 'Antoniou', 'Stavrou'],
-            'Hongrois': ['Nagy', 'Kovács', 'Tóth', 'Szabó', 'Horváth', 'Varga', 'Kiss', 'Molnár', 'Németh', 'Farkas'],
-            'Indien': ['Sharma', 'Verma', 'Singh', 'Kumar', 'Gupta', 'Agarwal', 'Mishra', 'Jain', 'Patel', 'Yadav'],
-            'Indonésien': ['Sari', 'Dewi', 'Lestari', 'Wati', 'Indira', 'Putri', 'Anggraini', 'Fitria', 'Ningsih', 'Maharani'],
-            'Iranien': ['Hosseini', 'Ahmadi', 'Mohammadi', 'Rezaei', 'Moradi', 'Mousavi', 'Karimi', 'Rahimi', 'Bagheri', 'Hashemi'],
-            'Irlandais': ["O'Brien", "O'Sullivan", 'Murphy', "O'Connor", 'Kelly', 'Ryan', "O'Neill", 'Walsh', 'McCarthy', 'Gallagher'],
-            'Islandais': ['Jónsson', 'Sigurdsson', 'Guðmundsson', 'Einarsson', 'Gunnarsson', 'Ólafsson', 'Kristjánsson', 'Magnússon', 'Stefánsson', 'Þórsson'],
-            'Italien': ['Rossi', 'Russo', 'Ferrari', 'Esposito', 'Bianchi', 'Romano', 'Colombo', 'Ricci', 'Marino', 'Greco'],
-            'Japonais': ['Sato', 'Suzuki', 'Takahashi', 'Tanaka', 'Watanabe', 'Ito', 'Yamamoto', 'Nakamura', 'Kobayashi', 'Kato', 'Yoshida', 'Yamada'],
-            'Marocain': ['Alami', 'Bennani', 'El Idrissi', 'Fassi', 'Tazi', 'Benali', 'Berrada', 'Chakir', 'Lamrani', 'Oudghiri'],
-            'Mexicain': ['González', 'García', 'Martínez', 'López', 'Hernández', 'Pérez', 'Rodríguez', 'Sánchez', 'Ramírez', 'Cruz'],
-            'Néerlandais': ['De Jong', 'Jansen', 'De Vries', 'Van den Berg', 'Van Dijk', 'Bakker', 'Janssen', 'Visser', 'Smit', 'Meijer'],
-            'Nigérian': ['Adebayo', 'Okafor', 'Okoro', 'Eze', 'Nwankwo', 'Okonkwo', 'Ogbonna', 'Chukwu', 'Emeka', 'Ikechukwu'],
-            'Norvégien': ['Hansen', 'Johansen', 'Olsen', 'Larsen', 'Andersen', 'Pedersen', 'Nilsen', 'Kristiansen', 'Jensen', 'Karlsen'],
-            'Polonais': ['Nowak', 'Kowalski', 'Wiśniewski', 'Wójcik', 'Kowalczyk', 'Kamiński', 'Lewandowski', 'Zieliński', 'Szymański', 'Woźniak'],
-            'Portugais': ['Silva', 'Santos', 'Ferreira', 'Pereira', 'Oliveira', 'Costa', 'Rodrigues', 'Martins', 'Jesus', 'Sousa'],
-            'Roumain': ['Popescu', 'Ionescu', 'Popa', 'Stoica', 'Stan', 'Dumitrescu', 'Gheorghe', 'Constantinescu', 'Marin', 'Diaconu'],
-            'Russe': ['Ivanov', 'Smirnov', 'Kuznetsov', 'Popov', 'Sokolov', 'Lebedev', 'Kozlov', 'Novikov', 'Morozov', 'Petrov'],
-            'Suédois': ['Andersson', 'Johansson', 'Karlsson', 'Nilsson', 'Eriksson', 'Larsson', 'Olsson', 'Persson', 'Svensson', 'Gustafsson'],
-            'Suisse': ['Müller', 'Meier', 'Schmid', 'Keller', 'Weber', 'Huber', 'Schneider', 'Meyer', 'Steiner', 'Fischer'],
-            'Tchèque': ['Novák', 'Svoboda', 'Novotný', 'Dvořák', 'Černý', 'Procházka', 'Krejčí', 'Hájek', 'Kratochvíl', 'Horák'],
-            'Thaïlandais': ['Chanthavy', 'Siriporn', 'Somboon', 'Chanpen', 'Kamon', 'Narongsak', 'Prasert', 'Suwan', 'Thawatchai', 'Wichai'],
-            'Turc': ['Yılmaz', 'Kaya', 'Demir', 'Şahin', 'Çelik', 'Yıldız', 'Yıldırım', 'Öztürk', 'Aydin', 'Özkan'],
-            'Américain': ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez', 'Hernandez', 'Lopez']
-        }
-        
-        nationality_first_names = first_names.get(nationality, first_names['Français'])
-        nationality_last_names = last_names.get(nationality, last_names['Français'])
-        
-        gender_first_names = nationality_first_names[gender]
-        first_name = random.choice(gender_first_names)
-        last_name = random.choice(nationality_last_names)
-        
-        return f"{first_name} {last_name}"
+        return NamePool.get(nationality, gender).random_name(rng or random)
     
     @classmethod
-    def _generate_unique_name(cls, nationality: str, gender: str, used_names: set) -> str:
-        """Génère un nom unique qui n'a pas encore été utilisé dans la partie"""
-        max_attempts = 50  # Éviter les boucles infinies si toutes les combinaisons sont épuisées
+    def generate_multiple_players(cls, count: int, rng: random.Random = None) -> List[Player]:
+        """Génère plusieurs joueurs en évitant les noms en double"""
+        return cls.generate_players_bulk(count, rng=rng)
+    
+    @classmethod
+    def _draw_stats_bulk(cls, role_codes: np.ndarray, np_rng: np.random.Generator) -> np.ndarray:
+        """
+        Tire les stats (intelligence, force, agilité) de tous les joueurs en une fois
+        Mêmes distributions par rôle que _generate_stats_by_role, calculées pour tous puis sélectionnées par rôle
+        """
+        n = len(role_codes)
+        
+        def draw(low, high):
+            return np_rng.integers(low, high + 1, size=n)
+        
+        stats = np.empty((n, 3), dtype=np.int64)
+        
+        # NORMAL : distribution équilibrée de 12 points
+        intelligence, force = draw(2, 6), draw(2, 6)
+        normal = (intelligence, force, np.clip(12 - intelligence - force, 0, 10))
+        
+        # SPORTIF / BRUTE : stat principale 4-8, stat secondaire liée
+        main, offset = draw(4, 8), draw(0, 3)
+        secondary = np.clip(main - 2 + offset, 2, 10)
+        remainder = np.maximum(0, 12 - main - secondary)
+        sportif = (remainder, secondary, main)
+        brute = (remainder, main, secondary)
+        
+        # INTELLIGENT : intelligence 4-8, bonus +2 aléatoire puis plafond de 14 points
+        intelligence, force, agilite = draw(4, 8), draw(1, 4), draw(1, 4)
+        bonus_stat = np_rng.integers(0, 3, size=n)
+        intelligence = intelligence + 2 * (bonus_stat == 0)
+        force = force + 2 * (bonus_stat == 1)
+        agilite = agilite + 2 * (bonus_stat == 2)
+        excess = np.maximum(0, intelligence + force + agilite - 14)
+        from_agilite = agilite >= excess
+        from_force = ~from_agilite & (force >= excess - agilite)
+        from_intelligence = ~from_agilite & ~from_force
+        intelligent = (
+            intelligence - excess * from_intelligence,
+            np.where(from_force, force - (excess - agilite), force),
+            np.where(from_agilite, agilite - excess, np.where(from_force, 0, agilite))
+        )
+        
+        # PEUREUX : 8 points totaux
+        intelligence, force = draw(0, 4), draw(0, 4)
+        peureux = (intelligence, force, np.maximum(0, 8 - intelligence - force))
         
-        for attempt in range(max_attempts):
-            name = cls._generate_random_name(nationality, gender)
-            if name not in used_names:
-                used_names.add(name)
-                return name
+        # ZERO : tout entre 4 et 10
+        zero = (draw(4, 10), draw(4, 10), draw(4, 10))
         
-        # Si on n'arrive pas à trouver un nom unique après max_attempts,
-        # on ajoute un suffixe numérique
-        base_name = cls._generate_random_name(nationality, gender)
-        counter = 1
-        while f"{base_name} {counter}" in used_names:
-            counter += 1
+        by_role = {
+            PlayerRole.NORMAL: normal,
+            PlayerRole.SPORTIF: sportif,
+            PlayerRole.BRUTE: brute,
+            PlayerRole.INTELLIGENT: intelligent,
+            PlayerRole.PEUREUX: peureux,
+            PlayerRole.ZERO: zero
+        }
+        for role, columns in by_role.items():
+            mask = role_codes == cls.ROLE_LIST.index(role)
+            for column, values in enumerate(columns):
+                stats[mask, column] = values[mask]
         
-        final_name = f"{base_name} {counter}"
-        used_names.add(final_name)
-        return final_name
+        return np.clip(stats, 0, 10)
     
     @classmethod
-    def generate_multiple_players(cls, count: int) -> List[Player]:
-        """Génère plusieurs joueurs en évitant les noms en double"""
+    def generate_players_bulk(
+        cls,
+        count: int,
+        first_number: int = 1,
+        used_names: Optional[set] = None,
+        rng: random.Random = None,
+        nationality_weights: Optional[Dict[str, float]] = None
+    ) -> List[Player]:
+        """
+        Génère `count` joueurs : rôles, nationalités, genres, stats, apparence et uniformes sont tirés
+        en quelques appels NumPy (générateur dérivé de `rng`, donc reproductible avec la graine
+        de la partie), puis les joueurs sont construits en une seule passe, sans validation pydantic
+        
+        Args:
+            nationality_weights: poids relatifs par nationalité (uniforme si absent)
+        """
+        rng = rng or random
+        if count <= 0:
+            return []
+        np_rng = np.random.default_rng(rng.getrandbits(64))
+        
+        # Rôles selon les probabilités cumulées (même règle que rand <= cumul)
+        role_codes = np.minimum(
+            np.searchsorted(cls.ROLE_CUMULATIVE, np_rng.random(count), side='left'),
+            len(cls.ROLE_LIST) - 1
+        )
+        if nationality_weights:
+            weights = np.array([nationality_weights.get(key, 0.0) for key in cls.NATIONALITY_KEYS], dtype=float)
+            nationality_codes = np_rng.choice(len(cls.NATIONALITY_KEYS), size=count, p=weights / weights.sum())
+        else:
+            nationality_codes = np_rng.integers(0, len(cls.NATIONALITY_KEYS), size=count)
+        gender_codes = np_rng.integers(0, len(cls.GENDERS), size=count)
+        stats = cls._draw_stats_bulk(role_codes, np_rng).tolist()
+        skin_ranges = np.array([
+            cls.SKIN_COLOR_RANGES.get(nationality_key, cls.DEFAULT_SKIN_COLOR_RANGE) for nationality_key in cls.NATIONALITY_KEYS
+        ])[nationality_codes]
+        skin_low = skin_ranges[:, 0]
+        skin_high = np.minimum(skin_ranges[:, 1], len(cls.SKIN_COLORS) - 1)
+        appearance_codes = np.column_stack((
+            skin_low + np.floor(np_rng.random(count) * (skin_high - skin_low + 1)).astype(np.int64),
+            np_rng.integers(0, len(cls.FACE_SHAPES), size=count),
+            np_rng.integers(0, len(cls.HAIRSTYLES), size=count),
+            np_rng.integers(0, len(cls.HAIR_COLORS), size=count),
+            np_rng.integers(0, len(cls.EYE_COLORS), size=count),
+            np_rng.integers(0, len(cls.EYE_SHAPES), size=count)
+        )).tolist()
+        # Calques de portrait résolus plus tard (portrait_service.resolve_portrait_layers) à partir de ces graines
+        layer_seeds = np_rng.integers(0, 2 ** 32, size=count).tolist()
+        uniform_codes = np.column_stack((
+            np_rng.integers(0, len(cls.UNIFORM_STYLES), size=count),
+            np_rng.integers(0, len(cls.UNIFORM_COLORS), size=count),
+            np_rng.integers(0, len(cls.UNIFORM_PATTERNS), size=count)
+        )).tolist()
+        
+        names = UniqueNameAllocator(used_names, rng)
+        ids = uuid4_batch(count)
+        created_at = datetime.utcnow()
         players = []
-        used_names = set()
-        
-        for i in range(1, count + 1):
-            # Sélection du rôle selon les probabilités
-            rand = random.random()
-            cumulative_probability = 0
-            selected_role = PlayerRole.NORMAL
-            
-            for role, probability in cls.ROLE_PROBABILITIES.items():
-                cumulative_probability += probability
-                if rand <= cumulative_probability:
-                    selected_role = role
-                    break
-            
-            nationality_key = random.choice(list(cls.NATIONALITIES.keys()))
-            gender = random.choice(['M', 'F'])
-            nationality_display = cls.NATIONALITIES[nationality_key][gender]
-            
-            # Génération des stats selon le rôle
-            stats = cls._generate_stats_by_role(selected_role)
-            
-            player = Player(
-                number=str(i).zfill(3),
-                name=cls._generate_unique_name(nationality_key, gender, used_names),
-                nationality=nationality_display,
+        for offset, (role_code, nationality_code, gender_code) in enumerate(
+            zip(role_codes.tolist(), nationality_codes.tolist(), gender_codes.tolist())
+        ):
+            nationality_key = cls.NATIONALITY_KEYS[nationality_code]
+            gender = cls.GENDERS[gender_code]
+            intelligence, force, agilite = stats[offset]
+            style, color, pattern = uniform_codes[offset]
+            skin, face, hairstyle, hair, eye_color, eye_shape = appearance_codes[offset]
+            players.append(Player.trusted(
+                id=ids[offset],
+                number=str(first_number + offset).zfill(3),
+                name=names.allocate(nationality_key, gender),
+                nationality=cls.NATIONALITIES[nationality_key][gender],
                 gender=gender,
-                role=selected_role,
-                stats=stats,
-                portrait=cls._generate_portrait(nationality_key, gender),
-                uniform=cls._generate_uniform(),
-                alive=True,
-                health=100,
-                total_score=stats.intelligence + stats.force + stats.agilité
-            )
-            
-            players.append(player)
+                role=cls.ROLE_LIST[role_code],
+                stats=PlayerStats.trusted(intelligence=intelligence, force=force, agilité=agilite),
+                portrait=PlayerPortrait.trusted(
+                    face_shape=cls.FACE_SHAPES[face],
+                    skin_color=cls.SKIN_COLORS[skin],
+                    hairstyle=cls.HAIRSTYLES[hairstyle],
+                    hair_color=cls.HAIR_COLORS[hair],
+                    eye_color=cls.EYE_COLORS[eye_color],
+                    eye_shape=cls.EYE_SHAPES[eye_shape],
+                    layer_nationality=nationality_key,
+                    layer_gender=gender,
+                    layer_seed=layer_seeds[offset]
+                ),
+                uniform=PlayerUniform.trusted(
+                    style=cls.UNIFORM_STYLES[style],
+                    color=cls.UNIFORM_COLORS[color],
+                    pattern=cls.UNIFORM_PATTERNS[pattern]
+                ),
+                total_score=intelligence + force + agilite,
+                created_at=created_at
+            ))
         
         return players
     
     @classmethod
-    def _generate_portrait(cls, nationality: str, gender: str = 'M') -> PlayerPortrait:
-        """Génère un portrait cohérent avec la nationalité et sélectionne les calques PNG"""
-        skin_color_ranges = {
-            # Asie de l'Est
-            'Chinois': (2, 10),
-            'Coréen': (0, 8),
-            'Japonais': (0, 8),
-            
-            # Europe du Nord
-            'Britannique': (0, 5),
-            'Danois': (0, 4),
-            'Finlandais': (0, 4),
-            'Irlandais': (0, 5),
-            'Islandais': (0, 3),
-            'Norvégien': (0, 4),
-            'Suédois': (0, 4),
-            
-            # Europe de l'Ouest
-            'Allemand': (0, 5),
-            'Autrichien': (0, 5),
-            'Belge': (0, 5),
-            'Français': (0, 5),
-            'Néerlandais': (0, 5),
-            'Suisse': (0, 5),
-            
-            # Europe du Sud
-            'Espagnol': (2, 8),
-            'Grec': (3, 9),
-            'Italien': (2, 8),
-            'Portugais': (2, 8),
-            
-            # Europe de l'Est
-            'Bulgare': (1, 7),
-            'Croate': (1, 7),
-            'Estonien': (0, 4),
-            'Hongrois': (1, 7),
-            'Polonais': (0, 6),
-            'Roumain': (1, 7),
-            'Russe': (0, 6),
-            'Tchèque': (0, 6),
-            
-            # Moyen-Orient
-            'Afghan': (6, 16),
-            'Iranien': (5, 15),
-            'Turc': (4, 12),
-            
-            # Afrique du Nord
-            'Égyptien': (8, 18),
-            'Marocain': (6, 16),
-            
-            # Afrique sub-saharienne
-            'Nigérian': (15, 24),
-            
-            # Asie du Sud et du Sud-Est
-            'Indien': (8, 18),
-            'Indonésien': (6, 16),
-            'Thaïlandais': (4, 14),
-            
-            # Amériques
-            'Américain': (0, 15),
-            'Argentin': (2, 10),
-            'Australien': (0, 8),
-            'Brésilien': (4, 20),
-            'Canadien': (0, 12),
-            'Mexicain': (6, 16),
-        }
-        
-        skin_range = skin_color_ranges.get(nationality, (0, 15))
-        skin_color_index = random.randint(skin_range[0], min(skin_range[1], len(cls.SKIN_COLORS) - 1))
-        
-        # Sélectionner des calques PNG cohérents avec la nationalité
-        portrait_layers = portrait_service.select_random_portrait_layers(
-            nationality=nationality,
-            gender=gender
-        )
-        
-        return PlayerPortrait(
-            face_shape=random.choice(cls.FACE_SHAPES),
+    def _generate_portrait(cls, nationality: str, gender: str = 'M', rng: random.Random = None) -> PlayerPortrait:
+        """Génère un portrait cohérent avec la nationalité ; les calques PNG sont résolus plus tard à partir d'une graine"""
+        rng = rng or random
+        skin_range = cls.SKIN_COLOR_RANGES.get(nationality, cls.DEFAULT_SKIN_COLOR_RANGE)
+        skin_color_index = rng.randint(skin_range[0], min(skin_range[1], len(cls.SKIN_COLORS) - 1))
+        
+        return PlayerPortrait.trusted(
+            face_shape=rng.choice(cls.FACE_SHAPES),
             skin_color=cls.SKIN_COLORS[skin_color_index],
-            hairstyle=random.choice(cls.HAIRSTYLES),
-            hair_color=random.choice(cls.HAIR_COLORS),
-            eye_color=random.choice(['#8B4513', '#654321', '#2F4F2F', '#483D8B', '#556B2F', '#000000']),
-            eye_shape=random.choice(['Amande', 'Rond', 'Allongé', 'Tombant', 'Relevé', 'Petit', 'Grand']),
-            # Ajout des calques PNG
-            layer_base=portrait_layers.get('base'),
-            layer_eyes=portrait_layers.get('eyes'),
-            layer_hair=portrait_layers.get('hair'),
-            layer_mouth=portrait_layers.get('mouth'),
-            layer_nose=portrait_layers.get('nose')
+            hairstyle=rng.choice(cls.HAIRSTYLES),
+            hair_color=rng.choice(cls.HAIR_COLORS),
+            eye_color=rng.choice(cls.EYE_COLORS),
+            eye_shape=rng.choice(cls.EYE_SHAPES),
+            # Calques PNG différés (portrait_service.resolve_portrait_layers)
+            layer_nationality=nationality,
+            layer_gender=gender,
+            layer_seed=rng.getrandbits(32)
         )
     
     @classmethod
-    def _generate_uniform(cls) -> PlayerUniform:
+    def _generate_uniform(cls, rng: random.Random = None) -> PlayerUniform:
         """Génère un uniforme aléatoire"""
-        return PlayerUniform(
-            style=random.choice(cls.UNIFORM_STYLES),
-            color=random.choice(cls.UNIFORM_COLORS),
-            pattern=random.choice(cls.UNIFORM_PATTERNS)
+        rng = rng or random
+        return PlayerUniform.trusted(
+            style=rng.choice(cls.UNIFORM_STYLES),
+            color=rng.choice(cls.UNIFORM_COLORS),
+            pattern=rng.choice(cls.UNIFORM_PATTERNS)
         )
     
+    # Moteurs de simulation disponibles (sélectionnables par partie)
+    SIMULATION_ENGINES = ("classic", "vectorized")
+    
     @classmethod
-    def simulate_event(cls, players: List[Player], event: GameEvent, groups: Dict[str, Any] = None) -> EventResult:
+    def simulate_event(
+        cls,
+        players: List[Player],
+        event: GameEvent,
+        groups: Dict[str, Any] = None,
+        engine: str = "classic",
+        rng: random.Random = None,
+        roster: Optional[PlayerRoster] = None
+    ) -> EventResult:
         """Simule une épreuve et retourne les résultats avec animations de mort - VERSION CORRIGÉE avec support des groupes"""
+        rng = rng or random
+        if engine == "vectorized":
+            # Le moteur vectorisé travaille directement sur les colonnes du roster
+            return VectorizedSimulationService.simulate_event(players, event, groups, rng, roster)
+        
+        result = cls._simulate_event_classic(players, event, groups, rng)
+        if roster is not None:
+            # Le moteur classique modifie les objets Player : resynchroniser les colonnes
+            roster.sync_from_players()
+        return result
+    
+    @classmethod
+    def _simulate_event_classic(cls, players: List[Player], event: GameEvent, groups: Dict[str, Any], rng) -> EventResult:
+        """Moteur 'classic' : simulation joueur par joueur sur les objets Player"""
+        
         alive_players = [p for p in players if p.alive]
         survivors = []
         eliminated = []
@@ -626,27 +534,29 @@ class GameService:
             # S'assurer qu'il y a au moins 1 survivant
             target_survivors = max(1, target_survivors)
         
+        # Recensement des groupes (calculé une seule fois) : joueurs vivants par groupe actif
+        group_census = cls._build_group_census(alive_players, groups_dict)
+        
+        # Table précompilée de l'épreuve : bonus de stat + bonus de rôle - malus de difficulté
+        bonus_table = EventsService.get_bonus_table(event)
+        bonus_rows = bonus_table.rows
+        stat_attr = bonus_table.stat_attr
+        
         # Calculer un score de survie pour chaque joueur (stats + rôle + aléatoire + bonus groupe)
         player_scores = []
         for player in alive_players:
-            # Bonus de stats selon le type d'épreuve
-            stat_bonus = cls._get_stat_bonus_for_event(player, event)
-            
-            # Bonus de rôle
-            role_bonus = cls._get_role_bonus_for_event(player, event)
+            # Bonus de stats et de rôle, malus de difficulté : une seule lecture dans la table
+            base_score = bonus_rows[ROLE_CODES[player.role]][getattr(player.stats, stat_attr)]
             
             # Bonus de groupe (coopération)
             group_bonus = 0
-            if player.group_id and player.group_id in groups_dict:
-                # Compter les alliés vivants dans le groupe
-                allies_alive = sum(1 for p in alive_players if p.group_id == player.group_id and p.id != player.id)
+            if player.group_id in group_census:
+                # Alliés vivants dans le groupe (le joueur lui-même exclu)
+                allies_alive = group_census[player.group_id] - 1
                 group_bonus = allies_alive * 0.5  # Bonus de coopération
             
-            # Malus de difficulté
-            difficulty_malus = (event.difficulty - 5) * 0.5
-            
-            # Score de base + bonus - malus + facteur aléatoire RENFORCÉ (augmenté de 0-15 à 0-25)
-            survival_score = stat_bonus + (role_bonus * 10) + group_bonus - difficulty_malus + random.uniform(0, 25)
+            # Score de base + bonus de groupe + facteur aléatoire RENFORCÉ (augmenté de 0-15 à 0-25)
+            survival_score = base_score + group_bonus + rng.uniform(0, 25)
             
             player_scores.append((player, survival_score))
         
@@ -667,7 +577,7 @@ class GameService:
             
             # Mélanger aléatoirement ce groupe PLUSIEURS FOIS pour plus de randomness
             for _ in range(3):  # Triple mélange pour plus d'aléatoire
-                random.shuffle(similar_group)
+                rng.shuffle(similar_group)
             
             final_scores.extend(similar_group)
             i = j
@@ -682,7 +592,7 @@ class GameService:
         for chunk_start in range(0, len(player_scores), chunk_size):
             chunk_end = min(chunk_start + chunk_size, len(player_scores))
             chunk = player_scores[chunk_start:chunk_end]
-            random.shuffle(chunk)
+            rng.shuffle(chunk)
             final_mixed_scores.extend(chunk)
         
         player_scores = final_mixed_scores
@@ -693,7 +603,7 @@ class GameService:
         
         # Traiter les survivants - CORRECTION: initialiser event_kills à 0, sera calculé plus tard
         for player, score in survivors_selected:
-            time_remaining = random.randint(event.survival_time_min // 4, event.survival_time_max // 2)
+            time_remaining = rng.randint(event.survival_time_min // 4, event.survival_time_max // 2)
             
             # Gérer les trahisons selon les groupes
             betrayed = False
@@ -701,7 +611,7 @@ class GameService:
                 # Trahison possible uniquement si autorisée dans le groupe
                 group = groups_dict[player.group_id]
                 if hasattr(group, 'allow_betrayals') and group.allow_betrayals:
-                    betrayed = random.random() < 0.1
+                    betrayed = rng.random() < 0.1
             else:
                 # Pas de groupe = pas de trahison possible
                 betrayed = False
@@ -730,13 +640,13 @@ class GameService:
         # Traiter les éliminés
         for player, score in eliminated_selected:
             player.alive = False
-            death_animation = EventsService.get_random_death_animation(event)
+            death_animation = EventsService.get_random_death_animation(event, rng)
             
             eliminated.append({
                 "player": player,
                 "number": player.number,
                 "name": player.name,
-                "elimination_time": random.randint(10, event.survival_time_max // 2),
+                "elimination_time": rng.randint(10, event.survival_time_max // 2),
                 "cause": death_animation,
                 "decor": event.decor,
                 "event_name": event.name
@@ -747,59 +657,30 @@ class GameService:
             # Calculer le nombre maximum de kills possibles par survivant selon le type d'épreuve
             # CORRECTION: Limite plus stricte - maximum 2 kills par événement pour épreuves de force, 1 pour les autres
             max_kills_per_event = 2 if event.type == EventType.FORCE else 1
-            total_eliminated = len(eliminated)
-            total_survivors = len(survivors)
-            
             # Distribuer les éliminations de manière équitable et réaliste
             eliminated_copy = eliminated.copy()
-            random.shuffle(eliminated_copy)
-            
-            # Tracker des kills par survivant pour CET événement seulement
-            event_kills_tracker = {s["player"].id: 0 for s in survivors}
-            
-            # Distribuer chaque élimination à un survivant
-            for i, eliminated_player_data in enumerate(eliminated_copy):
-                eliminated_player = eliminated_player_data["player"]
-                
-                # Chercher des survivants disponibles (qui n'ont pas atteint leur limite pour CET événement)
-                available_killers = [s for s in survivors if event_kills_tracker[s["player"].id] < max_kills_per_event]
-                
-                # Filtrer pour éviter les kills entre membres du même groupe (sauf si épreuve 1v1)
-                if len(alive_players) > 4:  # Pas une épreuve finale
-                    available_killers = [
-                        s for s in available_killers 
-                        if not (s["player"].group_id and 
-                               s["player"].group_id == eliminated_player.group_id and 
-                               s["player"].group_id in groups_dict)
-                    ]
-                
-                if available_killers:
-                    # Sélectionner un tueur aléatoire parmi les disponibles
-                    killer_data = random.choice(available_killers)
-                    killer = killer_data["player"]
-                    
-                    # Attribuer le kill
-                    killer.killed_players.append(eliminated_player.id)
-                    event_kills_tracker[killer.id] += 1
-                else:
-                    # Si aucun tueur disponible avec les limites strictes, 
-                    # choisir parmi tous les survivants mais limiter à 1 kill supplémentaire
-                    if survivors:
-                        # Prioriser les survivants avec le moins de kills pour cet événement
-                        sorted_survivors = sorted(survivors, key=lambda s: event_kills_tracker[s["player"].id])
-                        killer_data = sorted_survivors[0]
-                        killer = killer_data["player"]
-                        
-                        # Ne pas dépasser 2 kills même dans les cas extrêmes
-                        if event_kills_tracker[killer.id] < 2:
-                            killer.killed_players.append(eliminated_player.id)
-                            event_kills_tracker[killer.id] += 1
-                        # Si tous les survivants ont déjà 2 kills, l'élimination reste sans tueur spécifique
+            rng.shuffle(eliminated_copy)
+            
+            # Attribution groupée : quotas par capacité restante et par groupe (hors kills entre membres
+            # d'un même groupe actif, sauf si épreuve 1v1), repli sur les survivants ayant le moins de kills
+            allocator = KillAllocator(
+                [s["player"].group_id if s["player"].group_id in group_census else None for s in survivors],
+                max_kills_per_event,
+                rng
+            )
+            killers = allocator.allocate(
+                [e["player"].group_id if e["player"].group_id in group_census else None for e in eliminated_copy],
+                exclude_same_group=len(alive_players) > 4  # Pas une épreuve finale
+            )
+            for eliminated_player_data, killer_index in zip(eliminated_copy, killers):
+                # Si tous les survivants ont déjà 2 kills, l'élimination reste sans tueur spécifique
+                if killer_index >= 0:
+                    survivors[killer_index]["player"].killed_players.append(eliminated_player_data["player"].id)
             
             # Mettre à jour les stats des survivants avec les kills réels
-            for survivor_data in survivors:
+            for survivor_index, survivor_data in enumerate(survivors):
                 player = survivor_data["player"]
-                actual_kills = event_kills_tracker[player.id]
+                actual_kills = allocator.event_kills[survivor_index]
                 
                 # Mettre à jour le compteur de kills du joueur
                 player.kills += actual_kills
@@ -826,37 +707,20 @@ class GameService:
         )
     
     @classmethod
-    def _get_stat_bonus_for_event(cls, player: Player, event: GameEvent) -> int:
-        """Retourne le bonus de stat pour une épreuve"""
-        if event.type == EventType.INTELLIGENCE:
-            return player.stats.intelligence
-        elif event.type == EventType.FORCE:
-            return player.stats.force
-        elif event.type == EventType.AGILITÉ:
-            return player.stats.agilité
-        else:
-            return (player.stats.intelligence + player.stats.force + player.stats.agilité) // 3
-    
-    @classmethod
-    def _get_role_bonus_for_event(cls, player: Player, event: GameEvent) -> float:
-        """Retourne le bonus de rôle pour une épreuve"""
-        if player.role == PlayerRole.INTELLIGENT and event.type == EventType.INTELLIGENCE:
-            return 0.2
-        elif player.role == PlayerRole.BRUTE and event.type == EventType.FORCE:
-            return 0.2
-        elif player.role == PlayerRole.SPORTIF and event.type == EventType.AGILITÉ:
-            return 0.2
-        elif player.role == PlayerRole.ZERO:
-            return 0.15  # Bonus universel
-        elif player.role == PlayerRole.PEUREUX:
-            return -0.1
-        else:
-            return 0.05 if event.type in [EventType.INTELLIGENCE, EventType.FORCE, EventType.AGILITÉ] else 0
+    def _build_group_census(cls, alive_players: List[Player], groups_dict: Dict[str, Any]) -> Dict[str, int]:
+        """Compte les joueurs vivants de chaque groupe actif en un seul passage (O(n))"""
+        census = {}
+        for player in alive_players:
+            if player.group_id and player.group_id in groups_dict:
+                census[player.group_id] = census.get(player.group_id, 0) + 1
+        return census
     
     @classmethod
     def generate_celebrities(cls, count: int = 1000) -> List[Celebrity]:
         """Génère une liste de célébrités fictives"""
         celebrities = []
+        ids = uuid4_batch(count)
+        created_at = datetime.utcnow()
         categories = [
             ("Ancien vainqueur", 5, 35000000, 60000000),      # 35-60 millions pour 5 étoiles
             ("Sportif", 4, 15000000, 35000000),               # 15-35 millions pour 4 étoiles
@@ -886,28 +750,28 @@ class GameService:
             
             # Générer des stats selon la catégorie
             if category == "Ancien vainqueur":
-                stats = PlayerStats(
+                stats = PlayerStats.trusted(
                     intelligence=random.randint(7, 10),
                     force=random.randint(6, 9),
                     agilité=random.randint(7, 10)
                 )
                 wins = random.randint(1, 3)
             elif category == "Sportif":
-                stats = PlayerStats(
+                stats = PlayerStats.trusted(
                     intelligence=random.randint(4, 7),
                     force=random.randint(8, 10),
                     agilité=random.randint(8, 10)
                 )
                 wins = 0
             elif category == "Scientifique":
-                stats = PlayerStats(
+                stats = PlayerStats.trusted(
                     intelligence=random.randint(9, 10),
                     force=random.randint(2, 5),
                     agilité=random.randint(3, 6)
                 )
                 wins = 0
             else:
-                stats = PlayerStats(
+                stats = PlayerStats.trusted(
                     intelligence=random.randint(4, 8),
                     force=random.randint(3, 7),
                     agilité=random.randint(4, 8)
@@ -921,7 +785,8 @@ class GameService:
             
             biography = cls._generate_biography(category, name)
             
-            celebrities.append(Celebrity(
+            celebrities.append(Celebrity.trusted(
+                id=ids[i],
                 name=name,
                 category=category,
                 stars=stars,
@@ -929,7 +794,8 @@ class GameService:
                 nationality=nationality_display,
                 wins=wins,
                 stats=stats,
-                biography=biography
+                biography=biography,
+                created_at=created_at
             ))
         
         return celebrities
@@ -973,28 +839,28 @@ class GameService:
         
         # Générer des stats selon la catégorie
         if selected_category == "Ancien vainqueur":
-            stats = PlayerStats(
+            stats = PlayerStats.trusted(
                 intelligence=random.randint(7, 10),
                 force=random.randint(6, 9),
                 agilité=random.randint(7, 10)
             )
             wins = random.randint(1, 3)
         elif selected_category == "Sportif":
-            stats = PlayerStats(
+            stats = PlayerStats.trusted(
                 intelligence=random.randint(4, 7),
                 force=random.randint(8, 10),
                 agilité=random.randint(8, 10)
             )
             wins = 0
         elif selected_category == "Scientifique":
-            stats = PlayerStats(
+            stats = PlayerStats.trusted(
                 intelligence=random.randint(9, 10),
                 force=random.randint(2, 5),
                 agilité=random.randint(3, 6)
             )
             wins = 0
         else:
-            stats = PlayerStats(
+            stats = PlayerStats.trusted(
                 intelligence=random.randint(4, 8),
                 force=random.randint(3, 7),
                 agilité=random.randint(4, 8)
@@ -1016,7 +882,7 @@ class GameService:
         
         biography = cls._generate_biography(selected_category, name)
         
-        return Celebrity(
+        return Celebrity.trusted(
             name=name,
             category=selected_category,
             stars=selected_stars,
@@ -0,0 +1,55 @@
+"""
+Backends de génération d'images pour les calques de portrait
+'openai' passe par gpt-image-1 (emergentintegrations) ; 'stub' dessine localement une image
+déterministe avec Pillow, pour tester la génération en lot hors ligne et sans coût.
+
+Configuration (variables d'environnement) :
+  PORTRAIT_IMAGE_BACKEND   'openai' (défaut) ou 'stub'
+  PORTRAIT_STUB_DELAY      latence simulée par image du backend 'stub', en secondes (défaut : 0)
+"""
+import os
+import io
+import asyncio
+import hashlib
+from typing import List
+
+from PIL import Image, ImageDraw
+
+IMAGE_BACKENDS = ("openai", "stub")
+
+
+class StubImageGeneration:
+    """Même interface que OpenAIImageGeneration, images dessinées localement à partir du prompt"""
+
+    def __init__(self, delay: float = 0.0, size: int = 256):
+        self.delay = delay
+        self.size = size
+
+    def _render(self, prompt: str, index: int) -> bytes:
+        digest = hashlib.sha1(f"{prompt}#{index}".encode("utf-8")).digest()
+        color = tuple(digest[:3]) + (255,)
+        margin = self.size // 8 + digest[3] % (self.size // 8)
+        img = Image.new('RGBA', (self.size, self.size), (0, 0, 0, 0))
+        ImageDraw.Draw(img).ellipse([margin, margin, self.size - margin, self.size - margin], fill=color)
+        buffer = io.BytesIO()
+        img.save(buffer, 'PNG')
+        return buffer.getvalue()
+
+    async def generate_images(self, prompt: str, model: str = "stub", number_of_images: int = 1) -> List[bytes]:
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+        return [self._render(prompt, index) for index in range(number_of_images)]
+
+
+def create_image_backend():
+    """Instancie le backend choisi par PORTRAIT_IMAGE_BACKEND"""
+    backend = os.getenv("PORTRAIT_IMAGE_BACKEND", "openai")
+    if backend not in IMAGE_BACKENDS:
+        print(f"⚠️ PORTRAITS: backend d'images inconnu '{backend}', utilisation de 'openai'")
+        backend = "openai"
+    if backend == "stub":
+        return StubImageGeneration(delay=float(os.getenv("PORTRAIT_STUB_DELAY", "0")))
+
+    from emergentintegrations.llm.openai.image_generation import OpenAIImageGeneration
+    api_key = os.getenv('EMERGENT_LLM_KEY', 'sk-emergent-default')
+    return OpenAIImageGeneration(api_key=api_key)
@@ -0,0 +1,135 @@
+"""
+Attribution groupée des éliminations (kills) aux survivants d'une épreuve
+Respecte la limite de kills par épreuve, le plafond absolu de 2 kills et
+l'exclusion des membres du même groupe, en temps quasi linéaire.
+"""
+import random
+from typing import Dict, Hashable, List, Optional
+
+
+class _Bucket:
+    """Ensemble de survivants avec ajout, retrait et tirage en O(1)"""
+
+    __slots__ = ("items", "positions")
+
+    def __init__(self):
+        self.items: List[int] = []
+        self.positions: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, survivor: int):
+        self.positions[survivor] = len(self.items)
+        self.items.append(survivor)
+
+    def remove(self, survivor: int):
+        position = self.positions.pop(survivor)
+        last = self.items.pop()
+        if last != survivor:
+            self.items[position] = last
+            self.positions[last] = position
+
+    def __contains__(self, survivor: int) -> bool:
+        return survivor in self.positions
+
+
+class KillAllocator:
+    """
+    Répartit les éliminations d'une épreuve entre les survivants
+
+    Structure de quotas :
+      - un pool global des survivants ayant encore de la capacité (tirage uniforme)
+      - des seaux par groupe de ces mêmes survivants, None pour les sans-groupe (exclusion du groupe de la victime)
+      - des seaux par nombre de kills déjà attribués (repli quand personne n'est disponible)
+    """
+
+    HARD_KILL_CAP = 2  # Jamais plus de 2 kills par survivant et par épreuve
+
+    def __init__(self, survivor_groups: List[Optional[Hashable]], max_kills_per_event: int, rng=None):
+        """
+        Args:
+            survivor_groups: groupe actif de chaque survivant (None si aucun)
+            max_kills_per_event: capacité normale de chaque survivant pour cette épreuve
+            rng: source d'aléatoire (module random par défaut)
+        """
+        self.rng = rng or random
+        self.max_kills_per_event = min(max_kills_per_event, self.HARD_KILL_CAP)
+        self.survivor_groups = list(survivor_groups)
+        self.event_kills = [0] * len(self.survivor_groups)
+
+        self._available = _Bucket()
+        self._available_by_group: Dict[Hashable, _Bucket] = {}
+        self._by_kills = [_Bucket() for _ in range(self.HARD_KILL_CAP)]
+
+        for survivor, group in enumerate(self.survivor_groups):
+            self._by_kills[0].add(survivor)
+            if self.max_kills_per_event > 0:
+                self._available.add(survivor)
+                self._available_by_group.setdefault(group, _Bucket()).add(survivor)
+
+    def allocate(self, victim_groups: List[Optional[Hashable]], exclude_same_group: bool = True) -> List[int]:
+        """
+        Attribue un tueur à chaque victime, dans l'ordre fourni
+
+        Returns:
+            Pour chaque victime, l'indice du survivant tueur ou -1 si aucun survivant ne peut la prendre
+        """
+        return [
+            self._allocate_one(group if exclude_same_group else None)
+            for group in victim_groups
+        ]
+
+    def _allocate_one(self, excluded_group: Optional[Hashable]) -> int:
+        killer = self._draw_available(excluded_group)
+        if killer < 0:
+            killer = self._draw_fallback()
+        if killer >= 0:
+            self._record_kill(killer)
+        return killer
+
+    def _draw_available(self, excluded_group: Optional[Hashable]) -> int:
+        """Tirage uniforme parmi les survivants disponibles hors du groupe exclu"""
+        total = len(self._available)
+        excluded = self._available_by_group.get(excluded_group) if excluded_group is not None else None
+        excluded_count = len(excluded) if excluded else 0
+        allowed = total - excluded_count
+        if allowed <= 0:
+            return -1
+
+        items = self._available.items
+        if excluded_count * 2 <= total:
+            # Cas courant : rejet (au plus 2 tirages en moyenne)
+            while True:
+                candidate = items[int(self.rng.random() * total)]
+                if excluded is None or candidate not in excluded:
+                    return candidate
+
+        # Le groupe exclu domine le pool : tirer un rang parmi les seaux des autres groupes
+        rank = int(self.rng.random() * allowed)
+        for group, bucket in self._available_by_group.items():
+            if group == excluded_group:
+                continue
+            if rank < len(bucket):
+                return bucket.items[rank]
+            rank -= len(bucket)
+        return -1
+
+    def _draw_fallback(self) -> int:
+        """Repli : un survivant parmi ceux ayant le moins de kills, sous le plafond absolu"""
+        for bucket in self._by_kills:
+            if bucket:
+                return bucket.items[int(self.rng.random() * len(bucket))]
+        return -1
+
+    def _record_kill(self, killer: int):
+        kills = self.event_kills[killer]
+        self._by_kills[kills].remove(killer)
+        kills += 1
+        self.event_kills[killer] = kills
+        if kills < self.HARD_KILL_CAP:
+            self._by_kills[kills].add(killer)
+
+        if kills >= self.max_kills_per_event and killer in self._available:
+            self._available.remove(killer)
+            self._available_by_group[self.survivor_groups[killer]].remove(killer)
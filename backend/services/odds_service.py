@@ -0,0 +1,216 @@
+"""
+Moteur Monte Carlo des chances de survie
+Rejoue les épreuves restantes d'une partie des milliers de fois sur des tableaux NumPy
+(même noyau de scores et de sélection que le moteur 'vectorized') et répartit les
+essais sur un ProcessPoolExecutor.
+"""
+import os
+import time
+import random
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, NamedTuple, Optional
+
+import numpy as np
+
+from models.game_models import GameEvent, EventType, Player
+from services.player_roster import PlayerRoster, ROLE_CODES
+from services.executor_service import process_pool_context
+from services.vectorized_simulation_service import compute_survival_scores, select_survivors
+
+
+class OddsSnapshot(NamedTuple):
+    """Copie des colonnes des joueurs vivants et des épreuves restantes, prise sous le verrou de la partie"""
+    players: List[Player]
+    stats: np.ndarray
+    role_codes: np.ndarray
+    group_codes: np.ndarray
+    events: List["EventSpec"]
+
+
+class EventSpec(NamedTuple):
+    """Description minimale et sérialisable d'une épreuve (lue par compute_survival_scores)"""
+    type: EventType
+    difficulty: int
+    elimination_rate: float
+    is_final: bool
+    min_players_for_final: int
+
+
+def run_trials(
+    stats: np.ndarray,
+    role_codes: np.ndarray,
+    group_codes: np.ndarray,
+    events: List[EventSpec],
+    trials: int,
+    seed: int,
+    deadline: float,
+    min_trials: int = 0
+) -> Dict[str, Any]:
+    """
+    Noyau exécuté dans les processus : joue `trials` parties complètes sur les tableaux,
+    sans objet pydantic, en s'arrêtant à l'échéance (time.time()) si elle est dépassée
+    une fois au moins `min_trials` parties jouées
+
+    Returns:
+        survived_to_end: nombre de parties terminées en vie, par joueur
+        events_survived: somme des épreuves survécues, par joueur
+        trials: nombre d'essais réellement joués
+    """
+    rng = np.random.default_rng(seed)
+    n = len(role_codes)
+    survived_to_end = np.zeros(n, dtype=np.int64)
+    events_survived = np.zeros(n, dtype=np.int64)
+
+    done = 0
+    while done < trials and (done < min_trials or time.time() < deadline):
+        alive = np.arange(n)
+        for event in events:
+            if len(alive) <= 1:
+                break
+            # Finale reportée s'il reste trop de joueurs (même règle que simulate-event)
+            if event.is_final and len(alive) > event.min_players_for_final:
+                continue
+            if event.is_final:
+                target_survivors = 1
+            else:
+                target_survivors = max(1, int(len(alive) * (1 - event.elimination_rate)))
+
+            # Recensement des groupes parmi les seuls vivants (codes conservés, bincount sur les vivants)
+            scores = compute_survival_scores(stats[alive], role_codes[alive], group_codes[alive], event, rng)
+            alive = alive[select_survivors(scores, target_survivors, rng)]
+            events_survived[alive] += 1
+
+        survived_to_end[alive] += 1
+        done += 1
+
+    return {"survived_to_end": survived_to_end, "events_survived": events_survived, "trials": done}
+
+
+class OddsService:
+    """Estimation des probabilités de survie par joueur et par rôle"""
+
+    DEFAULT_TRIALS = 1000
+    MAX_TRIALS = 100000
+    DEFAULT_TIME_BUDGET = 5.0  # secondes
+    MAX_TIME_BUDGET = 30.0  # secondes
+    MIN_TRIALS_PER_CHUNK = 25
+
+    WORKERS = os.cpu_count() or 1
+
+    _executor: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def get_executor(cls) -> ProcessPoolExecutor:
+        """Pool de processus partagé, créé à la première utilisation"""
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor(max_workers=cls.WORKERS, mp_context=process_pool_context())
+        return cls._executor
+
+    @classmethod
+    def shutdown(cls):
+        """Arrête le pool de processus (appelé à l'arrêt du serveur)"""
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+
+    @staticmethod
+    def build_event_specs(events: List[GameEvent]) -> List[EventSpec]:
+        return [
+            EventSpec(e.type, e.difficulty, e.elimination_rate, e.is_final, e.min_players_for_final)
+            for e in events
+        ]
+
+    @classmethod
+    def snapshot(cls, roster: PlayerRoster, events: List[GameEvent], groups: Dict[str, Any] = None) -> OddsSnapshot:
+        """
+        Copie les colonnes des joueurs vivants (indexation NumPy : copies, pas des vues)
+        À appeler sous ExecutorService.game_lock : la simulation modifie le même roster dans un thread.
+        """
+        alive_idx = roster.alive_indexes()
+        roster.refresh_groups(groups or {})
+        return OddsSnapshot(
+            players=[roster.players[i] for i in alive_idx],
+            stats=roster.stats[alive_idx],
+            role_codes=roster.role_codes[alive_idx],
+            group_codes=roster.group_codes[alive_idx],
+            events=cls.build_event_specs(events)
+        )
+
+    @classmethod
+    async def compute_odds(
+        cls,
+        snapshot: OddsSnapshot,
+        trials: int = DEFAULT_TRIALS,
+        time_budget: float = DEFAULT_TIME_BUDGET
+    ) -> Dict[str, Any]:
+        """
+        Joue `trials` parties (dans la limite de `time_budget` secondes) réparties sur le pool
+        et agrège les probabilités de survie jusqu'à la fin des épreuves ;
+        au moins un essai est joué, même si le budget de temps est épuisé
+        """
+        if len(snapshot.players) == 0:
+            return {"trials": 0, "elapsed": 0.0, "players": [], "roles": {}}
+
+        stats, role_codes, group_codes = snapshot.stats, snapshot.role_codes, snapshot.group_codes
+        alive_players = snapshot.players
+        event_specs = snapshot.events
+        trials = max(1, min(trials, cls.MAX_TRIALS))
+        time_budget = min(time_budget, cls.MAX_TIME_BUDGET)
+
+        # Découper les essais en chunks (plusieurs par processus pour équilibrer la charge)
+        executor = cls.get_executor()
+        chunk_size = max(cls.MIN_TRIALS_PER_CHUNK, -(-trials // (cls.WORKERS * 4)))
+        chunks = [min(chunk_size, trials - start) for start in range(0, trials, chunk_size)]
+
+        start_time = time.time()
+        deadline = start_time + time_budget
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(
+                executor, run_trials, stats, role_codes, group_codes, event_specs,
+                chunk, random.getrandbits(64), deadline, 1 if index == 0 else 0
+            )
+            for index, chunk in enumerate(chunks)
+        ]
+        partials = await asyncio.gather(*futures)
+
+        trials_done = sum(partial["trials"] for partial in partials)
+        survived_to_end = sum(partial["survived_to_end"] for partial in partials)
+        events_survived = sum(partial["events_survived"] for partial in partials)
+        # Le premier chunk joue toujours au moins un essai
+        divisor = trials_done
+
+        players_odds = [
+            {
+                "id": player.id,
+                "number": player.number,
+                "name": player.name,
+                "role": player.role,
+                "survival_probability": round(float(survived_to_end[i]) / divisor, 4),
+                "expected_events_survived": round(float(events_survived[i]) / divisor, 2)
+            }
+            for i, player in enumerate(alive_players)
+        ]
+        players_odds.sort(key=lambda x: x["survival_probability"], reverse=True)
+
+        roles_odds = {}
+        for role, code in ROLE_CODES.items():
+            mask = role_codes == code
+            count = int(mask.sum())
+            if count == 0:
+                continue
+            roles_odds[role.value] = {
+                "players": count,
+                "survival_probability": round(float(survived_to_end[mask].sum()) / (divisor * count), 4),
+                "expected_survivors": round(float(survived_to_end[mask].sum()) / divisor, 2)
+            }
+
+        return {
+            "trials": trials_done,
+            "requested_trials": trials,
+            "elapsed": round(time.time() - start_time, 3),
+            "time_budget_exceeded": trials_done < trials,
+            "players": players_odds,
+            "roles": roles_odds
+        }
@@ -0,0 +1,150 @@
+"""
+Réserve de joueurs pré-générés
+Une tâche de fond garde un stock de joueurs prêts (rôle, stats, nom, portrait) que
+POST /api/games/generate-players et la création de partie consomment instantanément ;
+le stock est re-rempli par lots hors de la boucle d'événements, sous un budget CPU.
+
+Configuration (variables d'environnement) :
+  PLAYER_POOL_SIZE            joueurs gardés prêts (défaut : 2000, 0 désactive la réserve)
+  PLAYER_POOL_NATIONALITIES   mélange de nationalités, ex. "Français:3,Japonais:1" (défaut : uniforme)
+  PLAYER_POOL_CPU_BUDGET      part du temps consacrée au remplissage, entre 0 et 1 (défaut : 0.25)
+  PLAYER_POOL_BATCH_SIZE      joueurs générés par lot (défaut : 100)
+"""
+import os
+import time
+import asyncio
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+from models.game_models import Player
+from services.game_service import GameService
+from services.portrait_generator_service import portrait_service
+from services.portrait_store import portrait_store
+from services.name_pool import UniqueNameAllocator
+from services.executor_service import ExecutorService
+
+# Clé de nationalité d'un joueur à partir de son affichage (forme masculine ou féminine)
+NATIONALITY_KEYS_BY_DISPLAY = {
+    (display, gender): key
+    for key, forms in GameService.NATIONALITIES.items()
+    for gender, display in forms.items()
+}
+
+
+def parse_nationality_mix(spec: str) -> Dict[str, float]:
+    """Convertit "Français:3,Japonais:1" en poids par nationalité (nationalités inconnues ignorées)"""
+    weights = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        key, _, weight = item.partition(":")
+        key = key.strip()
+        if key not in GameService.NATIONALITIES:
+            print(f"⚠️ PLAYER POOL: nationalité inconnue ignorée '{key}'")
+            continue
+        try:
+            weights[key] = float(weight) if weight else 1.0
+        except ValueError:
+            print(f"⚠️ PLAYER POOL: poids invalide pour '{key}': {weight}")
+    return {key: weight for key, weight in weights.items() if weight > 0}
+
+
+class PlayerPoolService:
+    """Stock de joueurs prêts à l'emploi, re-rempli en arrière-plan"""
+
+    TARGET_SIZE = int(os.getenv("PLAYER_POOL_SIZE", "2000"))
+    NATIONALITY_MIX = parse_nationality_mix(os.getenv("PLAYER_POOL_NATIONALITIES", ""))
+    CPU_BUDGET = min(1.0, max(0.01, float(os.getenv("PLAYER_POOL_CPU_BUDGET", "0.25"))))
+    BATCH_SIZE = max(1, int(os.getenv("PLAYER_POOL_BATCH_SIZE", "100")))
+
+    _pool: Deque[Tuple[str, Player]] = deque()
+    _refill_needed: Optional[asyncio.Event] = None
+    _task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def _generate_batch(cls, count: int, nationality_mix: Dict[str, float]) -> List[Tuple[str, Player]]:
+        """
+        Génère un lot de joueurs avec leur clé de nationalité (fonction pure, exécutable dans un processus)
+        Les portraits restent différés : leur résolution écrit sur le disque et met à jour le catalogue et le
+        stockage de ce processus, elle est faite ensuite dans un thread du serveur (resolve_players_portraits).
+        """
+        players = GameService.generate_players_bulk(count, nationality_weights=nationality_mix)
+        return [(NATIONALITY_KEYS_BY_DISPLAY[(player.nationality, player.gender)], player) for player in players]
+
+    @classmethod
+    async def start(cls):
+        """Démarre le remplissage en arrière-plan (appelé au démarrage du serveur)"""
+        if cls.TARGET_SIZE <= 0 or cls._task is not None:
+            return
+        cls._refill_needed = asyncio.Event()
+        cls._task = asyncio.create_task(cls._refill_loop())
+        print(f"🎲 PLAYER POOL: remplissage jusqu'à {cls.TARGET_SIZE} joueurs (budget CPU {cls.CPU_BUDGET:.0%})")
+
+    @classmethod
+    async def stop(cls):
+        """Arrête la tâche de remplissage (appelé à l'arrêt du serveur)"""
+        task, cls._task = cls._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @classmethod
+    async def _refill_loop(cls):
+        while True:
+            while len(cls._pool) < cls.TARGET_SIZE:
+                count = min(cls.BATCH_SIZE, cls.TARGET_SIZE - len(cls._pool))
+                start = time.perf_counter()
+                try:
+                    batch = await ExecutorService.run_offloaded(
+                        cls._generate_batch, count, cls.NATIONALITY_MIX, pure=True
+                    )
+                    # Les joueurs de la réserve sont servis avec leurs calques déjà résolus
+                    await ExecutorService.run_offloaded(
+                        portrait_service.resolve_players_portraits, [player for _, player in batch]
+                    )
+                except Exception as e:
+                    print(f"❌ PLAYER POOL: échec de génération d'un lot: {e}")
+                    await asyncio.sleep(5)
+                    continue
+                cls._pool.extend(batch)
+                # Les sets de portraits des joueurs en réserve ne doivent pas être évincés
+                portrait_store.retain("player-pool", (player.portrait.layer_set for _, player in cls._pool))
+                # Budget CPU : une pause proportionnelle au temps de génération du lot
+                elapsed = time.perf_counter() - start
+                await asyncio.sleep(elapsed * (1 - cls.CPU_BUDGET) / cls.CPU_BUDGET)
+
+            cls._refill_needed.clear()
+            await cls._refill_needed.wait()
+
+    @classmethod
+    def available(cls) -> int:
+        return len(cls._pool)
+
+    @classmethod
+    def take(cls, count: int, first_number: int = 1, used_names: Optional[set] = None) -> List[Player]:
+        """
+        Retire jusqu'à `count` joueurs de la réserve, numérotés à partir de `first_number`
+        Les noms déjà présents dans `used_names` sont remplacés par un nom libre (used_names est mis à jour) ;
+        la liste renvoyée peut être plus courte que demandé si la réserve est vide.
+        """
+        used_names = used_names if used_names is not None else set()
+        names = UniqueNameAllocator(used_names)
+        now = datetime.utcnow()
+        players = []
+        while len(players) < count and cls._pool:
+            nationality_key, player = cls._pool.popleft()
+            player.number = str(first_number + len(players)).zfill(3)
+            player.created_at = now
+            if player.name in used_names:
+                player.name = names.allocate(nationality_key, player.gender)
+            else:
+                used_names.add(player.name)
+            players.append(player)
+
+        # Les joueurs sortis de la réserve n'y sont plus référencés : leurs sets restent protégés jusqu'à leur partie
+        portrait_store.hold(player.portrait.layer_set for player in players)
+        if cls._refill_needed is not None:
+            cls._refill_needed.set()
+        return players
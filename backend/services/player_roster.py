@@ -0,0 +1,82 @@
+"""
+Roster des joueurs en colonnes NumPy (struct-of-arrays)
+Garde à côté de Game.players des colonnes compactes (vivant, kills, score, stats, rôle, groupe)
+lues par le moteur de simulation et les requêtes vivants/classement ; les objets Player
+ne sont mis à jour que pour les lignes modifiées, à la frontière de l'API.
+"""
+from typing import List, Dict, Any
+
+import numpy as np
+
+from models.game_models import Player, PlayerRole, Game
+
+# Codes numériques des rôles (indices des tableaux)
+ROLE_CODES = {role: code for code, role in enumerate(PlayerRole)}
+
+
+class PlayerRoster:
+    """Colonnes des joueurs d'une partie, alignées sur l'ordre de Game.players"""
+
+    def __init__(self, players: List[Player]):
+        self.players = players
+        n = len(players)
+        self.index = {player.id: i for i, player in enumerate(players)}
+        self.stats = np.array(
+            [(p.stats.intelligence, p.stats.force, p.stats.agilité) for p in players],
+            dtype=np.int64
+        ).reshape(n, 3)
+        self.role_codes = np.fromiter((ROLE_CODES[p.role] for p in players), dtype=np.int64, count=n)
+        self.group_codes = np.full(n, -1, dtype=np.int64)
+        self.alive = np.zeros(n, dtype=bool)
+        self.kills = np.zeros(n, dtype=np.int64)
+        self.total_score = np.zeros(n, dtype=np.int64)
+        self.survived_events = np.zeros(n, dtype=np.int64)
+        self.betrayals = np.zeros(n, dtype=np.int64)
+        self.sync_from_players()
+
+    @classmethod
+    def for_game(cls, game: Game) -> "PlayerRoster":
+        """Roster attaché à la partie, reconstruit si la liste des joueurs a été remplacée"""
+        roster = game._roster
+        if roster is None or roster.players is not game.players or len(roster.index) != len(game.players):
+            roster = cls(game.players)
+            game._roster = roster
+        return roster
+
+    def sync_from_players(self):
+        """Relit les colonnes variables depuis les objets Player (après une modification externe)"""
+        players = self.players
+        n = len(players)
+        self.alive[:] = np.fromiter((p.alive for p in players), dtype=bool, count=n)
+        self.kills[:] = np.fromiter((p.kills for p in players), dtype=np.int64, count=n)
+        self.total_score[:] = np.fromiter((p.total_score for p in players), dtype=np.int64, count=n)
+        self.survived_events[:] = np.fromiter((p.survived_events for p in players), dtype=np.int64, count=n)
+        self.betrayals[:] = np.fromiter((p.betrayals for p in players), dtype=np.int64, count=n)
+
+    def refresh_groups(self, groups: Dict[str, Any]):
+        """Recalcule la colonne des groupes actifs (code dans `groups`, -1 si aucun)"""
+        group_index = {group_id: code for code, group_id in enumerate(groups)}
+        if not group_index:
+            self.group_codes.fill(-1)
+            return
+        self.group_codes[:] = np.fromiter(
+            (group_index.get(p.group_id, -1) if p.group_id else -1 for p in self.players),
+            dtype=np.int64, count=len(self.players)
+        )
+
+    def set_alive(self, index: int, alive: bool):
+        self.alive[index] = alive
+        self.players[index].alive = alive
+
+    def alive_indexes(self) -> np.ndarray:
+        return np.flatnonzero(self.alive)
+
+    def alive_count(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def alive_players(self) -> List[Player]:
+        return [self.players[i] for i in np.flatnonzero(self.alive)]
+
+    def ranking_order(self) -> np.ndarray:
+        """Indices triés par (score total, épreuves survécues, -trahisons) décroissants, ordre stable"""
+        return np.lexsort((self.betrayals, -self.survived_events, -self.total_score))
@@ -0,0 +1,177 @@
+"""
+Atlas de portraits par partie : toutes les vignettes d'un roster dans quelques planches (sprite sheets)
+L'écran du roster charge l'index JSON puis une poignée d'images au lieu d'une image par joueur ;
+chaque planche existe en PNG et dans les variantes compressées (WebP, AVIF optionnel).
+Les joueurs d'un même set de calques partagent une vignette ; l'atlas est construit en arrière-plan
+après la création de la partie et reste valable tant que la signature du roster ne change pas
+et qu'aucun de ses sets n'est réécrit ou supprimé (écoute du catalogue, comme les composites).
+
+Configuration (variables d'environnement) :
+  PORTRAIT_ATLAS_TILE_SIZE     côté d'une vignette en pixels (défaut : 64, parmi les tailles des composites)
+  PORTRAIT_ATLAS_SHEET_TILES   vignettes par côté de planche (défaut : 32, soit 1024 vignettes par planche)
+  PORTRAIT_ATLAS_MAX_GAMES     atlas gardés en mémoire (défaut : 64)
+"""
+import os
+import io
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+from PIL import Image
+
+from models.game_models import Player
+from services.portrait_composite_service import PortraitCompositeService, portrait_composites
+from services.portrait_variants import encode_variants
+
+
+@dataclass
+class PortraitAtlas:
+    """Planches d'une partie (par format) et position de chaque joueur"""
+    signature: str
+    tile_size: int
+    # Une entrée par planche : format -> bytes de l'image / ETag
+    sheets: List[Dict[str, bytes]]
+    etags: List[Dict[str, str]]
+    # player_id -> (planche, x, y)
+    positions: Dict[str, tuple]
+    # Sets de calques dessinés dans les planches
+    set_names: frozenset
+    # Empreinte du contenu des planches, dans leur URL : un set réécrit donne une nouvelle URL
+    version: str
+
+
+class PortraitAtlasService:
+    """Construction et cache des atlas de portraits, un par partie"""
+
+    TILE_SIZE = int(os.getenv("PORTRAIT_ATLAS_TILE_SIZE", "64"))
+    SHEET_TILES = max(1, int(os.getenv("PORTRAIT_ATLAS_SHEET_TILES", "32")))
+    MAX_GAMES = int(os.getenv("PORTRAIT_ATLAS_MAX_GAMES", "64"))
+
+    def __init__(self, composites: PortraitCompositeService):
+        self.composites = composites
+        self._atlases: "OrderedDict[str, PortraitAtlas]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Sets modifiés pendant chaque construction en cours (None : ré-indexage complet)
+        self._building: List[Set[Optional[str]]] = []
+        composites.catalog.add_listener(self._invalidate)
+
+    @staticmethod
+    def roster_signature(players: List[Player]) -> str:
+        """Empreinte du roster (joueurs et sets de calques) : l'atlas est reconstruit quand elle change"""
+        digest = hashlib.sha1()
+        for player in players:
+            digest.update(f"{player.id}:{player.portrait.layer_set or ''};".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def get(self, game_id: str, players: List[Player]) -> Optional[PortraitAtlas]:
+        """Atlas en cache s'il correspond toujours au roster"""
+        with self._lock:
+            atlas = self._atlases.get(game_id)
+            if atlas is None or atlas.signature != self.roster_signature(players):
+                return None
+            self._atlases.move_to_end(game_id)
+            return atlas
+
+    def build(self, game_id: str, players: List[Player]) -> PortraitAtlas:
+        """Construit (ou renvoie) l'atlas d'une partie. Bloquant : à appeler hors de la boucle d'événements."""
+        signature = self.roster_signature(players)
+        atlas = self.get(game_id, players)
+        if atlas is not None:
+            return atlas
+        changed: Set[Optional[str]] = set()
+        with self._lock:
+            self._building.append(changed)
+        try:
+            atlas = self._build(signature, players)
+        finally:
+            with self._lock:
+                self._building.remove(changed)
+
+        # Un set réécrit pendant la construction a pu être dessiné dans son ancienne version : atlas servi, pas gardé
+        if self._is_stale(atlas, changed):
+            return atlas
+        with self._lock:
+            self._atlases[game_id] = atlas
+            self._atlases.move_to_end(game_id)
+            while len(self._atlases) > self.MAX_GAMES:
+                self._atlases.popitem(last=False)
+        return atlas
+
+    def _build(self, signature: str, players: List[Player]) -> PortraitAtlas:
+        # Une vignette par set de calques distinct, dans l'ordre d'apparition du roster
+        tiles = list(dict.fromkeys(player.portrait.layer_set for player in players if player.portrait.layer_set))
+        per_sheet = self.SHEET_TILES * self.SHEET_TILES
+        tile_positions: Dict[str, tuple] = {}
+        sheets, etags = [], []
+        for start in range(0, len(tiles), per_sheet):
+            chunk = tiles[start:start + per_sheet]
+            columns = min(len(chunk), self.SHEET_TILES)
+            rows = (len(chunk) + columns - 1) // columns
+            sheet = Image.new('RGBA', (columns * self.TILE_SIZE, rows * self.TILE_SIZE), (0, 0, 0, 0))
+            for offset, set_name in enumerate(chunk):
+                composite = self.composites.get(set_name, self.TILE_SIZE)
+                if composite is None:
+                    continue
+                x, y = (offset % columns) * self.TILE_SIZE, (offset // columns) * self.TILE_SIZE
+                with Image.open(io.BytesIO(composite[0])) as tile:
+                    sheet.paste(tile.convert('RGBA'), (x, y))
+                tile_positions[set_name] = (len(sheets), x, y)
+            encoded = encode_variants(sheet)
+            sheets.append(encoded)
+            etags.append({fmt: hashlib.sha1(data).hexdigest() for fmt, data in encoded.items()})
+
+        positions = {
+            player.id: tile_positions[player.portrait.layer_set]
+            for player in players if player.portrait.layer_set in tile_positions
+        }
+
+        version = hashlib.sha1("".join(sheet_etags["png"] for sheet_etags in etags).encode("utf-8")).hexdigest()[:16]
+        return PortraitAtlas(signature, self.TILE_SIZE, sheets, etags, positions, frozenset(tiles), version)
+
+    def _is_stale(self, atlas: PortraitAtlas, changed: Iterable[Optional[str]]) -> bool:
+        """True si l'un des sets modifiés est dans l'atlas (après un ré-indexage : si l'un de ses sets a disparu)"""
+        for set_name in changed:
+            if set_name is None:
+                if any(not self.composites.catalog.contains(name) for name in atlas.set_names):
+                    return True
+            elif set_name in atlas.set_names:
+                return True
+        return False
+
+    def _invalidate(self, set_name: Optional[str]):
+        """Oublie les atlas qui contiennent un set modifié ; la signature suivante n'est plus servie"""
+        with self._lock:
+            for changed in self._building:
+                changed.add(set_name)
+            atlases = list(self._atlases.items())
+        stale = [game_id for game_id, atlas in atlases if self._is_stale(atlas, (set_name,))]
+        if not stale:
+            return
+        with self._lock:
+            for game_id in stale:
+                self._atlases.pop(game_id, None)
+
+    def release(self, game_id: str):
+        """Oublie l'atlas d'une partie supprimée"""
+        with self._lock:
+            self._atlases.pop(game_id, None)
+
+    @staticmethod
+    def index(atlas: PortraitAtlas, sheet_url: str) -> dict:
+        """Index JSON de l'atlas ; `sheet_url` contient {version} et {sheet}"""
+        return {
+            "signature": atlas.signature,
+            "version": atlas.version,
+            "tile_size": atlas.tile_size,
+            "sheets": [sheet_url.format(version=atlas.version, sheet=sheet) for sheet in range(len(atlas.sheets))],
+            "players": {
+                player_id: {"sheet": sheet, "x": x, "y": y}
+                for player_id, (sheet, x, y) in atlas.positions.items()
+            },
+        }
+
+
+# Instance globale
+portrait_atlases = PortraitAtlasService(portrait_composites)
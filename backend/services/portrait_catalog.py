@@ -0,0 +1,241 @@
+"""
+Index en mémoire des calques de portrait disponibles sur le disque
+Les sets complets (base, yeux, cheveux, bouche, nez) sont indexés par (région, genre) :
+la sélection d'un portrait devient un tirage en mémoire, sans os.listdir ni os.path.exists.
+L'index est construit une fois au démarrage, complété par les générateurs à chaque écriture,
+et re-parcouru quand le contenu des répertoires change (surveillance par mtime).
+
+Configuration (variables d'environnement) :
+  PORTRAIT_CATALOG_RESCAN_SECONDS   intervalle de surveillance des répertoires (défaut : 30, 0 désactive)
+"""
+import os
+import re
+import random
+import asyncio
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from services.executor_service import ExecutorService
+
+PORTRAIT_LAYERS = ('base', 'eyes', 'hair', 'mouth', 'nose')
+PORTRAITS_ROOT = "/app/backend/static/portraits"
+
+# "{région}_{M|F}_..." -> région, genre (les noms de région sont en minuscules)
+SET_NAME_PATTERN = re.compile(r'^(?P<region>[a-z_]+?)_(?P<gender>[MF])_')
+
+
+def layer_url(layer: str, set_name: str) -> str:
+    return f"/static/portraits/{layer}/{set_name}_{layer}.png"
+
+
+def set_layers(set_name: str) -> Dict[str, str]:
+    """Chemins publics des cinq calques d'un set"""
+    return {layer: layer_url(layer, set_name) for layer in PORTRAIT_LAYERS}
+
+
+def set_name_from_layer(path: Optional[str]) -> Optional[str]:
+    """Nom du set d'un chemin de calque ("/static/portraits/base/{set}_base.png" -> "{set}")"""
+    if not path:
+        return None
+    filename = path.rsplit('/', 1)[-1]
+    for layer in PORTRAIT_LAYERS:
+        suffix = f"_{layer}.png"
+        if filename.endswith(suffix):
+            return filename[:-len(suffix)]
+    return None
+
+
+def is_content_addressed(set_name: str) -> bool:
+    """
+    True pour les sets nommés par l'empreinte de leurs paramètres (rendus Pillow "_simple_") :
+    un même nom désigne toujours les mêmes images. Les sets générés par IA sont réécrits sous le même nom.
+    """
+    return "_simple_" in set_name
+
+
+class PortraitCatalog:
+    """Sets de calques complets, indexés par (région, genre 'M'/'F')"""
+
+    RESCAN_SECONDS = float(os.getenv("PORTRAIT_CATALOG_RESCAN_SECONDS", "30"))
+
+    def __init__(self, base_path: str = PORTRAITS_ROOT):
+        self.base_path = base_path
+        self._lock = threading.Lock()
+        self._partial: Dict[str, Set[str]] = {}
+        self._complete: Dict[Tuple[str, str], Dict[str, None]] = {}
+        # Instantanés immuables lus sans verrou par pick()
+        self._choices: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._dir_mtimes: Dict[str, float] = {}
+        self._watch_task: Optional[asyncio.Task] = None
+        # Appelés avec le nom du set quand ses fichiers changent (caches dérivés des calques)
+        self._listeners: List[Callable[[Optional[str]], None]] = []
+        self.rescan()
+
+    def _layer_dir(self, layer: str) -> str:
+        return os.path.join(self.base_path, layer)
+
+    def _snapshot_mtimes(self) -> Dict[str, float]:
+        mtimes = {}
+        for layer in PORTRAIT_LAYERS:
+            try:
+                mtimes[layer] = os.stat(self._layer_dir(layer)).st_mtime
+            except OSError:
+                mtimes[layer] = 0.0
+        return mtimes
+
+    def rescan(self) -> int:
+        """Reconstruit l'index depuis le disque (un parcours par répertoire de calque), renvoie le nombre de sets"""
+        mtimes = self._snapshot_mtimes()
+        layers_by_set: Dict[str, Set[str]] = {}
+        for layer in PORTRAIT_LAYERS:
+            suffix = f"_{layer}.png"
+            try:
+                entries = os.scandir(self._layer_dir(layer))
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix):
+                        layers_by_set.setdefault(entry.name[:-len(suffix)], set()).add(layer)
+
+        with self._lock:
+            self._partial = {}
+            self._complete = {}
+            for set_name, layers in layers_by_set.items():
+                if len(layers) == len(PORTRAIT_LAYERS):
+                    self._index(set_name)
+                else:
+                    self._partial[set_name] = layers
+            self._choices = {key: tuple(sets) for key, sets in self._complete.items()}
+            self._dir_mtimes = mtimes
+            count = sum(len(sets) for sets in self._complete.values())
+        self._notify(None)
+        return count
+
+    def _index(self, set_name: str) -> Optional[Tuple[str, str]]:
+        match = SET_NAME_PATTERN.match(set_name)
+        if match is None:
+            return None
+        key = (match.group('region'), match.group('gender'))
+        self._complete.setdefault(key, {})[set_name] = None
+        return key
+
+    def add_layer(self, layer: str, set_name: str):
+        """Signale l'écriture d'un calque ; le set devient sélectionnable une fois ses cinq calques écrits"""
+        with self._lock:
+            layers = self._partial.setdefault(set_name, set())
+            layers.add(layer)
+            if len(layers) < len(PORTRAIT_LAYERS):
+                return
+            del self._partial[set_name]
+            key = self._index(set_name)
+            if key is not None:
+                self._choices[key] = tuple(self._complete[key])
+        self._notify(set_name)
+
+    def add_set(self, set_name: str):
+        """Signale l'écriture d'un set complet"""
+        for layer in PORTRAIT_LAYERS:
+            self.add_layer(layer, set_name)
+
+    def add_sets(self, set_names: Iterable[str]):
+        """Signale l'écriture d'un lot de sets complets (une seule notification, comme un ré-indexage)"""
+        set_names = list(set_names)
+        if len(set_names) == 1:
+            self.add_set(set_names[0])
+            return
+        with self._lock:
+            touched = set()
+            for set_name in set_names:
+                self._partial.pop(set_name, None)
+                key = self._index(set_name)
+                if key is not None:
+                    touched.add(key)
+            for key in touched:
+                self._choices[key] = tuple(self._complete[key])
+        self._notify(None)
+
+    def discard_set(self, set_name: str):
+        """Retire un set de l'index (fichiers supprimés)"""
+        with self._lock:
+            self._partial.pop(set_name, None)
+            match = SET_NAME_PATTERN.match(set_name)
+            if match is None:
+                return
+            key = (match.group('region'), match.group('gender'))
+            sets = self._complete.get(key)
+            if sets is not None and set_name in sets:
+                del sets[set_name]
+                self._choices[key] = tuple(sets)
+        self._notify(set_name)
+
+    def add_listener(self, listener: Callable[[Optional[str]], None]):
+        """Enregistre un rappel appelé avec le nom d'un set modifié (None après un ré-indexage complet)"""
+        self._listeners.append(listener)
+
+    def _notify(self, set_name: Optional[str]):
+        for listener in self._listeners:
+            listener(set_name)
+
+    def contains(self, set_name: str) -> bool:
+        """True si le set est complet et indexé"""
+        match = SET_NAME_PATTERN.match(set_name)
+        return match is not None and set_name in self._complete.get((match.group('region'), match.group('gender')), {})
+
+    def all_sets(self) -> List[str]:
+        """Noms de tous les sets complets indexés"""
+        return [set_name for choices in self._choices.values() for set_name in choices]
+
+    def layer_paths(self, set_name: str) -> Dict[str, str]:
+        """Chemins disque des cinq calques d'un set"""
+        return {layer: os.path.join(self._layer_dir(layer), f"{set_name}_{layer}.png") for layer in PORTRAIT_LAYERS}
+
+    def sets_for(self, region: str, gender: str) -> List[Dict[str, str]]:
+        """Sets complets d'une région et d'un genre ('M'/'F')"""
+        return [set_layers(set_name) for set_name in self._choices.get((region, gender), ())]
+
+    def pick(self, region: str, gender: str, rng: random.Random = None) -> Optional[Dict[str, str]]:
+        """Tire un set complet au hasard (None si aucun set pour cette région et ce genre)"""
+        choices = self._choices.get((region, gender))
+        if not choices:
+            return None
+        return set_layers((rng or random).choice(choices))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sets": sum(len(choices) for choices in self._choices.values()),
+            "partial_sets": len(self._partial),
+            "keys": len(self._choices),
+        }
+
+    def has_disk_changes(self) -> bool:
+        return self._snapshot_mtimes() != self._dir_mtimes
+
+    async def start_watching(self):
+        """Surveille les répertoires de calques et ré-indexe quand leur contenu change (appelé au démarrage)"""
+        if self.RESCAN_SECONDS <= 0 or self._watch_task is not None:
+            return
+        self._watch_task = asyncio.create_task(self._watch_loop())
+
+    async def stop_watching(self):
+        task, self._watch_task = self._watch_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _watch_loop(self):
+        while True:
+            await asyncio.sleep(self.RESCAN_SECONDS)
+            try:
+                if self.has_disk_changes():
+                    count = await ExecutorService.run_offloaded(self.rescan)
+                    print(f"🖼️ PORTRAIT CATALOG: ré-indexé après modification du disque ({count} sets)")
+            except Exception as e:
+                print(f"❌ PORTRAIT CATALOG: échec du ré-indexage: {e}")
+
+
+# Instance globale partagée par les générateurs de portraits
+portrait_catalog = PortraitCatalog()
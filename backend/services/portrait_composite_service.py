@@ -0,0 +1,131 @@
+"""
+Portraits aplatis : les cinq calques d'un set fusionnés en une seule image
+Le navigateur charge une image par joueur au lieu de cinq calques à empiler. Chaque composite
+est rendu une fois avec Pillow (PNG et variantes WebP/AVIF), puis servi depuis un cache mémoire (LRU) ou disque.
+
+Configuration (variables d'environnement) :
+  PORTRAIT_COMPOSITE_MEMORY_ITEMS   composites gardés en mémoire (défaut : 512)
+"""
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from PIL import Image
+
+from services.portrait_catalog import PORTRAIT_LAYERS, PortraitCatalog, portrait_catalog
+from services.portrait_variants import all_paths, encode_variants
+
+# Tailles servies (côté en pixels) ; la taille native des calques est 256
+COMPOSITE_SIZES = (64, 128, 256)
+DEFAULT_COMPOSITE_SIZE = 256
+
+
+class PortraitCompositeService:
+    """Rendu et cache des portraits aplatis, indexés par (nom du set, taille, format)"""
+
+    MEMORY_ITEMS = int(os.getenv("PORTRAIT_COMPOSITE_MEMORY_ITEMS", "512"))
+
+    def __init__(self, catalog: PortraitCatalog):
+        self.catalog = catalog
+        self.cache_dir = os.path.join(catalog.base_path, "composites")
+        self._memory: "OrderedDict[Tuple[str, int, str], Tuple[bytes, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        catalog.add_listener(self._invalidate)
+
+    def _cache_path(self, set_name: str, size: int, fmt: str = "png") -> str:
+        return os.path.join(self.cache_dir, f"{set_name}_{size}.{fmt}")
+
+    @staticmethod
+    def etag_for(data: bytes) -> str:
+        return hashlib.sha1(data).hexdigest()
+
+    def cached(self, set_name: str, size: int, fmt: str = "png") -> Optional[Tuple[bytes, str]]:
+        """Composite déjà en mémoire (bytes de l'image, ETag), sans accès disque"""
+        with self._lock:
+            entry = self._memory.get((set_name, size, fmt))
+            if entry is not None:
+                self._memory.move_to_end((set_name, size, fmt))
+                self.hits += 1
+            return entry
+
+    def get(self, set_name: str, size: int = DEFAULT_COMPOSITE_SIZE, fmt: str = "png") -> Optional[Tuple[bytes, str]]:
+        """
+        Composite d'un set (bytes de l'image, ETag) au format demandé : mémoire, puis disque, puis rendu Pillow
+        Le rendu écrit le PNG et toutes ses variantes en une fois.
+        Renvoie None si le set n'est pas complet dans le catalogue. Bloquant : à appeler hors de la boucle d'événements.
+        """
+        entry = self.cached(set_name, size, fmt)
+        if entry is not None:
+            return entry
+        if not self.catalog.contains(set_name):
+            return None
+
+        try:
+            with open(self._cache_path(set_name, size, fmt), 'rb') as f:
+                data = f.read()
+        except OSError:
+            encoded = encode_variants(self._render(set_name, size))
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for variant, variant_data in encoded.items():
+                path = self._cache_path(set_name, size, variant)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(variant_data)
+                os.replace(tmp_path, path)
+            data = encoded.get(fmt, encoded["png"])
+
+        entry = (data, self.etag_for(data))
+        with self._lock:
+            self.misses += 1
+            self._memory[(set_name, size, fmt)] = entry
+            while len(self._memory) > self.MEMORY_ITEMS:
+                self._memory.popitem(last=False)
+        return entry
+
+    def _render(self, set_name: str, size: int) -> Image.Image:
+        paths = self.catalog.layer_paths(set_name)
+        composite = None
+        for layer in PORTRAIT_LAYERS:
+            with Image.open(paths[layer]) as image:
+                image = image.convert('RGBA')
+            if composite is None:
+                composite = image
+            else:
+                if image.size != composite.size:
+                    image = image.resize(composite.size, Image.LANCZOS)
+                composite.alpha_composite(image)
+        if composite.size != (size, size):
+            composite = composite.resize((size, size), Image.LANCZOS)
+        return composite
+
+    def _invalidate(self, set_name: Optional[str]):
+        """Oublie les composites d'un set modifié (ou des sets disparus après un ré-indexage)"""
+        if set_name is not None:
+            is_stale = lambda name: name == set_name
+        else:
+            is_stale = lambda name: not self.catalog.contains(name)
+        with self._lock:
+            stale = [key for key in self._memory if is_stale(key[0])]
+            for key in stale:
+                del self._memory[key]
+        stale_sets = {key[0] for key in stale}
+        if set_name is not None:
+            stale_sets.add(set_name)
+        for stale_set in stale_sets:
+            for size in COMPOSITE_SIZES:
+                for path in all_paths(self._cache_path(stale_set, size)):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {"memory_items": len(self._memory), "hits": self.hits, "misses": self.misses}
+
+
+# Instance globale
+portrait_composites = PortraitCompositeService(portrait_catalog)
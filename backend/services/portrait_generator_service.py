@@ -1,14 +1,18 @@
 """
 Service de génération de portraits par calques PNG cohérents avec la nationalité
-Utilise l'IA (gpt-image-1) pour générer des calques semi-réalistes
+Utilise l'IA (gpt-image-1) pour générer des calques semi-réalistes, ou un backend local (voir image_backends)
 """
 import os
 import asyncio
 import base64
 import random
+from contextlib import asynccontextmanager
 from typing import Dict, List, Tuple
 from dotenv import load_dotenv
-from emergentintegrations.llm.openai.image_generation import OpenAIImageGeneration
+from services.image_backends import create_image_backend
+from services.portrait_catalog import portrait_catalog, set_name_from_layer
+from services.portrait_store import portrait_store
+from services.portrait_variants import write_variants
 
 load_dotenv()
 
@@ -92,6 +96,20 @@ class PortraitGeneratorService:
     }
     
     # Mapping nationalités -> régions
+    # Couleurs d'yeux en hex des portraits simples
+    EYE_COLORS_HEX = {
+        'blue': '#4169E1',
+        'light blue': '#87CEEB',
+        'grey-blue': '#6495ED',
+        'green': '#228B22',
+        'brown': '#8B4513',
+        'dark brown': '#654321',
+        'hazel': '#8E7618',
+        'light brown': '#A0522D',
+        'black': '#000000',
+        'grey': '#808080'
+    }
+    
     NATIONALITY_TO_REGION = {
         # Europe du Nord
         'Danois': 'nordic',
@@ -226,29 +244,31 @@ class PortraitGeneratorService:
     }
     
     def __init__(self):
-        """Initialise le service avec la clé API"""
-        api_key = os.getenv('EMERGENT_LLM_KEY', 'sk-emergent-default')
-        self.image_gen = OpenAIImageGeneration(api_key=api_key)
+        """Initialise le service avec le backend d'images configuré (PORTRAIT_IMAGE_BACKEND)"""
+        self.image_gen = create_image_backend()
         self.base_path = "/app/backend/static/portraits"
+        self.catalog = portrait_catalog
+        # Un verrou par nom de set (et son nombre d'utilisateurs) : deux générations du même set ne mélangent pas leurs calques
+        self._set_locks: Dict[str, list] = {}
         
     def get_region_for_nationality(self, nationality: str) -> str:
         """Retourne la région correspondant à une nationalité"""
         return self.NATIONALITY_TO_REGION.get(nationality, 'mixed')
     
-    def get_skin_tone_for_region(self, region: str) -> str:
+    def get_skin_tone_for_region(self, region: str, rng: random.Random = None) -> str:
         """Retourne une tonalité de peau aléatoire pour une région"""
         palette = self.SKIN_COLOR_PALETTES.get(region, self.SKIN_COLOR_PALETTES['mixed'])
-        return random.choice(palette['skin_tones'])
+        return (rng or random).choice(palette['skin_tones'])
     
-    def get_hair_color_for_region(self, region: str) -> str:
+    def get_hair_color_for_region(self, region: str, rng: random.Random = None) -> str:
         """Retourne une couleur de cheveux cohérente avec la région"""
         features = self.REGION_FEATURES.get(region, self.REGION_FEATURES['mixed'])
-        return random.choice(features['hair_colors'])
+        return (rng or random).choice(features['hair_colors'])
     
-    def get_eye_color_for_region(self, region: str) -> str:
+    def get_eye_color_for_region(self, region: str, rng: random.Random = None) -> str:
         """Retourne une couleur d'yeux cohérente avec la région"""
         features = self.REGION_FEATURES.get(region, self.REGION_FEATURES['mixed'])
-        return random.choice(features['eye_colors'])
+        return (rng or random).choice(features['eye_colors'])
     
     def get_hair_type_for_region(self, region: str) -> str:
         """Retourne un type de cheveux cohérent avec la région"""
@@ -406,152 +426,104 @@ Variation #{variation_id} to ensure uniqueness."""
         gender_code = 'M' if gender == 'male' else 'F'
         base_filename = f"{region}_{gender_code}_age{age}_{set_id}"
         
-        # Générer tous les calques
+        # Générer tous les calques en parallèle, puis les écrire hors de la boucle d'événements
         print(f"🎨 Génération des calques pour: {nationality} ({region}), {gender}, âge {age}")
         
-        layers = {}
+        generators = {
+            'base': self.generate_base_layer,
+            'eyes': self.generate_eyes_layer,
+            'hair': self.generate_hair_layer,
+            'mouth': self.generate_mouth_layer,
+            'nose': self.generate_nose_layer,
+        }
         
-        try:
-            # Base (tête)
-            print(f"  → Génération de la base...")
-            base_bytes = await self.generate_base_layer(region, gender, age_range, set_id)
-            if base_bytes:
-                base_path = f"{self.base_path}/base/{base_filename}_base.png"
-                with open(base_path, 'wb') as f:
-                    f.write(base_bytes)
-                layers['base'] = f"/static/portraits/base/{base_filename}_base.png"
-                print(f"  ✅ Base générée")
-            
-            # Yeux
-            print(f"  → Génération des yeux...")
-            eyes_bytes = await self.generate_eyes_layer(region, gender, age_range, set_id)
-            if eyes_bytes:
-                eyes_path = f"{self.base_path}/eyes/{base_filename}_eyes.png"
-                with open(eyes_path, 'wb') as f:
-                    f.write(eyes_bytes)
-                layers['eyes'] = f"/static/portraits/eyes/{base_filename}_eyes.png"
-                print(f"  ✅ Yeux générés")
-            
-            # Cheveux
-            print(f"  → Génération des cheveux...")
-            hair_bytes = await self.generate_hair_layer(region, gender, age_range, set_id)
-            if hair_bytes:
-                hair_path = f"{self.base_path}/hair/{base_filename}_hair.png"
-                with open(hair_path, 'wb') as f:
-                    f.write(hair_bytes)
-                layers['hair'] = f"/static/portraits/hair/{base_filename}_hair.png"
-                print(f"  ✅ Cheveux générés")
+        async with self._set_lock(base_filename):
+            try:
+                images = await asyncio.gather(*(
+                    generate(region, gender, age_range, set_id) for generate in generators.values()
+                ))
+                generated = {layer: data for layer, data in zip(generators, images) if data}
+                await asyncio.gather(*(
+                    asyncio.to_thread(self._write_layer, f"{self.base_path}/{layer}/{base_filename}_{layer}.png", data)
+                    for layer, data in generated.items()
+                ))
+                # Déclaration au catalogue dans un thread : ses écouteurs (mesure du stockage, quota,
+                # invalidation des composites et des atlas) accèdent au disque
+                await asyncio.to_thread(self._register_layers, base_filename, list(generated))
+            except Exception as e:
+                print(f"❌ Erreur lors de la génération: {str(e)}")
+                raise
             
-            # Bouche
-            print(f"  → Génération de la bouche...")
-            mouth_bytes = await self.generate_mouth_layer(region, gender, age_range, set_id)
-            if mouth_bytes:
-                mouth_path = f"{self.base_path}/mouth/{base_filename}_mouth.png"
-                with open(mouth_path, 'wb') as f:
-                    f.write(mouth_bytes)
-                layers['mouth'] = f"/static/portraits/mouth/{base_filename}_mouth.png"
-                print(f"  ✅ Bouche générée")
-            
-            # Nez
-            print(f"  → Génération du nez...")
-            nose_bytes = await self.generate_nose_layer(region, gender, age_range, set_id)
-            if nose_bytes:
-                nose_path = f"{self.base_path}/nose/{base_filename}_nose.png"
-                with open(nose_path, 'wb') as f:
-                    f.write(nose_bytes)
-                layers['nose'] = f"/static/portraits/nose/{base_filename}_nose.png"
-                print(f"  ✅ Nez généré")
-            
-            print(f"✅ Portrait complet généré: {len(layers)} calques")
-            
-        except Exception as e:
-            print(f"❌ Erreur lors de la génération: {str(e)}")
-            raise
+            layers = {layer: f"/static/portraits/{layer}/{base_filename}_{layer}.png" for layer in generated}
+        print(f"✅ Portrait complet généré: {len(layers)} calques")
         
         return layers
     
+    @asynccontextmanager
+    async def _set_lock(self, set_name: str):
+        """Verrou d'un nom de set, oublié dès que plus personne ne l'attend"""
+        entry = self._set_locks.setdefault(set_name, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._set_locks[set_name]
+    
+    def _register_layers(self, set_name: str, layers: List[str]):
+        for layer in layers:
+            self.catalog.add_layer(layer, set_name)
+    
+    @staticmethod
+    def _write_layer(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        # Variantes compressées (WebP, AVIF optionnel) encodées dès l'écriture
+        write_variants(path, data)
+    
     def get_available_portraits_for_region(self, region: str, gender: str) -> List[Dict[str, str]]:
-        """Retourne la liste des portraits disponibles pour une région et un genre"""
+        """Retourne la liste des portraits disponibles pour une région et un genre (index en mémoire)"""
         gender_code = 'M' if gender == 'male' else 'F'
-        pattern = f"{region}_{gender_code}_"
-        
-        available = []
-        
-        # Parcourir les fichiers base pour trouver les sets disponibles
-        base_dir = f"{self.base_path}/base"
-        if os.path.exists(base_dir):
-            for filename in os.listdir(base_dir):
-                if filename.startswith(pattern) and filename.endswith('_base.png'):
-                    # Extraire l'identifiant du set
-                    base_name = filename.replace('_base.png', '')
-                    
-                    # Vérifier que tous les calques existent
-                    portrait_set = {
-                        'base': f"/static/portraits/base/{base_name}_base.png",
-                        'eyes': f"/static/portraits/eyes/{base_name}_eyes.png",
-                        'hair': f"/static/portraits/hair/{base_name}_hair.png",
-                        'mouth': f"/static/portraits/mouth/{base_name}_mouth.png",
-                        'nose': f"/static/portraits/nose/{base_name}_nose.png",
-                    }
-                    
-                    # Vérifier que tous les fichiers existent
-                    all_exist = all([
-                        os.path.exists(f"{self.base_path}{path}")
-                        for path in portrait_set.values()
-                    ])
-                    
-                    if all_exist:
-                        available.append(portrait_set)
-        
-        return available
+        return self.catalog.sets_for(region, gender_code)
     
     def select_random_portrait_layers(
         self,
         nationality: str,
-        gender: str
+        gender: str,
+        rng: random.Random = None
     ) -> Dict[str, str]:
         """
         Sélectionne aléatoirement un set de calques de portrait existant
         Si aucun n'existe, génère un portrait simple avec Pillow
         """
+        rng = rng or random
         region = self.get_region_for_nationality(nationality)
-        gender_param = 'male' if gender == 'M' else 'female'
         
-        available = self.get_available_portraits_for_region(region, gender_param)
+        available = self.catalog.pick(region, 'M' if gender == 'M' else 'F', rng)
         
         if available:
-            return random.choice(available)
+            portrait_store.record_hit(set_name_from_layer(available['base']))
+            return available
         else:
             # Générer un portrait simple à la volée
             from services.simple_portrait_generator import simple_portrait_gen
             from services.game_service import GameService
             
             # Obtenir des couleurs cohérentes avec la région
-            skin_color = self.get_skin_tone_for_region(region)
-            hair_color_name = self.get_hair_color_for_region(region)
-            eye_color_name = self.get_eye_color_for_region(region)
+            skin_color = self.get_skin_tone_for_region(region, rng)
+            hair_color_name = self.get_hair_color_for_region(region, rng)
+            eye_color_name = self.get_eye_color_for_region(region, rng)
             
             # Convertir les noms de couleurs en hex (utiliser les palettes du GameService)
-            skin_color_hex = GameService.SKIN_COLORS[random.randint(0, len(GameService.SKIN_COLORS) - 1)]
-            hair_color_hex = GameService.HAIR_COLORS[random.randint(0, len(GameService.HAIR_COLORS) - 1)]
+            skin_color_hex = GameService.SKIN_COLORS[rng.randint(0, len(GameService.SKIN_COLORS) - 1)]
+            hair_color_hex = GameService.HAIR_COLORS[rng.randint(0, len(GameService.HAIR_COLORS) - 1)]
             
-            # Couleurs d'yeux en hex
-            eye_colors_hex = {
-                'blue': '#4169E1',
-                'light blue': '#87CEEB',
-                'grey-blue': '#6495ED',
-                'green': '#228B22',
-                'brown': '#8B4513',
-                'dark brown': '#654321',
-                'hazel': '#8E7618',
-                'light brown': '#A0522D',
-                'black': '#000000',
-                'grey': '#808080'
-            }
-            eye_color_hex = eye_colors_hex.get(eye_color_name, '#8B4513')
+            eye_color_hex = self.EYE_COLORS_HEX.get(eye_color_name, '#8B4513')
             
-            # Générer le portrait simple
-            set_id = random.randint(1, 9999)
+            # Générer le portrait simple (réutilisé si cette combinaison de couleurs a déjà été rendue)
             layers = simple_portrait_gen.generate_complete_portrait(
                 nationality=nationality,
                 region=region,
@@ -559,12 +531,62 @@ Variation #{variation_id} to ensure uniqueness."""
                 skin_color=skin_color_hex,
                 hair_color=hair_color_hex,
                 eye_color=eye_color_hex,
-                eye_shape='Amande',
-                set_id=set_id
+                eye_shape='Amande'
             )
             
             return layers
 
+    def fallback_combinations(self, regions: List[str] = None, genders: List[str] = None):
+        """
+        Toutes les combinaisons (région, genre, peau, cheveux, yeux, forme) que peut tirer
+        le portrait simple de select_random_portrait_layers
+        """
+        from services.game_service import GameService
+        
+        for region in regions or list(self.SKIN_COLOR_PALETTES):
+            features = self.REGION_FEATURES.get(region, self.REGION_FEATURES['mixed'])
+            eye_colors = dict.fromkeys(self.EYE_COLORS_HEX.get(name, '#8B4513') for name in features['eye_colors'])
+            for gender in genders or ['M', 'F']:
+                for skin_color in GameService.SKIN_COLORS:
+                    for hair_color in GameService.HAIR_COLORS:
+                        for eye_color in eye_colors:
+                            yield region, gender, skin_color, hair_color, eye_color, 'Amande'
+    
+    def pre_render_fallback_portraits(self, regions: List[str] = None, genders: List[str] = None) -> Dict[str, int]:
+        """Pré-rend les portraits simples de secours (bloquant : à appeler hors de la boucle d'événements)"""
+        from services.simple_portrait_generator import simple_portrait_gen
+        return simple_portrait_gen.pre_render(self.fallback_combinations(regions, genders))
+    
+    def resolve_portrait_layers(self, portrait) -> None:
+        """
+        Résout les calques d'un portrait différé (nationalité, genre et graine stockés sur le portrait)
+        La sélection est tirée avec la graine parmi les sets présents dans le catalogue au moment
+        de la résolution : le catalogue s'enrichit et des sets sont évincés, le résultat peut donc varier avec le moment
+        """
+        # Graine lue une seule fois : jamais de tirage avec random.Random(None) si elle vient d'être effacée
+        seed = portrait.layer_seed
+        if seed is None:
+            return
+        layers = self.select_random_portrait_layers(
+            nationality=portrait.layer_nationality,
+            gender=portrait.layer_gender,
+            rng=random.Random(seed)
+        )
+        portrait.layer_base = layers.get('base')
+        portrait.layer_eyes = layers.get('eyes')
+        portrait.layer_hair = layers.get('hair')
+        portrait.layer_mouth = layers.get('mouth')
+        portrait.layer_nose = layers.get('nose')
+        portrait.layer_set = set_name_from_layer(portrait.layer_base)
+        portrait.layer_seed = None
+    
+    def resolve_players_portraits(self, players) -> int:
+        """Résout en lot les portraits encore différés d'une liste de joueurs, renvoie le nombre résolu"""
+        pending = [player.portrait for player in players if player.portrait.layers_pending]
+        for portrait in pending:
+            self.resolve_portrait_layers(portrait)
+        return len(pending)
+
 
 # Instance globale du service
 portrait_service = PortraitGeneratorService()
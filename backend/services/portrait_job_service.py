@@ -0,0 +1,144 @@
+"""
+File de travaux de génération de portraits
+Un lot (nationalités x genres x variations) devient un travail suivi par identifiant ; ses sets
+sont générés en parallèle, dans la limite d'un sémaphore partagé par tous les travaux.
+Le nom d'un set ne dépend que de la région, du genre, de l'âge et de la variation : les nationalités
+d'une même région partagent donc leurs sets, et chaque set n'est généré qu'une fois par travail.
+
+Configuration (variables d'environnement) :
+  PORTRAIT_GENERATION_CONCURRENCY   sets générés simultanément, tous travaux confondus (défaut : 4)
+  PORTRAIT_JOBS_KEPT                travaux terminés gardés pour consultation (défaut : 100)
+"""
+import os
+import uuid
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from services.portrait_generator_service import portrait_service
+
+JOB_STATUSES = ("queued", "running", "completed", "failed")
+
+
+@dataclass
+class PortraitJob:
+    """Travail de génération : avancement et résultat de chaque set demandé"""
+    id: str
+    total: int
+    # Combinaisons demandées, avant regroupement des nationalités d'une même région
+    requested: int = 0
+    status: str = "queued"
+    completed: int = 0
+    failed: int = 0
+    summary: List[Dict[str, Any]] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "total_requested": self.requested,
+            "total_sets": self.total,
+            "total_generated": self.completed,
+            "total_failed": self.failed,
+            "progress": (self.completed + self.failed) / self.total if self.total else 1.0,
+            "summary": self.summary,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class PortraitJobService:
+    """Soumission et suivi des travaux de génération de portraits"""
+
+    CONCURRENCY = max(1, int(os.getenv("PORTRAIT_GENERATION_CONCURRENCY", "4")))
+    JOBS_KEPT = max(1, int(os.getenv("PORTRAIT_JOBS_KEPT", "100")))
+
+    _jobs: "OrderedDict[str, PortraitJob]" = OrderedDict()
+    _tasks: Dict[str, asyncio.Task] = {}
+    _slots: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def submit(cls, nationalities: List[str], genders: List[str], variations_per_combination: int) -> PortraitJob:
+        """Crée un travail et lance sa génération en arrière-plan (appelé depuis la boucle d'événements)"""
+        if cls._slots is None:
+            cls._slots = asyncio.Semaphore(cls.CONCURRENCY)
+        # (région, genre, variation) -> nationalités demandées ; la première sert à la génération
+        sets: Dict[tuple, List[str]] = {}
+        requested = 0
+        for nationality in nationalities:
+            region = portrait_service.get_region_for_nationality(nationality)
+            for gender in genders:
+                for variation in range(1, variations_per_combination + 1):
+                    requested += 1
+                    nationalities_for_set = sets.setdefault((region, gender, variation), [])
+                    if nationality not in nationalities_for_set:
+                        nationalities_for_set.append(nationality)
+        combinations = [
+            (set_nationalities, gender, variation)
+            for (_, gender, variation), set_nationalities in sets.items()
+        ]
+        job = PortraitJob(id=str(uuid.uuid4()), total=len(combinations), requested=requested)
+        cls._jobs[job.id] = job
+        cls._forget_old_jobs()
+        cls._tasks[job.id] = asyncio.create_task(cls._run(job, combinations))
+        return job
+
+    @classmethod
+    def get(cls, job_id: str) -> Optional[PortraitJob]:
+        return cls._jobs.get(job_id)
+
+    @classmethod
+    def _forget_old_jobs(cls):
+        """Oublie les plus anciens travaux terminés au-delà de JOBS_KEPT"""
+        finished = [job_id for job_id, job in cls._jobs.items() if job.finished_at is not None]
+        for job_id in finished[:max(0, len(cls._jobs) - cls.JOBS_KEPT)]:
+            del cls._jobs[job_id]
+
+    @classmethod
+    async def _run(cls, job: PortraitJob, combinations: List[tuple]):
+        job.status = "running"
+        try:
+            await asyncio.gather(*(cls._generate_one(job, *combination) for combination in combinations))
+            job.status = "completed" if job.completed or not job.total else "failed"
+        except Exception as e:
+            job.status = "failed"
+            print(f"❌ PORTRAIT JOB {job.id}: {e}")
+        finally:
+            job.finished_at = datetime.utcnow()
+            cls._tasks.pop(job.id, None)
+
+    @classmethod
+    async def _generate_one(cls, job: PortraitJob, nationalities: List[str], gender: str, variation: int):
+        entry = {
+            "nationality": nationalities[0],
+            "nationalities": nationalities,
+            "region": portrait_service.get_region_for_nationality(nationalities[0]),
+            "gender": gender,
+            "variation": variation,
+        }
+        async with cls._slots:
+            try:
+                layers = await portrait_service.generate_portrait_layers_set(
+                    nationality=nationalities[0],
+                    gender=gender,
+                    age=25,  # Âge par défaut
+                    set_id=variation
+                )
+                job.completed += 1
+                entry.update(status="success", layers=layers)
+            except Exception as e:
+                job.failed += 1
+                entry.update(status="error", error=str(e))
+        job.summary.append(entry)
+
+    @classmethod
+    async def shutdown(cls):
+        """Annule les travaux en cours (appelé à l'arrêt du serveur)"""
+        tasks = list(cls._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
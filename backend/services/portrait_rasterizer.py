@@ -0,0 +1,175 @@
+"""
+Rastérisation en lot des calques de portraits simples avec NumPy
+Chaque calque est un gabarit précalculé (carte d'indices : 0 = transparent, 1..n = zone à colorier)
+dessiné une seule fois par genre. Colorier un lot revient à indexer une palette par le gabarit
+(palette[:, gabarit]), et l'encodage des images obtenues (PNG et variantes WebP/AVIF) est réparti
+sur un pool de threads (Pillow relâche le GIL pendant la compression).
+
+Les couleurs d'un calque ne dépendent que d'une partie des paramètres du set (peau pour la base,
+la bouche et le nez, cheveux et genre pour la coiffure, yeux pour les yeux) : chaque calque
+distinct d'un lot n'est rastérisé et encodé qu'une fois, quel que soit le nombre de sets qui l'utilisent.
+
+Configuration (variables d'environnement) :
+  PORTRAIT_RASTER_WORKERS   threads d'encodage (défaut : nombre de CPU)
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from services.portrait_variants import encode_variants
+
+LAYER_SIZE = (256, 256)
+DEFAULT_EYE_RGB = (139, 69, 19)  # Marron
+
+# (calque, paramètres dont dépendent ses couleurs) ; seul le calque de cheveux dépend du genre
+LayerKey = Tuple[str, ...]
+
+
+def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """Convertit une couleur hex en RGB"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def darken_color(rgb: Tuple[int, int, int], factor: float = 0.3) -> Tuple[int, int, int]:
+    """Assombrit une couleur RGB"""
+    return tuple(max(0, int(c * factor)) for c in rgb)
+
+
+def _draw_template(draw_shapes) -> np.ndarray:
+    """Carte d'indices d'un calque : chaque forme est dessinée avec le numéro de sa zone"""
+    img = Image.new('L', LAYER_SIZE, 0)
+    draw_shapes(ImageDraw.Draw(img))
+    return np.asarray(img, dtype=np.uint8)
+
+
+def _base_shapes(draw):
+    draw.ellipse([50, 30, 206, 220], fill=1)  # Tête ovale
+    draw.rectangle([100, 200, 156, 256], fill=1)  # Cou
+
+
+def _eyes_shapes(draw):
+    for cx, cy in ((90, 100), (166, 100)):
+        draw.ellipse([cx - 14, cy - 14, cx + 14, cy + 14], fill=1)  # Blanc de l'œil
+        draw.ellipse([cx - 8, cy - 8, cx + 8, cy + 8], fill=2)  # Iris
+        draw.ellipse([cx - 4, cy - 4, cx + 4, cy + 4], fill=3)  # Pupille
+
+
+def _hair_shapes(gender_code: str):
+    def draw_hair(draw):
+        draw.ellipse([50, 20, 206, 100], fill=1)  # Partie supérieure de la tête
+        if gender_code != 'M':
+            # Cheveux longs qui descendent sur les côtés
+            draw.polygon([(50, 80), (40, 200), (80, 200), (70, 80)], fill=1)
+            draw.polygon([(206, 80), (216, 200), (176, 200), (186, 80)], fill=1)
+    return draw_hair
+
+
+def _mouth_shapes(draw):
+    draw.ellipse([110, 150, 146, 165], fill=1)
+
+
+def _nose_shapes(draw):
+    cx, cy = 128, 120
+    draw.polygon([(cx, cy - 15), (cx - 10, cy + 10), (cx + 10, cy + 10)], fill=1)
+    draw.ellipse([cx - 12, cy + 8, cx - 8, cy + 12], fill=2)  # Narines
+    draw.ellipse([cx + 8, cy + 8, cx + 12, cy + 12], fill=2)
+
+
+class PortraitRasterizer:
+    """Gabarits des calques simples et rendu en lot (RGBA uint8) puis encodage"""
+
+    ENCODE_WORKERS = max(1, int(os.getenv("PORTRAIT_RASTER_WORKERS", str(os.cpu_count() or 1))))
+    # Images rastérisées en une fois (256 Ko chacune en RGBA)
+    CHUNK = 64
+
+    def __init__(self):
+        self.templates: Dict[Tuple[str, str], np.ndarray] = {
+            ('base', ''): _draw_template(_base_shapes),
+            ('eyes', ''): _draw_template(_eyes_shapes),
+            ('hair', 'M'): _draw_template(_hair_shapes('M')),
+            ('hair', 'F'): _draw_template(_hair_shapes('F')),
+            ('mouth', ''): _draw_template(_mouth_shapes),
+            ('nose', ''): _draw_template(_nose_shapes),
+        }
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_guard = threading.Lock()
+
+    @staticmethod
+    def layer_keys(gender_code: str, skin_color: str, hair_color: str, eye_color: str) -> Dict[str, LayerKey]:
+        """Clé de chaque calque d'un set : deux sets de même clé partagent les mêmes fichiers"""
+        return {
+            'base': ('base', '', skin_color.upper()),
+            'eyes': ('eyes', '', eye_color.upper()),
+            'hair': ('hair', gender_code, hair_color.upper()),
+            'mouth': ('mouth', '', skin_color.upper()),
+            'nose': ('nose', '', skin_color.upper()),
+        }
+
+    @staticmethod
+    def palette(key: LayerKey) -> List[Tuple[int, int, int, int]]:
+        """Couleurs RGBA des zones d'un calque (zone 0 transparente)"""
+        layer, _, color = key
+        transparent = (0, 0, 0, 0)
+        if layer == 'base':
+            return [transparent, hex_to_rgb(color) + (255,)]
+        if layer == 'eyes':
+            eye_rgb = hex_to_rgb(color) if color.startswith('#') else DEFAULT_EYE_RGB
+            return [transparent, (255, 255, 255, 255), eye_rgb + (255,), (0, 0, 0, 255)]
+        if layer == 'hair':
+            return [transparent, hex_to_rgb(color) + (255,)]
+        if layer == 'mouth':
+            # Lèvres un peu plus foncées que la peau
+            return [transparent, darken_color(hex_to_rgb(color), 0.7) + (255,)]
+        # Nez légèrement transparent, narines opaques
+        nose_rgb = darken_color(hex_to_rgb(color), 0.9)
+        return [transparent, nose_rgb + (200,), nose_rgb + (255,)]
+
+    def rasterize(self, keys: List[LayerKey]) -> np.ndarray:
+        """Images RGBA (n, hauteur, largeur, 4) de calques partageant le même gabarit"""
+        template = self.templates[keys[0][:2]]
+        palettes = np.array([self.palette(key) for key in keys], dtype=np.uint8)
+        return palettes[:, template]
+
+    @staticmethod
+    def encode(pixels: np.ndarray) -> Dict[str, bytes]:
+        """PNG et variantes d'une image rastérisée, par format"""
+        return encode_variants(Image.fromarray(pixels, 'RGBA'))
+
+    def _encoder_pool(self) -> ThreadPoolExecutor:
+        with self._pool_guard:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.ENCODE_WORKERS, thread_name_prefix="portrait-raster")
+            return self._pool
+
+    def render(self, keys: Iterable[LayerKey]) -> Dict[LayerKey, Dict[str, bytes]]:
+        """Images (par format) de chaque calque distinct, rastérisés par gabarit et par paquets puis encodés en parallèle"""
+        by_template: Dict[Tuple[str, str], List[LayerKey]] = {}
+        for key in dict.fromkeys(keys):
+            by_template.setdefault(key[:2], []).append(key)
+
+        chunks = [
+            template_keys[start:start + self.CHUNK]
+            for template_keys in by_template.values()
+            for start in range(0, len(template_keys), self.CHUNK)
+        ]
+        encoded: Dict[LayerKey, Dict[str, bytes]] = {}
+        pool = self._encoder_pool()
+        for chunk in chunks:
+            images = self.rasterize(chunk)
+            encoded.update(zip(chunk, pool.map(self.encode, images)))
+        return encoded
+
+    def shutdown(self):
+        with self._pool_guard:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+# Instance globale
+portrait_rasterizer = PortraitRasterizer()
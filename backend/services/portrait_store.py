@@ -0,0 +1,185 @@
+"""
+Stockage géré des calques de portrait : quota disque et éviction LRU
+Chaque set de calques a une taille sur disque et une date de dernière utilisation. Au-delà du quota,
+les sets les moins récemment utilisés qui ne sont référencés par aucune partie (ni par la réserve
+de joueurs) sont supprimés. Seuls les sets re-générables (rendus Pillow "_simple_", adressés par
+leur contenu) sont évincés : les sets générés par IA ont un coût et ne sont jamais supprimés.
+Le quota porte sur les calques et leurs variantes compressées ; les composites d'un set évincé sont supprimés avec lui.
+Un set tiré pour un joueur est protégé dès le tirage pendant PORTRAIT_STORE_HOLD_SECONDS, le temps que
+la partie (ou la réserve de joueurs) le référence : un joueur ne pointe jamais vers un set supprimé.
+
+Configuration (variables d'environnement) :
+  PORTRAIT_STORE_MAX_MB          quota disque des calques, en Mo (défaut : 512)
+  PORTRAIT_STORE_HOLD_SECONDS    protection d'un set après son tirage, en secondes (défaut : 3600)
+"""
+import os
+import time
+import threading
+from typing import Dict, Iterable, Optional, Set
+
+from services.portrait_catalog import PortraitCatalog, is_content_addressed, portrait_catalog
+from services.portrait_variants import all_paths
+
+# Fraction du quota visée après une éviction, pour ne pas évincer à chaque nouveau set
+EVICTION_TARGET = 0.9
+
+
+class PortraitStore:
+    """Taille, utilisation et références des sets de calques du catalogue"""
+
+    MAX_BYTES = int(float(os.getenv("PORTRAIT_STORE_MAX_MB", "512")) * 1024 * 1024)
+    HOLD_SECONDS = float(os.getenv("PORTRAIT_STORE_HOLD_SECONDS", "3600"))
+
+    def __init__(self, catalog: PortraitCatalog):
+        self.catalog = catalog
+        self._lock = threading.Lock()
+        self._sizes: Dict[str, int] = {}
+        self._last_used: Dict[str, float] = {}
+        # propriétaire (id de partie, "player-pool") -> sets référencés
+        self._references: Dict[str, Set[str]] = {}
+        # set -> fin de la protection posée au tirage
+        self._held: Dict[str, float] = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._reconcile()
+        catalog.add_listener(self._on_catalog_change)
+
+    def _layer_files(self, set_name: str) -> list:
+        return [path for png_path in self.catalog.layer_paths(set_name).values() for path in all_paths(png_path)]
+
+    def _measure(self, set_name: str) -> tuple:
+        """(octets sur disque, dernière modification) des calques d'un set et de leurs variantes"""
+        size, mtime = 0, 0.0
+        for path in self._layer_files(set_name):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            size += stat.st_size
+            mtime = max(mtime, stat.st_mtime)
+        return size, mtime
+
+    def _track(self, set_name: str, last_used: Optional[float] = None):
+        size, mtime = self._measure(set_name)
+        with self._lock:
+            self.total_bytes += size - self._sizes.get(set_name, 0)
+            self._sizes[set_name] = size
+            self._last_used[set_name] = last_used if last_used is not None else mtime
+
+    def _reconcile(self):
+        """Aligne le suivi sur le catalogue : sets apparus mesurés, sets disparus oubliés"""
+        current = set(self.catalog.all_sets())
+        with self._lock:
+            gone = [set_name for set_name in self._sizes if set_name not in current]
+            for set_name in gone:
+                self.total_bytes -= self._sizes.pop(set_name)
+                self._last_used.pop(set_name, None)
+            new = [set_name for set_name in current if set_name not in self._sizes]
+        for set_name in new:
+            self._track(set_name)
+
+    def _on_catalog_change(self, set_name: Optional[str]):
+        if set_name is None:
+            self._reconcile()
+        elif self.catalog.contains(set_name):
+            self._track(set_name, last_used=time.time())
+        else:
+            return
+        self.enforce_quota()
+
+    def record_hit(self, set_name: Optional[str]):
+        """Un set existant a été tiré pour un joueur (sélection d'un portrait, rendu déjà en cache)"""
+        with self._lock:
+            self.hits += 1
+            if set_name in self._last_used:
+                self._last_used[set_name] = time.time()
+        self.hold([set_name])
+
+    def record_miss(self, set_name: Optional[str] = None):
+        """Un set a dû être rendu pour un joueur (protégé avant même son écriture)"""
+        with self._lock:
+            self.misses += 1
+        self.hold([set_name])
+
+    def hold(self, set_names: Iterable[Optional[str]]):
+        """Protège des sets de l'éviction pendant HOLD_SECONDS (tirage, sortie de la réserve de joueurs)"""
+        expires = time.time() + self.HOLD_SECONDS
+        with self._lock:
+            for set_name in set_names:
+                if set_name:
+                    self._held[set_name] = expires
+
+    def touch(self, set_name: str):
+        with self._lock:
+            if set_name in self._last_used:
+                self._last_used[set_name] = time.time()
+
+    def retain(self, owner: str, set_names: Iterable[Optional[str]]):
+        """Déclare les sets utilisés par un propriétaire (remplace sa déclaration précédente)"""
+        with self._lock:
+            self._references[owner] = {set_name for set_name in set_names if set_name}
+
+    def release(self, owner: str):
+        with self._lock:
+            self._references.pop(owner, None)
+
+    def enforce_quota(self) -> int:
+        """Évince les sets LRU non référencés jusqu'à repasser sous le quota, renvoie le nombre de sets supprimés"""
+        with self._lock:
+            if self.total_bytes <= self.MAX_BYTES:
+                return 0
+            now = time.time()
+            for set_name in [name for name, expires in self._held.items() if expires <= now]:
+                del self._held[set_name]
+            protected = set(self._held).union(*self._references.values())
+            candidates = sorted(
+                (set_name for set_name in self._sizes if is_content_addressed(set_name) and set_name not in protected),
+                key=self._last_used.get
+            )
+            target = self.MAX_BYTES * EVICTION_TARGET
+            victims = []
+            projected = self.total_bytes
+            for set_name in candidates:
+                if projected <= target:
+                    break
+                victims.append(set_name)
+                projected -= self._sizes[set_name]
+
+        for set_name in victims:
+            # Retiré de l'index avant la suppression des fichiers : plus aucun tirage ne peut le choisir.
+            # Le service des composites, à l'écoute du catalogue, supprime les images aplaties du set.
+            self.catalog.discard_set(set_name)
+            for path in self._layer_files(set_name):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            with self._lock:
+                self.total_bytes -= self._sizes.pop(set_name, 0)
+                self._last_used.pop(set_name, None)
+                self.evictions += 1
+        if victims:
+            print(f"🧹 PORTRAIT STORE: {len(victims)} sets évincés, {self.total_bytes / 1024 / 1024:.1f} Mo utilisés")
+        return len(victims)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            referenced = set().union(*self._references.values()) if self._references else set()
+            return {
+                "sets": len(self._sizes),
+                "referenced_sets": len(referenced & self._sizes.keys()),
+                "held_sets": len(self._held),
+                "size_bytes": self.total_bytes,
+                "quota_bytes": self.MAX_BYTES,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "evictions": self.evictions,
+            }
+
+
+# Instance globale
+portrait_store = PortraitStore(portrait_catalog)
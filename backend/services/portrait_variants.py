@@ -0,0 +1,147 @@
+"""
+Variantes compressées des images de portrait (WebP, AVIF optionnel) et négociation par l'en-tête Accept
+Les variantes sont encodées une fois, à l'écriture du PNG (calques, composites, planches d'atlas),
+et rangées à côté de lui avec la même racine de nom : "{set}_{calque}.png" -> "{set}_{calque}.webp".
+Le WebP est encodé sans perte et avec perte, et la plus petite des deux versions est gardée
+(sans perte l'emporte nettement sur les calques à aplats de couleur).
+
+Configuration (variables d'environnement) :
+  PORTRAIT_VARIANT_FORMATS   formats produits en plus du PNG, par ordre de préférence (défaut : "webp" ;
+                             "avif,webp" ajoute l'AVIF si Pillow le prend en charge, au prix d'un encodage ~10x plus lent)
+  PORTRAIT_WEBP_QUALITY      qualité du WebP avec perte (défaut : 90)
+  PORTRAIT_AVIF_QUALITY      qualité de l'AVIF (défaut : 75)
+"""
+import io
+import os
+from typing import Dict, Iterable, List, Optional
+
+from fastapi import Request, Response
+from PIL import Image, features
+
+MEDIA_TYPES = {"avif": "image/avif", "webp": "image/webp", "png": "image/png"}
+# Une image adressée par son contenu ne change jamais : cache navigateur d'un an sans revalidation
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Une image dont l'URL peut être réécrite (set régénéré sous le même nom) : revalidation par ETag à chaque usage
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+WEBP_QUALITY = int(os.getenv("PORTRAIT_WEBP_QUALITY", "90"))
+AVIF_QUALITY = int(os.getenv("PORTRAIT_AVIF_QUALITY", "75"))
+
+
+def _configured_formats() -> List[str]:
+    formats = []
+    for fmt in os.getenv("PORTRAIT_VARIANT_FORMATS", "webp").split(","):
+        fmt = fmt.strip().lower()
+        if fmt not in ("avif", "webp") or fmt in formats:
+            continue
+        if not features.check(fmt):
+            print(f"⚠️ PORTRAITS: format {fmt} non pris en charge par Pillow, variante ignorée")
+            continue
+        formats.append(fmt)
+    return formats
+
+
+# Formats servis, par ordre de préférence ; le PNG reste toujours disponible
+VARIANT_FORMATS = _configured_formats()
+SERVED_FORMATS = VARIANT_FORMATS + ["png"]
+
+
+def variant_path(png_path: str, fmt: str) -> str:
+    """Chemin d'une variante à partir du chemin du PNG"""
+    return f"{png_path[:-len('.png')]}.{fmt}"
+
+
+def all_paths(png_path: str) -> List[str]:
+    """PNG et toutes ses variantes possibles"""
+    return [png_path] + [variant_path(png_path, fmt) for fmt in ("avif", "webp")]
+
+
+def _save(img: Image.Image, fmt: str, **params) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, fmt, **params)
+    return buffer.getvalue()
+
+
+def encode_variants(img: Image.Image, png: Optional[bytes] = None) -> Dict[str, bytes]:
+    """PNG (repris tel quel s'il est fourni) et variantes configurées d'une image"""
+    encoded = {"png": png if png is not None else _save(img, "PNG", optimize=True)}
+    for fmt in VARIANT_FORMATS:
+        if fmt == "webp":
+            lossless = _save(img, "WEBP", lossless=True)
+            lossy = _save(img, "WEBP", quality=WEBP_QUALITY, alpha_quality=100)
+            encoded[fmt] = min(lossless, lossy, key=len)
+        else:
+            encoded[fmt] = _save(img, "AVIF", quality=AVIF_QUALITY)
+    return encoded
+
+
+def write_variants(png_path: str, png: bytes) -> Dict[str, bytes]:
+    """Encode et écrit les variantes d'un PNG déjà écrit sur le disque"""
+    with Image.open(io.BytesIO(png)) as img:
+        encoded = encode_variants(img.convert("RGBA"), png)
+    for fmt, data in encoded.items():
+        if fmt != "png":
+            with open(variant_path(png_path, fmt), "wb") as f:
+                f.write(data)
+    return encoded
+
+
+def ensure_variants(png_path: str) -> bool:
+    """Crée les variantes manquantes d'un PNG (fichiers écrits avant l'existence des variantes)"""
+    if all(os.path.exists(variant_path(png_path, fmt)) for fmt in VARIANT_FORMATS):
+        return True
+    try:
+        with open(png_path, "rb") as f:
+            png = f.read()
+    except OSError:
+        return False
+    write_variants(png_path, png)
+    return True
+
+
+def negotiate(accept: Optional[str], available: Iterable[str] = None) -> str:
+    """
+    Format à servir d'après l'en-tête Accept : le premier format de SERVED_FORMATS
+    explicitement accepté (q > 0) et disponible ; PNG par défaut
+    """
+    available = set(available) if available is not None else set(SERVED_FORMATS)
+    accepted = {}
+    for part in (accept or "").split(","):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        accepted[media_type.lower()] = quality
+
+    for fmt in SERVED_FORMATS:
+        if fmt == "png" or fmt not in available:
+            continue
+        # Seul un type explicite compte : "image/*" ne garantit pas le décodage WebP/AVIF
+        if accepted.get(MEDIA_TYPES[fmt], 0.0) > 0:
+            return fmt
+    return "png"
+
+
+def cache_headers(etag: str, immutable: bool = True) -> Dict[str, str]:
+    """En-têtes de cache d'une image : ETag, Vary: Accept, et cache immuable ou revalidation"""
+    cache_control = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+    return {"ETag": f'"{etag}"', "Cache-Control": cache_control, "Vary": "Accept"}
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    return request.headers.get("if-none-match") in (f'"{etag}"', f'W/"{etag}"', "*")
+
+
+def image_response(request: Request, data: bytes, etag: str, fmt: str, immutable: bool = True) -> Response:
+    """
+    Réponse image avec ETag, Vary: Accept et 304 sur If-None-Match
+    `immutable` seulement si l'URL désigne un contenu qui ne change jamais ; sinon le navigateur revalide.
+    """
+    headers = cache_headers(etag, immutable)
+    if not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type=MEDIA_TYPES[fmt], headers=headers)
@@ -0,0 +1,160 @@
+"""
+Diffusion des simulations en temps réel (WebSocket, Server-Sent Events)
+Une horloge côté serveur par partie calcule l'état de la simulation et le publie à tous les spectateurs
+connectés : le calcul est fait une fois par tic, quel que soit le nombre de spectateurs, et le tic
+suivant est programmé à l'heure de la prochaine mort (bornée par l'intervalle de progression).
+Les spectateurs lents ne reçoivent que le dernier état : l'état est cumulatif (nombre de morts révélées),
+sauter un tic ne fait perdre aucune mort.
+
+Configuration (variables d'environnement) :
+  REALTIME_PROGRESS_INTERVAL   intervalle maximal entre deux tics de progression, en secondes (défaut : 0.5)
+  REALTIME_MIN_PUSH_INTERVAL   intervalle minimal entre deux tics ; les morts plus rapprochées sont groupées (défaut : 0.05)
+  REALTIME_HEARTBEAT_INTERVAL  silence maximal d'un flux SSE avant un battement de cœur, en secondes (défaut : 15)
+"""
+import os
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+# Statuts d'un état publié ; 'complete' et 'stopped' terminent le flux
+FEED_STATUSES = ("running", "paused", "complete", "stopped")
+
+FeedStep = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class RealtimeFeed:
+    """Dernier état publié d'une simulation et horloge qui le met à jour"""
+
+    def __init__(self, step: FeedStep):
+        self.step = step
+        self.state: Optional[Dict[str, Any]] = None
+        self.version = 0
+        self.subscribers = 0
+        self._changed = asyncio.Condition()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state is not None and self.state["status"] in ("complete", "stopped")
+
+    async def publish(self, state: Dict[str, Any]):
+        async with self._changed:
+            self.state = state
+            self.version += 1
+            self._changed.notify_all()
+
+    def wake(self):
+        """Force un tic immédiat (pause, reprise, changement de vitesse, arrêt)"""
+        self._wake.set()
+
+    async def _sleep(self, delay: Optional[float]):
+        """Attend `delay` secondes (indéfiniment si None) ou un réveil explicite"""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+
+    async def run(self):
+        while not self.finished and self.subscribers > 0:
+            try:
+                state = await self.step()
+            except Exception as e:
+                print(f"❌ REALTIME FEED: échec du calcul de l'état: {e}")
+                state = {"status": "stopped", "error": str(e)}
+            await self.publish(state)
+            if self.finished:
+                break
+            # En pause, plus rien ne change avant un réveil explicite
+            delay = None
+            if state["status"] == "running":
+                delay = RealtimeFeedService.PROGRESS_INTERVAL
+                next_death_in = state.get("next_death_in")
+                if next_death_in is not None:
+                    delay = min(delay, max(RealtimeFeedService.MIN_PUSH_INTERVAL, next_death_in))
+            await self._sleep(delay)
+
+    async def states(self) -> AsyncIterator[Dict[str, Any]]:
+        """Chaque nouvel état publié (le plus récent seulement si le consommateur prend du retard)"""
+        seen = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self.version > seen)
+                state, seen = self.state, self.version
+            yield state
+            if state["status"] in ("complete", "stopped"):
+                return
+
+
+class RealtimeFeedService:
+    """Une horloge de diffusion par partie, partagée par ses spectateurs"""
+
+    PROGRESS_INTERVAL = float(os.getenv("REALTIME_PROGRESS_INTERVAL", "0.5"))
+    MIN_PUSH_INTERVAL = float(os.getenv("REALTIME_MIN_PUSH_INTERVAL", "0.05"))
+    HEARTBEAT_INTERVAL = float(os.getenv("REALTIME_HEARTBEAT_INTERVAL", "15"))
+
+    _feeds: Dict[str, RealtimeFeed] = {}
+
+    @classmethod
+    async def subscribe(cls, game_id: str, step: FeedStep) -> AsyncIterator[Dict[str, Any]]:
+        """
+        États successifs de la simulation d'une partie, jusqu'à 'complete' ou 'stopped'
+        `step` calcule l'état courant ; il n'est utilisé que si aucune horloge ne tourne déjà pour cette partie.
+        """
+        feed = cls._feeds.get(game_id)
+        if feed is None or feed.finished:
+            feed = RealtimeFeed(step)
+            cls._feeds[game_id] = feed
+        feed.subscribers += 1
+        if feed._task is None or feed._task.done():
+            feed._task = asyncio.create_task(feed.run())
+        try:
+            async for state in feed.states():
+                yield state
+        finally:
+            feed.subscribers -= 1
+            if feed.subscribers == 0:
+                feed.wake()
+                if cls._feeds.get(game_id) is feed:
+                    del cls._feeds[game_id]
+
+    @classmethod
+    async def with_heartbeats(cls, messages: AsyncIterator[Any], interval: Optional[float] = None) -> AsyncIterator[Any]:
+        """
+        Relaie `messages` en intercalant None après chaque `interval` secondes de silence (battement de cœur)
+        Le flux source est fermé quand le relais l'est (déconnexion du client).
+        """
+        interval = interval if interval is not None else cls.HEARTBEAT_INTERVAL
+        pending: Optional[asyncio.Task] = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(messages.__anext__())
+                done, _ = await asyncio.wait({pending}, timeout=interval)
+                if not done:
+                    yield None
+                    continue
+                try:
+                    message = pending.result()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    pending = None
+                yield message
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+            await messages.aclose()
+
+    @classmethod
+    def wake(cls, game_id: str):
+        """Signale un changement d'état de la simulation (pause, reprise, vitesse, fin, arrêt)"""
+        feed = cls._feeds.get(game_id)
+        if feed is not None:
+            feed.wake()
+
+    @classmethod
+    def viewers(cls, game_id: str) -> int:
+        feed = cls._feeds.get(game_id)
+        return feed.subscribers if feed is not None else 0
@@ -229,7 +229,7 @@ class StatisticsService:
             'average_elimination_rate': 0.0
         })
         
-        # Importer les données des parties pour accéder aux event_results détaillés
+        # Importer les données des parties pour accéder au journal détaillé des épreuves
         try:
             from routes.game_routes import games_db
             
@@ -238,9 +238,9 @@ class StatisticsService:
                 if completed_game.id in games_db:
                     full_game = games_db[completed_game.id]
                     
-                    # Utiliser les event_results réels si disponibles
-                    if hasattr(full_game, 'event_results') and full_game.event_results:
-                        for event_result in full_game.event_results:
+                    # Utiliser le journal réel des épreuves si disponible
+                    if hasattr(full_game, 'event_log') and full_game.event_log:
+                        for event_result in full_game.event_log:
                             event_name = event_result.event_name
                             
                             if event_name not in event_stats:
@@ -260,7 +260,7 @@ class StatisticsService:
                             event_stats[event_name]['deaths'] += len(event_result.eliminated)
                             event_stats[event_name]['total_eliminations'] += len(event_result.eliminated)
                     
-                    # Fallback sur les events_played si pas d'event_results
+                    # Fallback sur les events_played si pas de journal d'épreuves
                     elif hasattr(completed_game, 'events_played') and completed_game.events_played:
                         for event_name in completed_game.events_played:
                             if event_name not in event_stats:
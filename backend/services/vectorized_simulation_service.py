@@ -0,0 +1,230 @@
+"""
+Moteur de simulation vectorisé (NumPy) pour les épreuves
+Reproduit la distribution du moteur classique de GameService.simulate_event
+mais calcule tous les scores en un seul appel et sélectionne les survivants
+avec argpartition, ce qui le rend adapté aux parties de 1000+ joueurs.
+"""
+import random
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from models.game_models import Player, GameEvent, EventResult, EventType
+from services.events_service import EventsService
+from services.kill_allocator import KillAllocator
+from services.player_roster import PlayerRoster
+
+
+def compute_survival_scores(
+    stats: np.ndarray,
+    role_codes: np.ndarray,
+    group_codes: np.ndarray,
+    event: GameEvent,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Calcule les scores de survie de tous les joueurs en un seul appel
+
+    Args:
+        stats: tableau (n, 3) des stats intelligence/force/agilité
+        role_codes: codes des rôles (player_roster.ROLE_CODES)
+        group_codes: code du groupe actif de chaque joueur, -1 si aucun
+        event: l'épreuve simulée
+        rng: générateur NumPy
+    """
+    n = len(role_codes)
+    # Bonus de stat + bonus de rôle - malus de difficulté : un seul gather dans la table précompilée
+    bonus_table = EventsService.get_bonus_table(event)
+    base_scores = bonus_table.matrix[role_codes, stats[:, bonus_table.stat_column]]
+
+    # Bonus de coopération : 0.5 par allié vivant du même groupe (recensement linéaire)
+    group_bonus = np.zeros(n, dtype=np.float64)
+    in_group = group_codes >= 0
+    if in_group.any():
+        group_sizes = np.bincount(group_codes[in_group])
+        group_bonus[in_group] = (group_sizes[group_codes[in_group]] - 1) * 0.5
+
+    return base_scores + group_bonus + rng.uniform(0, 25, size=n)
+
+
+def select_survivors(scores: np.ndarray, target_survivors: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Sélectionne les indices des survivants avec la même distribution que le moteur classique :
+    tri par score, mélange des joueurs aux scores proches (écart < 4), mélange par chunks,
+    puis conservation des target_survivors premiers.
+    """
+    n = len(scores)
+    if target_survivors >= n:
+        return np.arange(n)
+
+    order = np.argsort(-scores, kind="stable")
+    negated_scores = -scores[order]
+
+    # Bandes de scores similaires : une bande démarre sur un joueur et s'étend tant que l'écart reste < 4
+    band_ids = np.empty(n, dtype=np.int64)
+    start = 0
+    band = 0
+    while start < n:
+        end = int(np.searchsorted(negated_scores, negated_scores[start] + 4.0, side="left"))
+        end = max(end, start + 1)
+        band_ids[start:end] = band
+        band += 1
+        start = end
+
+    # Mélange uniforme à l'intérieur de chaque bande
+    shuffled = order[np.argsort(band_ids + rng.random(n), kind="stable")]
+
+    # Mélange par chunks : seul le chunk à cheval sur la limite influence la sélection
+    chunk_size = max(5, n // 10)
+    chunk_keys = np.arange(n) // chunk_size + rng.random(n)
+    return shuffled[np.argpartition(chunk_keys, target_survivors - 1)[:target_survivors]]
+
+
+class VectorizedSimulationService:
+    """Simulation d'épreuve sur des tableaux NumPy (moteur 'vectorized')"""
+
+    @classmethod
+    def simulate_event(
+        cls,
+        players: List[Player],
+        event: GameEvent,
+        groups: Dict[str, Any] = None,
+        rng: random.Random = None,
+        roster: Optional[PlayerRoster] = None
+    ) -> EventResult:
+        """
+        Simule une épreuve avec le moteur vectorisé - même format de résultat que le moteur classique
+        Lit et met à jour les colonnes du roster ; seuls les joueurs de l'épreuve sont réécrits
+        """
+        if roster is None:
+            roster = PlayerRoster(players)
+        groups_dict = groups or {}
+        roster.refresh_groups(groups_dict)
+
+        alive_idx = roster.alive_indexes()
+        n = len(alive_idx)
+
+        if n == 0:
+            return EventResult(
+                event_id=event.id,
+                event_name=event.name,
+                survivors=[],
+                eliminated=[],
+                total_participants=0
+            )
+
+        # Dériver le générateur NumPy du générateur de la partie (ou du module random) pour rester reproductible
+        py_rng = rng or random
+        rng = np.random.default_rng(py_rng.getrandbits(64))
+
+        if event.is_final:
+            target_survivors = 1
+        else:
+            target_survivors = max(1, int(n * (1 - event.elimination_rate)))
+
+        # Colonnes des joueurs vivants
+        group_codes = roster.group_codes[alive_idx]
+        scores = compute_survival_scores(roster.stats[alive_idx], roster.role_codes[alive_idx], group_codes, event, rng)
+        survivor_idx = select_survivors(scores, target_survivors, rng)
+        eliminated_mask = np.ones(n, dtype=bool)
+        eliminated_mask[survivor_idx] = False
+        eliminated_idx = np.flatnonzero(eliminated_mask)
+        eliminated_idx = eliminated_idx[rng.permutation(len(eliminated_idx))]
+
+        # Tirages groupés pour les survivants
+        n_survivors = len(survivor_idx)
+        time_remaining = rng.integers(event.survival_time_min // 4, event.survival_time_max // 2 + 1, size=n_survivors)
+        survivor_groups = group_codes[survivor_idx]
+        group_allows_betrayals = np.array(
+            [bool(getattr(group, 'allow_betrayals', False)) for group in groups_dict.values()] + [False],
+            dtype=bool
+        )
+        betrayal_allowed = group_allows_betrayals[survivor_groups]  # -1 => dernière case (aucun groupe)
+        betrayed = betrayal_allowed & (rng.random(n_survivors) < 0.1)
+
+        # Tirages groupés pour les éliminés
+        n_eliminated = len(eliminated_idx)
+        elimination_times = rng.integers(10, event.survival_time_max // 2 + 1, size=n_eliminated)
+        if event.death_animations:
+            causes = [event.death_animations[i] for i in rng.integers(0, len(event.death_animations), size=n_eliminated)]
+        else:
+            causes = ["Élimination standard"] * n_eliminated
+
+        # Attribution groupée des éliminations (kills) aux survivants
+        event_kills = np.zeros(n_survivors, dtype=np.int64)
+        killers = []
+        if n_eliminated and n_survivors:
+            max_kills_per_event = 2 if event.type == EventType.FORCE else 1
+            allocator = KillAllocator(
+                [code if code >= 0 else None for code in survivor_groups.tolist()],
+                max_kills_per_event,
+                py_rng
+            )
+            killers = allocator.allocate(
+                [code if code >= 0 else None for code in group_codes[eliminated_idx].tolist()],
+                exclude_same_group=n > 4
+            )
+            event_kills = np.array(allocator.event_kills, dtype=np.int64)
+
+        # Mise à jour des colonnes du roster
+        survivor_rows = alive_idx[survivor_idx]
+        eliminated_rows = alive_idx[eliminated_idx]
+        event_scores = time_remaining + event_kills * 10 - betrayed * 5
+        roster.survived_events[survivor_rows] += 1
+        roster.betrayals[survivor_rows] += betrayed
+        if n_eliminated and n_survivors:
+            # Comme le moteur classique : kills et score total ne bougent que si l'épreuve a éliminé quelqu'un
+            roster.kills[survivor_rows] += event_kills
+            roster.total_score[survivor_rows] += event_scores
+        roster.alive[eliminated_rows] = False
+
+        # Réécriture des seuls joueurs de l'épreuve et construction du résultat
+        players = roster.players
+        for position, killer in enumerate(killers):
+            if killer >= 0:
+                players[survivor_rows[killer]].killed_players.append(players[eliminated_rows[position]].id)
+
+        survivors = []
+        for position, row in enumerate(survivor_rows.tolist()):
+            player = players[row]
+            player.survived_events = int(roster.survived_events[row])
+            player.betrayals = int(roster.betrayals[row])
+            player.kills = int(roster.kills[row])
+            player.total_score = int(roster.total_score[row])
+
+            survivors.append({
+                "player": player,
+                "number": player.number,
+                "name": player.name,
+                "time_remaining": int(time_remaining[position]),
+                "event_kills": int(event_kills[position]),
+                "betrayed": bool(betrayed[position]),
+                "score": int(event_scores[position]),
+                "kills": player.kills,
+                "total_score": player.total_score,
+                "survived_events": player.survived_events
+            })
+
+        eliminated = []
+        for position, row in enumerate(eliminated_rows.tolist()):
+            player = players[row]
+            player.alive = False
+            eliminated.append({
+                "player": player,
+                "number": player.number,
+                "name": player.name,
+                "elimination_time": int(elimination_times[position]),
+                "cause": causes[position],
+                "decor": event.decor,
+                "event_name": event.name
+            })
+
+        survivors.sort(key=lambda x: x["score"], reverse=True)
+
+        return EventResult(
+            event_id=event.id,
+            event_name=event.name,
+            survivors=survivors,
+            eliminated=eliminated,
+            total_participants=n
+        )
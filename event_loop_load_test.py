@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Load test : latence des endpoints sans rapport pendant la simulation de grandes parties
+Mesure le p50/p99 de GET /api/games/events/available au repos, puis pendant que
+plusieurs parties de 1000 joueurs sont créées et simulées en parallèle.
+La simulation étant exécutée hors de la boucle d'événements (ExecutorService),
+le p99 doit rester à peu près plat.
+"""
+
+import requests
+import statistics
+import threading
+import time
+import sys
+
+# Get backend URL from frontend .env file
+def get_backend_url():
+    try:
+        with open('/app/frontend/.env', 'r') as f:
+            for line in f:
+                if line.startswith('REACT_APP_BACKEND_URL='):
+                    return line.split('=', 1)[1].strip()
+    except FileNotFoundError:
+        return "http://localhost:8001"
+    return "http://localhost:8001"
+
+BACKEND_URL = get_backend_url()
+API_BASE = f"{BACKEND_URL}/api"
+
+PROBE_URL = f"{API_BASE}/games/events/available"
+GAME_COUNT = 4
+PLAYER_COUNT = 1000
+PROBE_DURATION = 10.0  # secondes par phase
+PROBE_INTERVAL = 0.05
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def probe_latencies(duration, stop_event=None):
+    """Interroge l'endpoint sonde en boucle et retourne les latences (ms)"""
+    latencies = []
+    deadline = time.time() + duration
+    while time.time() < deadline and not (stop_event and stop_event.is_set()):
+        start = time.perf_counter()
+        response = requests.get(PROBE_URL, timeout=30)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            print(f"⚠️ Sonde en erreur: HTTP {response.status_code}")
+        time.sleep(PROBE_INTERVAL)
+    return latencies
+
+
+def run_big_game(index, results):
+    """Crée une partie de PLAYER_COUNT joueurs et la simule entièrement"""
+    try:
+        # S'assurer que le joueur a assez d'argent pour la partie
+        requests.put(f"{API_BASE}/gamestate/", json={"money": 100000000}, timeout=30)
+        create = requests.post(f"{API_BASE}/games/create", json={
+            "player_count": PLAYER_COUNT,
+            "game_mode": "standard",
+            "selected_events": list(range(1, 11)),
+            "simulation_engine": "classic"
+        }, timeout=300)
+        if create.status_code != 200:
+            results[index] = f"création HTTP {create.status_code}"
+            return
+        game_id = create.json()["id"]
+        simulate = requests.post(f"{API_BASE}/games/{game_id}/simulate-all", timeout=600)
+        results[index] = "ok" if simulate.status_code == 200 else f"simulation HTTP {simulate.status_code}"
+    except Exception as e:
+        results[index] = f"erreur: {e}"
+
+
+def summarize(label, latencies):
+    if not latencies:
+        print(f"{label:<22} aucune mesure")
+        return None
+    p50 = statistics.median(latencies)
+    p99 = percentile(latencies, 99)
+    print(f"{label:<22} n={len(latencies):>4}  p50={p50:>8.1f} ms  p99={p99:>8.1f} ms  max={max(latencies):>8.1f} ms")
+    return p99
+
+
+def main():
+    print(f"🔍 Load test de la boucle d'événements sur {BACKEND_URL}")
+    print("=" * 70)
+
+    baseline = probe_latencies(PROBE_DURATION)
+    baseline_p99 = summarize("Au repos", baseline)
+
+    results = [None] * GAME_COUNT
+    workers = [threading.Thread(target=run_big_game, args=(i, results)) for i in range(GAME_COUNT)]
+    for worker in workers:
+        worker.start()
+
+    # Sonder tant que les parties tournent (au moins PROBE_DURATION)
+    loaded = []
+    while any(worker.is_alive() for worker in workers) or not loaded:
+        loaded.extend(probe_latencies(min(PROBE_DURATION, 2.0)))
+    for worker in workers:
+        worker.join()
+
+    loaded_p99 = summarize(f"{GAME_COUNT} parties x {PLAYER_COUNT}", loaded)
+    print(f"Parties: {results}")
+
+    if baseline_p99 is None or loaded_p99 is None:
+        sys.exit(1)
+
+    ratio = loaded_p99 / max(baseline_p99, 1e-6)
+    print(f"\n📊 p99 sous charge / p99 au repos: x{ratio:.1f}")
+    if ratio <= 5 or loaded_p99 < 100:
+        print("✅ PASS - la latence des endpoints sans rapport reste plate")
+    else:
+        print("❌ FAIL - la simulation bloque la boucle d'événements")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
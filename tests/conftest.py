@@ -0,0 +1,15 @@
+"""
+Configuration commune des tests : le code du serveur est importé depuis backend/
+(les modules s'importent entre eux en 'services.*', 'models.*', 'routes.*')
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Variables requises à l'import du serveur ; aucun accès réel à MongoDB ni au moteur d'images
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "test_database")
+os.environ.setdefault("PORTRAIT_IMAGE_BACKEND", "stub")
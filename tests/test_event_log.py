@@ -0,0 +1,88 @@
+"""Tests du journal compact des épreuves et de la route /event-results"""
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+from models.game_models import Game
+from routes.game_routes import games_db
+from routes.gamestate_routes import game_states_db
+from services.event_log_service import EventLogService
+from services.events_service import EventsService
+from services.game_service import GameService
+from services.player_roster import PlayerRoster
+
+client = TestClient(server.app)
+
+
+def _without_player(rows):
+    return [{key: value for key, value in row.items() if key != "player"} for row in rows]
+
+
+@pytest.mark.parametrize("engine", ["classic", "vectorized"])
+def test_rebuild_restores_compressed_results(engine):
+    rng = random.Random(42)
+    players = GameService.generate_players_bulk(80, rng=rng)
+    game = Game(players=players, events=EventsService.organize_events_for_game([1, 2, 3]), simulation_engine=engine)
+    roster = PlayerRoster.for_game(game)
+
+    for event in game.events:
+        result = GameService.simulate_event(game.players, event, {}, engine=engine, rng=rng, roster=roster)
+        assert result.eliminated, "l'épreuve doit éliminer des joueurs pour que le test ait un sens"
+        rebuilt = EventLogService.rebuild(game, EventLogService.record(game, result))
+
+        assert rebuilt.event_id == result.event_id
+        assert rebuilt.event_name == result.event_name
+        assert rebuilt.total_participants == result.total_participants
+        assert _without_player(rebuilt.survivors) == _without_player(result.survivors)
+        assert _without_player(rebuilt.eliminated) == _without_player(result.eliminated)
+        # "player" pointe vers le même joueur de la partie
+        assert [s["player"].id for s in rebuilt.survivors] == [s["player"].id for s in result.survivors]
+        assert [e["player"].id for e in rebuilt.eliminated] == [e["player"].id for e in result.eliminated]
+
+
+@pytest.fixture
+def played_game():
+    game_states_db.clear()
+    response = client.post(
+        "/api/games/create",
+        json={"player_count": 40, "game_mode": "standard", "selected_events": [1, 2, 3], "seed": 3}
+    )
+    assert response.status_code == 200, response.text
+    game_id = response.json()["id"]
+    assert client.post(f"/api/games/{game_id}/simulate-event").status_code == 200
+    assert client.post(f"/api/games/{game_id}/simulate-event").status_code == 200
+    yield game_id
+    games_db.pop(game_id, None)
+    game_states_db.clear()
+
+
+def test_event_results_returns_every_played_event(played_game):
+    response = client.get(f"/api/games/{played_game}/event-results")
+
+    assert response.status_code == 200
+    results = response.json()
+    assert len(results) == len(games_db[played_game].event_log) == 2
+    assert all(s["player"]["id"] for s in results[0]["survivors"])
+
+
+@pytest.mark.parametrize("event_index", [0, 1])
+def test_event_results_single_event(played_game, event_index):
+    response = client.get(f"/api/games/{played_game}/event-results", params={"event_index": event_index})
+
+    assert response.status_code == 200
+    results = response.json()
+    assert len(results) == 1
+    assert results[0]["event_id"] == games_db[played_game].event_log[event_index].event_id
+
+
+@pytest.mark.parametrize("event_index", [-1, 2, 100])
+def test_event_results_index_out_of_range(played_game, event_index):
+    response = client.get(f"/api/games/{played_game}/event-results", params={"event_index": event_index})
+
+    assert response.status_code == 404
+
+
+def test_event_results_unknown_game():
+    assert client.get("/api/games/inconnue/event-results").status_code == 404
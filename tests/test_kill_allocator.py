@@ -0,0 +1,83 @@
+"""Tests de KillAllocator.allocate : plafonds, exclusion de groupe et replis"""
+import random
+from collections import Counter
+
+from services.kill_allocator import KillAllocator
+
+
+def test_hard_cap_of_two_kills_per_survivor():
+    allocator = KillAllocator([None] * 3, max_kills_per_event=10, rng=random.Random(1))
+    assert allocator.max_kills_per_event == KillAllocator.HARD_KILL_CAP
+
+    killers = allocator.allocate([None] * 10)
+
+    # 3 survivants x 2 kills : 6 victimes attribuées, les autres restent sans tueur
+    assigned = [killer for killer in killers if killer >= 0]
+    assert len(assigned) == 6
+    assert killers[6:] == [-1] * 4
+    assert Counter(assigned) == {0: 2, 1: 2, 2: 2}
+    assert allocator.event_kills == [2, 2, 2]
+
+
+def test_per_event_cap_is_used_before_fallback():
+    allocator = KillAllocator([None] * 4, max_kills_per_event=1, rng=random.Random(2))
+
+    killers = allocator.allocate([None] * 4)
+
+    # Chaque survivant dispose d'un kill : les 4 victimes vont à 4 tueurs distincts
+    assert sorted(killers) == [0, 1, 2, 3]
+    assert allocator.event_kills == [1, 1, 1, 1]
+
+
+def test_victims_are_never_given_to_their_own_group():
+    groups = ["a", "a", "a", "b", "b", None]
+    rng = random.Random(3)
+    for _ in range(200):
+        allocator = KillAllocator(groups, max_kills_per_event=2, rng=rng)
+        killers = allocator.allocate(["a", "b", "a", "b"])
+        for victim_group, killer in zip(["a", "b", "a", "b"], killers):
+            assert killer >= 0
+            assert groups[killer] != victim_group
+
+
+def test_dominant_excluded_group_draws_from_other_groups():
+    # Le groupe exclu représente plus de la moitié du pool : tirage par rang dans les autres seaux
+    groups = ["a"] * 9 + ["b"]
+    allocator = KillAllocator(groups, max_kills_per_event=2, rng=random.Random(4))
+
+    assert allocator.allocate(["a", "a"]) == [9, 9]
+    # "b" est épuisé : le repli attribue la victime suivante à un survivant sans kill
+    killer = allocator.allocate(["a"])[0]
+    assert groups[killer] == "a"
+    assert allocator.event_kills[killer] == 1
+
+
+def test_exclusion_can_be_disabled():
+    allocator = KillAllocator(["a", "a"], max_kills_per_event=1, rng=random.Random(5))
+
+    killers = allocator.allocate(["a", "a"], exclude_same_group=False)
+
+    assert sorted(killers) == [0, 1]
+
+
+def test_fallback_prefers_survivors_with_fewest_kills():
+    allocator = KillAllocator(["a", "a", "a"], max_kills_per_event=1, rng=random.Random(6))
+
+    # Tous du même groupe que la victime : aucun disponible, repli sur les seaux par nombre de kills
+    first = allocator.allocate(["a", "a", "a"])
+    assert sorted(first) == [0, 1, 2]
+
+    # Tous ont 1 kill : le repli monte jusqu'au plafond absolu, puis plus personne
+    second = allocator.allocate(["a", "a", "a", "a"])
+    assert sorted(second[:3]) == [0, 1, 2]
+    assert second[3] == -1
+    assert allocator.event_kills == [2, 2, 2]
+
+
+def test_zero_capacity_only_uses_fallback():
+    allocator = KillAllocator([None, None], max_kills_per_event=0, rng=random.Random(7))
+
+    killers = allocator.allocate([None, None, None, None, None])
+
+    assert sorted(killers[:4]) == [0, 0, 1, 1]
+    assert killers[4] == -1
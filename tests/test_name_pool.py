@@ -0,0 +1,91 @@
+"""Tests des pools de noms : permutation paresseuse et attribution de noms uniques"""
+import random
+
+import pytest
+
+from services.name_pool import NamePool, UniqueNameAllocator, _PoolCursor
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cursor_visits_every_index_exactly_once(seed):
+    pool = NamePool.get("Français", "M")
+    cursor = _PoolCursor(pool)
+    rng = random.Random(seed)
+
+    indexes = [cursor.next_index(rng) for _ in range(pool.size)]
+
+    assert sorted(indexes) == list(range(pool.size))
+    assert cursor.next_index(rng) is None
+    # Les échanges en attente sont consommés au fil du parcours
+    assert cursor.swaps == {}
+
+
+def test_cursor_order_depends_on_the_generator():
+    pool = NamePool.get("Japonais", "F")
+    orders = []
+    for seed in (1, 2):
+        cursor = _PoolCursor(pool)
+        rng = random.Random(seed)
+        orders.append([cursor.next_index(rng) for _ in range(pool.size)])
+
+    assert orders[0] != orders[1]
+
+
+def test_allocate_uses_every_combination_without_collision():
+    pool = NamePool.get("Français", "F")
+    allocator = UniqueNameAllocator(rng=random.Random(3))
+
+    names = [allocator.allocate("Français", "F") for _ in range(pool.size)]
+
+    assert len(set(names)) == pool.size
+    assert set(names) == {pool.name_at(index) for index in range(pool.size)}
+    assert allocator.used_names == set(names)
+
+
+def test_allocate_skips_names_already_used():
+    pool = NamePool.get("Italien", "M")
+    taken = {pool.name_at(index) for index in range(0, pool.size, 2)}
+    used_names = set(taken)
+    allocator = UniqueNameAllocator(used_names, rng=random.Random(4))
+
+    names = [allocator.allocate("Italien", "M") for _ in range(pool.size - len(taken))]
+
+    # Proche de l'épuisement, seules les combinaisons encore libres sont servies
+    assert len(set(names)) == len(names)
+    assert not taken & set(names)
+    assert used_names == {pool.name_at(index) for index in range(pool.size)}
+
+
+def test_numeric_suffix_after_exhaustion():
+    pool = NamePool.get("Coréen", "M")
+    allocator = UniqueNameAllocator(rng=random.Random(5))
+    combinations = {allocator.allocate("Coréen", "M") for _ in range(pool.size)}
+
+    extra = [allocator.allocate("Coréen", "M") for _ in range(3 * pool.size)]
+
+    assert len(set(extra)) == len(extra)
+    assert not combinations & set(extra)
+    for name in extra:
+        base_name, _, suffix = name.rpartition(" ")
+        assert base_name in combinations
+        assert suffix.isdigit() and int(suffix) >= 1
+
+
+def test_numeric_suffix_skips_used_suffixes():
+    pool = NamePool.get("Grec", "F")
+    used_names = {pool.name_at(index) for index in range(pool.size)}
+    used_names |= {f"{pool.name_at(index)} 1" for index in range(pool.size)}
+    allocator = UniqueNameAllocator(used_names, rng=random.Random(6))
+
+    name = allocator.allocate("Grec", "F")
+
+    assert name.rsplit(" ", 1)[1] == "2"
+
+
+def test_unknown_nationality_falls_back_to_default_pool():
+    allocator = UniqueNameAllocator(rng=random.Random(7))
+    default_pool = NamePool.get("Français", "M")
+
+    name = allocator.allocate("Inconnue", "M")
+
+    assert name in {default_pool.name_at(index) for index in range(default_pool.size)}
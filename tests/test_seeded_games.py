@@ -0,0 +1,83 @@
+"""Tests de reproductibilité : une même graine rejoue la même partie, pour chaque moteur de simulation"""
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+from routes.gamestate_routes import game_states_db
+from services.player_pool_service import PlayerPoolService
+
+client = TestClient(server.app)
+
+
+@pytest.fixture(autouse=True)
+def fresh_game_state():
+    # Chaque partie créée débite le budget de l'utilisateur par défaut
+    game_states_db.clear()
+    yield
+    game_states_db.clear()
+
+
+def _create_game(**overrides):
+    payload = {"player_count": 60, "game_mode": "standard", "selected_events": [1, 2, 3, 4, 5]}
+    payload.update(overrides)
+    response = client.post("/api/games/create", json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _play(seed, engine):
+    """Crée et simule entièrement une partie, puis renvoie ce qui doit être identique d'une exécution à l'autre"""
+    game_id = _create_game(seed=seed, simulation_engine=engine)["id"]
+    response = client.post(f"/api/games/{game_id}/simulate-all")
+    assert response.status_code == 200, response.text
+
+    game = client.get(f"/api/games/{game_id}").json()
+    players = [
+        (p["number"], p["name"], p["nationality"], p["gender"], p["role"], p["stats"], p["portrait"]["face_shape"])
+        for p in game["players"]
+    ]
+    outcomes = [(p["number"], p["alive"], p["kills"], p["total_score"]) for p in game["players"]]
+    events = [
+        (
+            result["event_name"],
+            sorted((s["number"], s["event_kills"], s["score"]) for s in result["survivors"]),
+            sorted((e["number"], e["cause"], e["elimination_time"]) for e in result["eliminated"]),
+        )
+        for result in game["event_results"]
+    ]
+    winner = game["winner"]["number"] if game["winner"] else None
+    return players, outcomes, events, winner
+
+
+@pytest.mark.parametrize("engine", ["classic", "vectorized"])
+def test_same_seed_replays_the_same_game(engine):
+    first = _play(12345, engine)
+    second = _play(12345, engine)
+
+    players, outcomes, events, winner = first
+    assert len(players) == 60
+    assert any(eliminated for _, _, eliminated in events)
+    assert first == second
+
+
+@pytest.mark.parametrize("engine", ["classic", "vectorized"])
+def test_different_seeds_give_different_games(engine):
+    assert _play(1, engine) != _play(2, engine)
+
+
+def test_seeded_game_bypasses_player_pool(monkeypatch):
+    calls = []
+
+    def take(*args, **kwargs):
+        calls.append(args)
+        return []
+
+    monkeypatch.setattr(PlayerPoolService, "take", take)
+
+    game = _create_game(seed=7)
+    assert calls == []
+    assert len(game["players"]) == 60
+
+    # Sans graine, la réserve est consultée en premier
+    _create_game()
+    assert len(calls) == 1